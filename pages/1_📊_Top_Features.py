@@ -5,7 +5,7 @@ from pathlib import Path
 import sys
 sys.path.append('..')
 from utils.scale_info import get_scale_category, get_scale_info, SCALE_CATEGORIES
-from utils.feature_descriptions import get_feature_description_bilingual, get_feature_label
+from utils.feature_descriptions import get_feature_labels, get_feature_label
 
 # ============================================
 # PAGE CONFIG
@@ -169,7 +169,7 @@ else:
     display_df['Deutsche Bezeichnung'] = display_df['Feature'].apply(get_german_name)
 
     # Add bilingual description column
-    display_df['Beschreibung'] = display_df['Feature'].apply(get_feature_description_bilingual)
+    display_df['Beschreibung'] = get_feature_labels(display_df['Feature'], 'bilingual')
 
     # Spalten ordnen
     display_df = display_df[['Rank', 'Feature', 'Deutsche Bezeichnung', 'Beschreibung', 'Kategorie', 'Importance_%']]
@@ -408,10 +408,13 @@ if selected_scale:
 
                     # 4. Generate QR Code
                     qr_url = "file:///path/to/befragung.html"  # Placeholder
-                    qr_buffer = generate_qr_code_with_instructions(
+                    qr_image = generate_qr_code_with_instructions(
                         url=qr_url,
-                        scale_title=info.get('name_de', selected_scale)
+                        scale_title=info.get('name_de', selected_scale),
+                        as_pil=True
                     )
+                    qr_buffer = BytesIO()
+                    qr_image.save(qr_buffer, format='PNG')
 
                     # 5. Generate PDF Instructions
                     pdf_buffer = create_teacher_instructions(
@@ -420,7 +423,7 @@ if selected_scale:
                         scale_description=info.get('description_de', 'Keine Beschreibung verfügbar'),
                         num_items=len(items_found),
                         estimated_minutes=estimated_minutes,
-                        qr_code_buffer=qr_buffer
+                        qr_code_pil=qr_image
                     )
 
                     # 6. Create ZIP package
@@ -549,10 +552,10 @@ Generiert mit Pulse of Learning - PISA 2022 Explorer
             value_labels = load_value_labels(conn, variable)
             if len(value_labels) > 0:
                 export_text += "**Antwortoptionen:**\n\n"
-                for _, vl in value_labels.iterrows():
-                    if vl.get('is_missing_code') != 1:
-                        label = vl['label_de'] if pd.notna(vl.get('label_de')) else vl['label']
-                        export_text += f"- [ ] {vl['value']}: {label}\n"
+                for vl in value_labels.itertuples(index=False):
+                    if vl.is_missing_code != 1:
+                        label = vl.label_de if pd.notna(vl.label_de) else vl.label
+                        export_text += f"- [ ] {vl.value}: {label}\n"
 
             export_text += "\n---\n\n"
 
@@ -8,6 +8,7 @@ from utils.scale_info import get_scale_category, get_scale_info, SCALE_DESCRIPTI
 from utils.feature_descriptions import get_feature_label
 from utils.statistical_analysis import (
     compute_correlation_matrix, correlation_with_pvalue,
+    pairwise_correlation_with_pvalue,
     independent_ttest, one_way_anova, check_normality,
     get_effect_size_interpretation
 )
@@ -239,14 +240,17 @@ with tab1:
 
         # Extract correlations
         corr_list = []
+        values = df_clean[selected_vars].to_numpy(dtype=np.float64)
         for i in range(len(corr_matrix.columns)):
+            # p-values for all pairs (i, j > i) in one batch
+            _, p_values = pairwise_correlation_with_pvalue(
+                values[:, i+1:], values[:, i], method=corr_method
+            )
             for j in range(i+1, len(corr_matrix.columns)):
                 var1 = corr_matrix.columns[i]
                 var2 = corr_matrix.columns[j]
                 corr_value = corr_matrix.iloc[i, j]
-
-                # Calculate p-value
-                r, p = correlation_with_pvalue(df_clean[var1], df_clean[var2], method=corr_method)
+                p = p_values[j - i - 1]
 
                 corr_list.append({
                     'Variable 1': var1,
@@ -453,11 +457,19 @@ with tab3:
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric(
-            "Shapiro-Wilk Test",
-            f"W = {normality_results['shapiro_statistic']:.3f}",
-            delta=f"p = {normality_results['shapiro_pvalue']:.4f}"
-        )
+        if np.isnan(normality_results['shapiro_pvalue']):
+            # Shapiro-Wilk is skipped for large samples
+            st.metric(
+                "Anderson-Darling Test",
+                f"A² = {normality_results['anderson_statistic']:.3f}",
+                delta=f"n = {normality_results['n']}"
+            )
+        else:
+            st.metric(
+                "Shapiro-Wilk Test",
+                f"W = {normality_results['shapiro_statistic']:.3f}",
+                delta=f"p = {normality_results['shapiro_pvalue']:.4f}"
+            )
     with col2:
         st.metric(
             "KS Test",
@@ -804,12 +816,19 @@ with tab5:
             col1, col2 = st.columns(2)
 
             with col1:
-                st.markdown(f"""
-                **Shapiro-Wilk Test:**
-                - W = {results['shapiro_statistic']:.3f}
-                - p = {results['shapiro_pvalue']:.4f}
-                - Normalverteilt: **{'✅ Ja' if results['shapiro_pvalue'] > 0.05 else '❌ Nein'}**
-                """)
+                if np.isnan(results['shapiro_pvalue']):
+                    st.markdown(f"""
+                    **Anderson-Darling Test** (Shapiro-Wilk bei n > 5000 nicht zuverlässig):
+                    - A² = {results['anderson_statistic']:.3f}
+                    - n = {results['n']}
+                    """)
+                else:
+                    st.markdown(f"""
+                    **Shapiro-Wilk Test:**
+                    - W = {results['shapiro_statistic']:.3f}
+                    - p = {results['shapiro_pvalue']:.4f}
+                    - Normalverteilt: **{'✅ Ja' if results['shapiro_pvalue'] > 0.05 else '❌ Nein'}**
+                    """)
 
             with col2:
                 st.markdown(f"""
@@ -8,7 +8,7 @@ sys.path.append('..')
 
 from utils.db_loader import get_db_connection
 from utils.feature_selector import PISAFeatureSelector
-from utils.feature_descriptions import get_feature_description_bilingual
+from utils.feature_descriptions import get_feature_labels
 
 from sklearn.preprocessing import StandardScaler
 from xgboost import XGBRegressor
@@ -549,7 +549,7 @@ with tabs[2]:
             # Add descriptions
             display_df = top_15.copy()
             display_df['Rank'] = range(1, len(display_df) + 1)
-            display_df['Description'] = display_df['Feature'].apply(get_feature_description_bilingual)
+            display_df['Description'] = get_feature_labels(display_df['Feature'], 'bilingual')
             display_df = display_df[['Rank', 'Feature', 'Description', 'Mean_Abs_SHAP', 'Importance_%']]
 
             st.dataframe(display_df, use_container_width=True, hide_index=True)
@@ -626,7 +626,7 @@ with tabs[2]:
                 # Table with descriptions
                 display_df = top_15.copy()
                 display_df['Rank'] = range(1, len(display_df) + 1)
-                display_df['Description'] = display_df['Feature'].apply(get_feature_description_bilingual)
+                display_df['Description'] = get_feature_labels(display_df['Feature'], 'bilingual')
                 display_df = display_df[['Rank', 'Feature', 'Description', 'Mean_Abs_SHAP', 'Importance_%']]
                 display_df['Mean_Abs_SHAP'] = display_df['Mean_Abs_SHAP'].round(4)
                 display_df['Importance_%'] = display_df['Importance_%'].round(2)
@@ -5,7 +5,7 @@ import sys
 sys.path.append('..')
 from utils.db_loader import get_db_connection
 from utils.scale_info import get_scale_info, SCALE_DESCRIPTIONS
-from utils.statistical_analysis import correlation_with_pvalue
+from utils.statistical_analysis import pairwise_correlation_with_pvalue
 from pathlib import Path
 from io import BytesIO
 
@@ -205,12 +205,12 @@ if len(selected_vars) >= 2:
     # Calculate correlations
     corr_data = []
 
-    for var in selected_vars:
-        # Remove NaN
-        clean_df = df[[var, 'performance']].dropna()
+    # All variables against performance in one batch (pairwise NaN removal)
+    corrs, p_vals = pairwise_correlation_with_pvalue(df[selected_vars], df['performance'])
+    n_valid = df[selected_vars].notna().mul(df['performance'].notna(), axis=0).sum()
 
-        if len(clean_df) >= 3:
-            corr, p_val = correlation_with_pvalue(clean_df[var], clean_df['performance'])
+    for var, corr, p_val in zip(selected_vars, corrs, p_vals):
+        if n_valid[var] >= 3:
             r2 = corr ** 2
 
             # Effect size classification (Cohen 1988)
@@ -1766,9 +1766,9 @@ def main():
                     value_labels = load_value_labels(conn, var_name)
                     if len(value_labels) > 0:
                         st.markdown("**Antwortoptionen:**")
-                        for _, vl in value_labels.iterrows():
-                            label = vl['label_de'] if pd.notna(vl.get('label_de')) else vl['label']
-                            st.text(f"  {vl['value']} = {label}")
+                        for vl in value_labels.itertuples(index=False):
+                            label = vl.label_de if pd.notna(vl.label_de) else vl.label
+                            st.text(f"  {vl.value} = {label}")
         
         st.markdown("**📋 Alle Math-Confidence Variablen:**")
         st.dataframe(pisa_candidates, use_container_width=True)
@@ -1819,9 +1819,9 @@ def main():
                     value_labels = load_value_labels(conn, selected_pisa)
                     if len(value_labels) > 0:
                         st.markdown("**Antwortoptionen:**")
-                        for _, vl in value_labels.iterrows():
-                            label = vl['label_de'] if pd.notna(vl.get('label_de')) else vl['label']
-                            st.text(f"  {vl['value']} = {label}")
+                        for vl in value_labels.itertuples(index=False):
+                            label = vl.label_de if pd.notna(vl.label_de) else vl.label
+                            st.text(f"  {vl.value} = {label}")
                     
                     # Füge zu Mapping hinzu
                     mapping_data.append({
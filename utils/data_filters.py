@@ -11,14 +11,49 @@ Provides functions for:
 
 import numpy as np
 import pandas as pd
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, NamedTuple
 import streamlit as st
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; NumPy fallback below
+    njit = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; plain NumPy comparisons below
+    ne = None
+
+# Below this size numexpr's setup cost outweighs the fused evaluation
+_NUMEXPR_MIN_ELEMENTS = 10_000
+
 
 # ============================================
 # GENDER FILTERS
 # ============================================
 
+_GENDER_CODES = {
+    'Weiblich': 1,
+    'Männlich': 2,
+    'Divers': 3
+}
+
+
+def _gender_mask(
+    df: pd.DataFrame,
+    gender_filter: str = 'Alle',
+    gender_col: str = 'ST004D01T'
+) -> Optional[np.ndarray]:
+    """Boolean row mask for filter_by_gender (None = keep all rows)"""
+    if gender_filter == 'Alle' or gender_col not in df.columns:
+        return None
+
+    if gender_filter not in _GENDER_CODES:
+        return None
+
+    return (df[gender_col] == _GENDER_CODES[gender_filter]).to_numpy()
+
+
 def filter_by_gender(
     df: pd.DataFrame,
     gender_filter: str = 'Alle',
@@ -35,19 +70,11 @@ def filter_by_gender(
     Returns:
         Filtered DataFrame
     """
-    if gender_filter == 'Alle' or gender_col not in df.columns:
+    mask = _gender_mask(df, gender_filter, gender_col)
+    if mask is None:
         return df
 
-    gender_mapping = {
-        'Weiblich': 1,
-        'Männlich': 2,
-        'Divers': 3
-    }
-
-    if gender_filter in gender_mapping:
-        return df[df[gender_col] == gender_mapping[gender_filter]].copy()
-
-    return df
+    return df[mask].copy()
 
 
 # ============================================
@@ -84,6 +111,28 @@ def filter_by_performance_quantile(
     ].copy()
 
 
+def _performance_level_mask(
+    df: pd.DataFrame,
+    performance_var: str = 'PV1MATH',
+    level: str = 'Alle'
+) -> Optional[np.ndarray]:
+    """Boolean row mask for filter_by_performance_level (None = keep all rows)"""
+    if level == 'Alle' or performance_var not in df.columns:
+        return None
+
+    # NaN compares False, so missing scores drop out of every level
+    values = df[performance_var].to_numpy(dtype=float)
+
+    if level == 'Niedrig':  # Below proficient
+        return values < 482
+    elif level == 'Mittel':  # Proficient
+        return (values >= 482) & (values < 607)
+    elif level == 'Hoch':  # Advanced/Expert
+        return values >= 607
+
+    return ~np.isnan(values)
+
+
 def filter_by_performance_level(
     df: pd.DataFrame,
     performance_var: str = 'PV1MATH',
@@ -107,22 +156,11 @@ def filter_by_performance_level(
     Returns:
         Filtered DataFrame
     """
-    if level == 'Alle' or performance_var not in df.columns:
+    mask = _performance_level_mask(df, performance_var, level)
+    if mask is None:
         return df
 
-    clean_df = df[df[performance_var].notna()].copy()
-
-    if level == 'Niedrig':  # Below proficient
-        return clean_df[clean_df[performance_var] < 482].copy()
-    elif level == 'Mittel':  # Proficient
-        return clean_df[
-            (clean_df[performance_var] >= 482) &
-            (clean_df[performance_var] < 607)
-        ].copy()
-    elif level == 'Hoch':  # Advanced/Expert
-        return clean_df[clean_df[performance_var] >= 607].copy()
-
-    return clean_df
+    return df[mask].copy()
 
 
 # ============================================
@@ -148,7 +186,8 @@ def filter_by_missing_threshold(
     if not variables:
         return df
 
-    available_vars = [v for v in variables if v in df.columns]
+    columns = frozenset(df.columns)
+    available_vars = [v for v in variables if v in columns]
     if not available_vars:
         return df
 
@@ -158,6 +197,19 @@ def filter_by_missing_threshold(
     return df[missing_pct <= max_missing_pct].copy()
 
 
+def _complete_cases_mask(
+    df: pd.DataFrame,
+    variables: List[str]
+) -> Optional[np.ndarray]:
+    """Boolean row mask for get_complete_cases (None = keep all rows)"""
+    columns = frozenset(df.columns)
+    available_vars = [v for v in variables if v in columns]
+    if not available_vars:
+        return None
+
+    return df[available_vars].notna().all(axis=1).to_numpy()
+
+
 def get_complete_cases(
     df: pd.DataFrame,
     variables: List[str]
@@ -172,11 +224,11 @@ def get_complete_cases(
     Returns:
         DataFrame with complete cases only
     """
-    available_vars = [v for v in variables if v in df.columns]
-    if not available_vars:
+    mask = _complete_cases_mask(df, variables)
+    if mask is None:
         return df
 
-    return df.dropna(subset=available_vars).copy()
+    return df[mask].copy()
 
 
 def impute_missing_values(
@@ -195,10 +247,11 @@ def impute_missing_values(
     Returns:
         DataFrame with imputed values
     """
+    columns = frozenset(df.columns)
     df_imputed = df.copy()
 
     for var in variables:
-        if var not in df.columns:
+        if var not in columns:
             continue
 
         if df_imputed[var].isna().sum() == 0:
@@ -279,6 +332,31 @@ def select_wle_scales(df: pd.DataFrame) -> List[str]:
 # OUTLIER DETECTION
 # ============================================
 
+def _as_f32(series: pd.Series) -> np.ndarray:
+    """
+    Series values as a float32 array (NaN for missing)
+
+    PISA scale scores and plausible values are bounded, so float32 is precise
+    enough for outlier bounds and halves the memory traffic of the reductions.
+    """
+    return series.to_numpy(dtype=np.float32, na_value=np.nan)
+
+
+# Minimum number of valid values before the IQR rule is applied
+_IQR_MIN_VALUES = 20
+
+
+def _outside_bounds(values: np.ndarray, lower: float, upper: float) -> np.ndarray:
+    """Boolean mask of values < lower or > upper (NaN -> False)"""
+    if ne is not None and values.size >= _NUMEXPR_MIN_ELEMENTS:
+        # One fused, multi-threaded pass without intermediate boolean arrays
+        return ne.evaluate(
+            '(values < lower) | (values > upper)',
+            local_dict={'values': values, 'lower': lower, 'upper': upper}
+        )
+    return (values < lower) | (values > upper)
+
+
 def detect_outliers_iqr(
     series: pd.Series,
     multiplier: float = 1.5
@@ -291,16 +369,27 @@ def detect_outliers_iqr(
         multiplier: IQR multiplier (default: 1.5)
 
     Returns:
-        Boolean Series indicating outliers
+        Boolean Series indicating outliers (never any for columns with fewer
+        than 20 valid values or at most two distinct values)
     """
-    Q1 = series.quantile(0.25)
-    Q3 = series.quantile(0.75)
+    values = _as_f32(series)
+
+    # Fast path: the IQR rule is meaningless for tiny, constant or binary columns
+    valid = values[~np.isnan(values)]
+    if valid.size < _IQR_MIN_VALUES:
+        return pd.Series(False, index=series.index, name=series.name)
+    lo, hi = valid.min(), valid.max()
+    if lo == hi or np.all((valid == lo) | (valid == hi)):
+        return pd.Series(False, index=series.index, name=series.name)
+
+    Q1, Q3 = np.nanquantile(values, [0.25, 0.75])
     IQR = Q3 - Q1
 
     lower_bound = Q1 - multiplier * IQR
     upper_bound = Q3 + multiplier * IQR
 
-    return (series < lower_bound) | (series > upper_bound)
+    mask = _outside_bounds(values, lower_bound, upper_bound)
+    return pd.Series(mask, index=series.index, name=series.name)
 
 
 def detect_outliers_zscore(
@@ -317,8 +406,86 @@ def detect_outliers_zscore(
     Returns:
         Boolean Series indicating outliers
     """
-    z_scores = np.abs((series - series.mean()) / series.std())
-    return z_scores > threshold
+    values = _as_f32(series)
+    # float64 accumulators keep the statistics exact enough for display
+    mean = np.nanmean(values, dtype=np.float64)
+    std = np.nanstd(values, ddof=1, dtype=np.float64)  # sample SD as Series.std()
+
+    # |x - mean| / std > threshold  <=>  x outside mean ± threshold * std
+    margin = threshold * std
+    mask = _outside_bounds(values, mean - margin, mean + margin)
+    return pd.Series(mask, index=series.index, name=series.name)
+
+
+def _iqr_outlier_matrix_numpy(X: np.ndarray, multiplier: float) -> np.ndarray:
+    """(N, V) outlier flags for every column of X using the IQR rule"""
+    Q1, Q3 = np.nanquantile(X, [0.25, 0.75], axis=0)
+    IQR = Q3 - Q1
+    outliers = (X < Q1 - multiplier * IQR) | (X > Q3 + multiplier * IQR)
+
+    # Same fast path as detect_outliers_iqr: skip tiny, constant and binary columns
+    is_nan = np.isnan(X)
+    col_min = np.nanmin(X, axis=0)
+    col_max = np.nanmax(X, axis=0)
+    at_most_two_values = np.all((X == col_min) | (X == col_max) | is_nan, axis=0)
+    trivial = ((~is_nan).sum(axis=0) < _IQR_MIN_VALUES) | at_most_two_values
+    outliers[:, trivial] = False
+    return outliers
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _iqr_outlier_matrix_numba(X, multiplier, min_values):
+        n_rows, n_cols = X.shape
+        outliers = np.zeros((n_rows, n_cols), dtype=np.bool_)
+        for j in prange(n_cols):
+            col = X[:, j]
+
+            # Fast path: skip tiny, constant and binary columns
+            n_valid = 0
+            lo = np.inf
+            hi = -np.inf
+            for i in range(n_rows):
+                value = col[i]
+                if not np.isnan(value):
+                    n_valid += 1
+                    lo = min(lo, value)
+                    hi = max(hi, value)
+            if n_valid < min_values:
+                continue
+            two_valued = True
+            for i in range(n_rows):
+                value = col[i]
+                if not (np.isnan(value) or value == lo or value == hi):
+                    two_valued = False
+                    break
+            if two_valued:
+                continue
+
+            q1 = np.nanquantile(col, 0.25)
+            q3 = np.nanquantile(col, 0.75)
+            iqr = q3 - q1
+            lower = q1 - multiplier * iqr
+            upper = q3 + multiplier * iqr
+            for i in range(n_rows):
+                value = col[i]
+                outliers[i, j] = value < lower or value > upper
+        return outliers
+
+
+def _iqr_outlier_matrix(X: np.ndarray, multiplier: float) -> np.ndarray:
+    """Dispatch to the numba kernel when available"""
+    if njit is not None:
+        return _iqr_outlier_matrix_numba(X, multiplier, _IQR_MIN_VALUES)
+    return _iqr_outlier_matrix_numpy(X, multiplier)
+
+
+def _zscore_outlier_matrix(X: np.ndarray, threshold: float) -> np.ndarray:
+    """(N, V) outlier flags for every column of X using the Z-score rule"""
+    mean = np.nanmean(X, axis=0, dtype=np.float64)
+    std = np.nanstd(X, axis=0, ddof=1, dtype=np.float64)
+    margin = threshold * std
+    return (X < mean - margin) | (X > mean + margin)
 
 
 def remove_outliers(
@@ -333,6 +500,9 @@ def remove_outliers(
     Note: PISA research standard is to NOT remove outliers.
     Use this only if explicitly required.
 
+    Outlier bounds are computed on the full input for every variable;
+    rows flagged by any variable are dropped in one step at the end.
+
     Args:
         df: Input DataFrame
         variables: Variables to check for outliers
@@ -342,30 +512,42 @@ def remove_outliers(
     Returns:
         (Filtered DataFrame, Dict with outlier counts per variable)
     """
-    df_clean = df.copy()
-    outlier_counts = {}
+    columns = frozenset(df.columns)
+    present = [v for v in dict.fromkeys(variables) if v in columns]
 
-    for var in variables:
-        if var not in df.columns:
-            continue
+    if method not in ('iqr', 'zscore') or not present:
+        return df.copy(), {}
 
-        if method == 'iqr':
-            outliers = detect_outliers_iqr(df_clean[var], **kwargs)
-        elif method == 'zscore':
-            outliers = detect_outliers_zscore(df_clean[var], **kwargs)
-        else:
-            continue
+    # All columns at once; column-major so each column is contiguous
+    X = np.asfortranarray(df[present].to_numpy(dtype=np.float32, na_value=np.nan))
 
-        outlier_counts[var] = outliers.sum()
-        df_clean = df_clean[~outliers].copy()
+    if method == 'iqr':
+        outliers = _iqr_outlier_matrix(X, np.float32(kwargs.get('multiplier', 1.5)))
+    else:
+        outliers = _zscore_outlier_matrix(X, kwargs.get('threshold', 3.0))
+
+    outlier_counts = dict(zip(present, outliers.sum(axis=0).tolist()))
 
-    return df_clean, outlier_counts
+    # Single fancy-index at the end instead of one copy per variable
+    return df.loc[~outliers.any(axis=1)].copy(), outlier_counts
 
 
 # ============================================
 # DATA VALIDATION
 # ============================================
 
+class VariableQuality(NamedTuple):
+    """Validation result for a single variable (see validate_data_quality)"""
+    exists: bool
+    quality: str  # 'Good', 'Fair', 'Poor' or 'Missing'
+    n_valid: int = 0
+    n_missing: int = 0
+    missing_pct: float = 100.0
+
+
+_VARIABLE_NOT_FOUND = VariableQuality(exists=False, quality='Missing')
+
+
 def validate_data_quality(
     df: pd.DataFrame,
     variables: List[str]
@@ -378,49 +560,45 @@ def validate_data_quality(
         variables: Variables to validate
 
     Returns:
-        Dictionary with validation results
+        Dictionary with 'n_rows', 'overall_quality' and 'variables'
+        (variable name -> VariableQuality)
     """
+    n_total = len(df)
     results = {
-        'n_rows': len(df),
+        'n_rows': n_total,
         'variables': {},
         'overall_quality': 'Good'
     }
 
-    for var in variables:
-        if var not in df.columns:
-            results['variables'][var] = {
-                'exists': False,
-                'quality': 'Missing'
-            }
-            continue
+    columns = frozenset(df.columns)
+    present = [v for v in variables if v in columns]
 
-        var_data = df[var]
-        n_total = len(var_data)
-        n_missing = var_data.isna().sum()
-        n_valid = n_total - n_missing
-        missing_pct = (n_missing / n_total * 100) if n_total > 0 else 100
-
-        # Quality assessment
-        if missing_pct > 50:
-            quality = 'Poor'
-        elif missing_pct > 20:
-            quality = 'Fair'
-        else:
-            quality = 'Good'
-
-        results['variables'][var] = {
-            'exists': True,
-            'n_valid': n_valid,
-            'n_missing': n_missing,
-            'missing_pct': missing_pct,
-            'quality': quality
-        }
-
-        # Update overall quality
-        if quality == 'Poor':
-            results['overall_quality'] = 'Poor'
-        elif quality == 'Fair' and results['overall_quality'] != 'Poor':
-            results['overall_quality'] = 'Fair'
+    # One vectorized reduction over all present columns
+    n_missing = df[present].isna().sum(axis=0).to_numpy()
+    if n_total > 0:
+        missing_pct = n_missing * (100.0 / n_total)
+    else:
+        missing_pct = np.full(len(present), 100.0)
+
+    # Quality assessment (0 = Good, 1 = Fair, 2 = Poor)
+    quality_codes = np.select([missing_pct > 50, missing_pct > 20], [2, 1], default=0)
+    quality_names = ('Good', 'Fair', 'Poor')
+    found = {
+        var: VariableQuality(
+            exists=True,
+            quality=quality_names[code],
+            n_valid=n_total - int(n_miss),
+            n_missing=int(n_miss),
+            missing_pct=float(pct)
+        )
+        for var, n_miss, pct, code in zip(present, n_missing, missing_pct, quality_codes)
+    }
+    results['variables'] = {
+        var: found.get(var, _VARIABLE_NOT_FOUND) for var in variables
+    }
+
+    if len(quality_codes) > 0:
+        results['overall_quality'] = quality_names[int(quality_codes.max())]
 
     return results
 
@@ -429,6 +607,13 @@ def validate_data_quality(
 # GROUPING FUNCTIONS
 # ============================================
 
+_PERFORMANCE_GROUP_LABELS = {
+    3: ('Niedrig', 'Mittel', 'Hoch'),
+    4: ('Sehr Niedrig', 'Niedrig', 'Mittel', 'Hoch'),
+    5: ('Sehr Niedrig', 'Niedrig', 'Mittel', 'Hoch', 'Sehr Hoch'),
+}
+
+
 def create_performance_groups(
     df: pd.DataFrame,
     performance_var: str = 'PV1MATH',
@@ -451,20 +636,27 @@ def create_performance_groups(
         return pd.Series(index=df.index, dtype='category')
 
     if labels is None:
-        if n_groups == 3:
-            labels = ['Niedrig', 'Mittel', 'Hoch']
-        elif n_groups == 4:
-            labels = ['Sehr Niedrig', 'Niedrig', 'Mittel', 'Hoch']
-        elif n_groups == 5:
-            labels = ['Sehr Niedrig', 'Niedrig', 'Mittel', 'Hoch', 'Sehr Hoch']
-        else:
-            labels = [f'Gruppe {i+1}' for i in range(n_groups)]
+        labels = _PERFORMANCE_GROUP_LABELS.get(n_groups) or [
+            f'Gruppe {i+1}' for i in range(n_groups)
+        ]
+
+    values = df[performance_var].to_numpy(dtype=float)
+    is_nan = np.isnan(values)
+    if is_nan.all():
+        return pd.Series(index=df.index, dtype='category')
 
-    return pd.qcut(
-        df[performance_var],
-        q=n_groups,
-        labels=labels,
-        duplicates='drop'
+    # Quantile edges (duplicates dropped like pd.qcut(duplicates='drop'))
+    edges = np.unique(np.nanquantile(values, np.linspace(0, 1, n_groups + 1)))
+
+    # Right-closed bins as in pd.qcut: a value equal to an edge falls into the lower bin
+    codes = np.digitize(values, edges[1:-1], right=True).astype(np.int8)
+    codes[is_nan] = -1  # digitize sorts NaN into the last bin
+
+    categories = list(labels[:max(len(edges) - 1, 1)])
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories, ordered=True),
+        index=df.index,
+        name=performance_var
     )
 
 
@@ -486,18 +678,24 @@ def create_binary_groups(
         below_label: Label for values below threshold
 
     Returns:
-        Series with binary labels
+        Series with binary labels (missing values stay NaN)
     """
     if variable not in df.columns:
         return pd.Series(index=df.index, dtype='category')
 
+    values = df[variable].to_numpy(dtype=float)
+    is_nan = np.isnan(values)
+
     if threshold is None:
-        threshold = df[variable].median()
+        threshold = np.nanmedian(values) if not is_nan.all() else np.nan
+
+    # Integer codes: 0 = below, 1 = above, -1 = missing
+    codes = (values >= threshold).astype(np.int8)
+    codes[is_nan] = -1
 
     return pd.Series(
-        np.where(df[variable] >= threshold, above_label, below_label),
-        index=df.index,
-        dtype='category'
+        pd.Categorical.from_codes(codes, categories=[below_label, above_label]),
+        index=df.index
     )
 
 
@@ -505,6 +703,10 @@ def create_binary_groups(
 # EXPORT PREPARATION
 # ============================================
 
+_EXPORT_PERFORMANCE_VARS = ('PV1MATH', 'PV1READ', 'PV1SCIE')
+_EXPORT_DEMOGRAPHIC_VARS = ('ST004D01T', 'ESCS', 'HOMEPOS')
+
+
 def prepare_export_data(
     df: pd.DataFrame,
     variables: List[str],
@@ -523,23 +725,23 @@ def prepare_export_data(
     Returns:
         Cleaned DataFrame ready for export
     """
-    export_vars = list(variables)
-
+    groups = [variables]
     if include_performance:
-        perf_vars = ['PV1MATH', 'PV1READ', 'PV1SCIE']
-        export_vars.extend([v for v in perf_vars if v in df.columns])
-
+        groups.append(_EXPORT_PERFORMANCE_VARS)
     if include_demographics:
-        demo_vars = ['ST004D01T', 'ESCS', 'HOMEPOS']
-        export_vars.extend([v for v in demo_vars if v in df.columns])
+        groups.append(_EXPORT_DEMOGRAPHIC_VARS)
+
+    # Ordered, de-duplicated and restricted to available columns in one pass
+    available = frozenset(df.columns)
+    export_vars = list(dict.fromkeys(
+        v for group in groups for v in group if v in available
+    ))
 
-    # Remove duplicates
-    export_vars = list(dict.fromkeys(export_vars))
+    # Column selection already yields a new frame; callers only read it
+    return df[export_vars]
 
-    # Filter to available variables
-    export_vars = [v for v in export_vars if v in df.columns]
 
-    return df[export_vars].copy()
+_SUMMARY_STAT_NAMES = ('N', 'Mean', 'SD', 'Median', 'Min', 'Max')
 
 
 def create_summary_statistics(
@@ -559,23 +761,24 @@ def create_summary_statistics(
         DataFrame with summary statistics
     """
     if group_by and group_by in df.columns:
-        summary = df.groupby(group_by)[variables].agg([
-            ('N', 'count'),
-            ('Mean', 'mean'),
-            ('SD', 'std'),
-            ('Median', 'median'),
-            ('Min', 'min'),
-            ('Max', 'max')
-        ]).round(2)
+        grouped = df.groupby(group_by)[variables]
+        summary = pd.concat({
+            'N': grouped.count(),
+            'Mean': grouped.mean(),
+            'SD': grouped.std(),
+            'Median': grouped.median(),
+            'Min': grouped.min(),
+            'Max': grouped.max()
+        }, axis=1)
+        # Same (variable, statistic) column layout as before
+        summary = summary.swaplevel(axis=1)[
+            pd.MultiIndex.from_product([variables, _SUMMARY_STAT_NAMES])
+        ].round(2)
     else:
-        summary = df[variables].agg([
-            ('N', 'count'),
-            ('Mean', 'mean'),
-            ('SD', 'std'),
-            ('Median', 'median'),
-            ('Min', 'min'),
-            ('Max', 'max')
-        ]).T.round(2)
+        summary = df[variables].agg(
+            ['count', 'mean', 'std', 'median', 'min', 'max']
+        ).T.round(2)
+        summary.columns = list(_SUMMARY_STAT_NAMES)
 
     return summary
 
@@ -584,6 +787,10 @@ def create_summary_statistics(
 # STREAMLIT UI HELPERS
 # ============================================
 
+_GENDER_OPTIONS = ('Alle', 'Weiblich', 'Männlich', 'Divers')
+_PERFORMANCE_LEVEL_OPTIONS = ('Alle', 'Niedrig', 'Mittel', 'Hoch')
+_MISSING_STRATEGY_OPTIONS = ('Nur vollständige Fälle', 'Median-Imputation', 'Alle Fälle')
+
 def create_filter_ui(df: pd.DataFrame) -> Dict[str, Any]:
     """
     Create Streamlit sidebar UI for data filtering
@@ -601,21 +808,21 @@ def create_filter_ui(df: pd.DataFrame) -> Dict[str, Any]:
     # Gender filter
     filters['gender'] = st.sidebar.selectbox(
         "Geschlecht:",
-        options=['Alle', 'Weiblich', 'Männlich', 'Divers'],
+        options=_GENDER_OPTIONS,
         index=0
     )
 
     # Performance filter
     filters['performance_level'] = st.sidebar.selectbox(
         "Leistungsniveau:",
-        options=['Alle', 'Niedrig', 'Mittel', 'Hoch'],
+        options=_PERFORMANCE_LEVEL_OPTIONS,
         index=0
     )
 
     # Missing data handling
     filters['missing_strategy'] = st.sidebar.selectbox(
         "Fehlende Werte:",
-        options=['Nur vollständige Fälle', 'Median-Imputation', 'Alle Fälle'],
+        options=_MISSING_STRATEGY_OPTIONS,
         index=0
     )
 
@@ -629,6 +836,7 @@ def create_filter_ui(df: pd.DataFrame) -> Dict[str, Any]:
     return filters
 
 
+@st.cache_data(show_spinner=False)
 def apply_filters(
     df: pd.DataFrame,
     filters: Dict[str, Any],
@@ -647,22 +855,22 @@ def apply_filters(
     Returns:
         Filtered DataFrame
     """
-    df_filtered = df.copy()
-
-    # Apply gender filter
-    df_filtered = filter_by_gender(df_filtered, filters['gender'])
+    masks = [
+        _gender_mask(df, filters['gender']),
+        _performance_level_mask(df, performance_var, filters['performance_level'])
+    ]
+    if filters['missing_strategy'] == 'Nur vollständige Fälle':
+        masks.append(_complete_cases_mask(df, variables))
 
-    # Apply performance filter
-    df_filtered = filter_by_performance_level(
-        df_filtered,
-        performance_var,
-        filters['performance_level']
-    )
+    # Combine all row filters and index the DataFrame exactly once
+    keep = np.ones(len(df), dtype=bool)
+    for mask in masks:
+        if mask is not None:
+            keep &= mask
+    df_filtered = df.loc[keep]
 
-    # Handle missing values
-    if filters['missing_strategy'] == 'Nur vollständige Fälle':
-        df_filtered = get_complete_cases(df_filtered, variables)
-    elif filters['missing_strategy'] == 'Median-Imputation':
+    # Transformations that depend on the filtered rows
+    if filters['missing_strategy'] == 'Median-Imputation':
         df_filtered = impute_missing_values(df_filtered, variables, strategy='median')
 
     # Remove outliers (if requested)
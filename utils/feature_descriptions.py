@@ -7,6 +7,10 @@ Descriptions are extracted from pisa_scales_documentation.json
 Source: data/skalen_infos/pisa_scales_documentation.json
 """
 
+from functools import lru_cache
+
+import numpy as np
+
 # Feature descriptions: {CODE: (English Description, German Description)}
 FEATURE_DESCRIPTIONS = {
     # Mathematics-related scales
@@ -76,6 +80,29 @@ FEATURE_DESCRIPTIONS = {
     'SCHSUST': ('School support for sustained learning', 'Schulische Unterstützung für nachhaltiges Lernen'),
 }
 
+# Precomputed display strings, keyed by (language, include_code)
+_LABELS = {
+    ('en', False): {code: desc[0] for code, desc in FEATURE_DESCRIPTIONS.items()},
+    ('en', True): {code: f"{code} - {desc[0]}" for code, desc in FEATURE_DESCRIPTIONS.items()},
+    ('de', False): {code: desc[1] for code, desc in FEATURE_DESCRIPTIONS.items()},
+    ('de', True): {code: f"{code} - {desc[1]}" for code, desc in FEATURE_DESCRIPTIONS.items()},
+}
+
+_BILINGUAL = {code: f"{desc[0]} ({desc[1]})" for code, desc in FEATURE_DESCRIPTIONS.items()}
+
+# Int-indexed view of FEATURE_DESCRIPTIONS for vectorized lookups
+FEATURE_CODES = tuple(FEATURE_DESCRIPTIONS)
+FEATURE_CODE_TO_INDEX = {code: i for i, code in enumerate(FEATURE_CODES)}
+
+_CODES_ARRAY = np.array(FEATURE_CODES)
+_SORT_ORDER = np.argsort(_CODES_ARRAY)
+_SORTED_CODES = _CODES_ARRAY[_SORT_ORDER]
+_TEXT_ARRAYS = {
+    'en': np.array([desc[0] for desc in FEATURE_DESCRIPTIONS.values()], dtype=object),
+    'de': np.array([desc[1] for desc in FEATURE_DESCRIPTIONS.values()], dtype=object),
+    'bilingual': np.array([_BILINGUAL[code] for code in FEATURE_CODES], dtype=object),
+}
+
 
 def get_feature_label(feature_code, language='en', include_code=True):
     """
@@ -95,20 +122,8 @@ def get_feature_label(feature_code, language='en', include_code=True):
         >>> get_feature_label('MATHEFF', 'de', False)
         'Mathematische Selbstwirksamkeit'
     """
-    if feature_code not in FEATURE_DESCRIPTIONS:
-        return feature_code
-
-    en_desc, de_desc = FEATURE_DESCRIPTIONS[feature_code]
-
-    if language == 'de':
-        label = de_desc
-    else:
-        label = en_desc
-
-    if include_code:
-        return f"{feature_code} - {label}"
-    else:
-        return label
+    labels = _LABELS['de' if language == 'de' else 'en', bool(include_code)]
+    return labels.get(feature_code, feature_code)
 
 
 def get_feature_description_bilingual(feature_code):
@@ -125,11 +140,7 @@ def get_feature_description_bilingual(feature_code):
         >>> get_feature_description_bilingual('MATHEFF')
         'Mathematics self-efficacy (Mathematische Selbstwirksamkeit)'
     """
-    if feature_code not in FEATURE_DESCRIPTIONS:
-        return feature_code
-
-    en_desc, de_desc = FEATURE_DESCRIPTIONS[feature_code]
-    return f"{en_desc} ({de_desc})"
+    return _BILINGUAL.get(feature_code, feature_code)
 
 
 def get_all_features_with_descriptions(language='en'):
@@ -142,12 +153,10 @@ def get_all_features_with_descriptions(language='en'):
     Returns:
         Dictionary mapping feature codes to descriptions
     """
-    if language == 'de':
-        return {code: desc[1] for code, desc in FEATURE_DESCRIPTIONS.items()}
-    else:
-        return {code: desc[0] for code, desc in FEATURE_DESCRIPTIONS.items()}
+    return dict(_LABELS['de' if language == 'de' else 'en', False])
 
 
+@lru_cache(maxsize=1024)
 def format_feature_for_display(feature_code, importance_pct=None):
     """
     Format feature for display with description and optional importance.
@@ -169,3 +178,30 @@ def format_feature_for_display(feature_code, importance_pct=None):
         return f"{feature_code} ({importance_pct:.1f}%) - {bilingual_desc}"
     else:
         return f"{feature_code} - {bilingual_desc}"
+
+
+def get_feature_labels(feature_codes, language='en'):
+    """
+    Look up descriptions for many feature codes at once.
+
+    Args:
+        feature_codes: Sequence of PISA feature codes (list, array or Series)
+        language: 'en', 'de' or 'bilingual'
+
+    Returns:
+        NumPy object array of descriptions; unknown codes are returned unchanged
+
+    Example:
+        >>> get_feature_labels(['MATHEFF', 'XYZ'], 'de')
+        array(['Mathematische Selbstwirksamkeit', 'XYZ'], dtype=object)
+    """
+    codes = np.asarray(feature_codes, dtype=object).astype(str)
+    if codes.size == 0:
+        return np.array([], dtype=object)
+
+    positions = np.searchsorted(_SORTED_CODES, codes)
+    positions = np.minimum(positions, len(_SORTED_CODES) - 1)
+    found = _SORTED_CODES[positions] == codes
+
+    texts = _TEXT_ARRAYS.get(language, _TEXT_ARRAYS['en'])
+    return np.where(found, texts[_SORT_ORDER[positions]], codes.astype(object))
@@ -13,6 +13,13 @@ Strategie: Data-Driven Feature Selection
 - 58 Skalen statt vorher 8
 """
 
+import re
+import warnings
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
 # ============================================================
 # ALLE 58 VERFÜGBAREN PISA-SKALEN (Stand: 2025-11-03)
 # Quelle: scales_with_data_overview.csv + DB-Verifizierung
@@ -47,34 +54,180 @@ ALLE_VERFUEGBAREN_SKALEN = [
     'PROBSELF', 'SCHSUST', 'SDLEFF'
 ]
 
+# Plausible Values (PV1-PV10 je Domäne) - nie als Feature verwenden
+PV_DOMAINS = ('MATH', 'READ', 'SCIE')
+PV_COLUMNS = tuple(f'PV{i}{domain}' for domain in PV_DOMAINS for i in range(1, 11))
+
+# ============================================================
+# FEATURE-GRUPPEN (geordnet nach Relevanz, unveränderlich)
+# Werden von allen PISAFeatureSelector-Instanzen geteilt
+# ============================================================
+
+# Mathematik-spezifische Skalen (12)
+MATH_SCALES = (
+    'MATHEFF',      # Mathematics Self-Efficacy ⭐ TOP FAKTOR!
+    'ANXMAT',       # Mathematics Anxiety ⭐ #2 FAKTOR
+    'TEACHSUP',     # Mathematics Teacher Support
+    'COGACMCO',     # Cognitive activation: math thinking
+    'COGACRCO',     # Cognitive activation: math reasoning
+    'DISCLIM',      # Disciplinary climate in mathematics
+    'MATHPERS',     # Math effort and persistence
+    'MATHEF21',     # Math self-efficacy: 21st century
+    'EXPO21ST',     # Exposure to math reasoning
+    'EXPOFA',       # Exposure to formal/applied math
+    'FAMCON',       # Familiarity with math concepts
+    'PQMIMP',       # Parent attitudes toward math
+)
+
+# Psychologische & soziale Skalen (11) - GENERISCH für alle Fächer
+PSYCHOLOGICAL_SCALES = (
+    'BELONG',       # Sense of Belonging ⭐ WICHTIG
+    'PERSEVAGR',    # Perseverance ⭐ WICHTIG
+    'GROSAGR',      # Growth Mindset ⭐ WICHTIG
+    'CURIOAGR',     # Curiosity
+    'STRESAGR',     # Stress resistance
+    'EMOCOAGR',     # Emotional control
+    'EMPATAGR',     # Empathy
+    'ASSERAGR',     # Assertiveness
+    'COOPAGR',      # Cooperation
+    'BULLIED',      # Being bullied (negativ)
+    'RELATST',      # Student-teacher relationships
+)
+
+# Familie & häusliches Umfeld (8) - GENERISCH
+FAMILY_HOME_SCALES = (
+    'HOMEPOS',      # Home possessions (SES Proxy) ⭐ WICHTIG
+    'FAMSUP',       # Family support
+    'FAMSUPSL',     # Family support self-directed learning
+    'PARINVOL',     # Parental Involvement
+    'PASCHPOL',     # School policies for parental involvement
+    'PQSCHOOL',     # School quality
+    'ATTIMMP',      # Parents' attitudes toward immigrants
+    'FEELLAH',      # Feelings about learning at home
+)
+
+# ICT & Digital (13) - GENERISCH, wichtig für alle Fächer
+ICT_SCALES = (
+    'ICTEFFIC',     # Self-efficacy in digital competencies
+    'ICTRES',       # ICT Resources
+    'ICTHOME',      # ICT availability outside school
+    'ICTSCH',       # ICT availability at school
+    'ICTSUBJ',      # Subject-related ICT during lessons
+    'ICTWKDY',      # ICT frequency weekday
+    'ICTWKEND',     # ICT frequency weekend
+    'ICTENQ',       # ICT in enquiry-based learning
+    'ICTFEED',      # Support/feedback via ICT
+    'ICTINFO',      # Online information practices
+    'ICTOUT',       # ICT for school outside classroom
+    'ICTQUAL',      # Quality of ICT access
+    'ICTREG',       # Views on regulated ICT use
+)
+
+# Kreativität (11) - GENERISCH, besonders relevant für Science & Reading
+CREATIVITY_SCALES = (
+    'CREATEFF',     # Creative self-efficacy ⭐
+    'CREATOP',      # Creativity and Openness ⭐
+    'CREATAS',      # Creative Activities at school
+    'CREATSCH',     # Creative school/class environment
+    'CREATFAM',     # Creative peers/family environment
+    'CREATOOS',     # Creative Activities outside school
+    'CREATOPN',     # Own creativity: parent's report (≠ CREATOP)
+    'OPENART',      # Openness to Art and Reflection
+    'CREATOR',      # Openness to creativity: Other's report
+    'CREATHME',     # Creative Home Environment
+    'CREATACT',     # Creative activities outside school: parent's report (≠ CREATOOS)
+)
+
+# Selbstgesteuertes Lernen & Schule (3) - GENERISCH
+LEARNING_SCALES = (
+    'SDLEFF',       # Self-directed learning efficacy
+    'PROBSELF',     # Problems with self-directed learning
+    'SCHSUST',      # School activities to sustain learning
+)
+
+# Einzelitems: entfernt für wissenschaftliche Publikation (siehe PISAFeatureSelector)
+DEMOGRAPHIC_ITEMS = ()
+SCHOOL_CONTEXT_ITEMS = ()
+
+# Backward-Compatibility: Teilmenge der Mathe-Skalen (TEACHSUP, DISCLIM)
+TEACHER_SCHOOL_SCALES = tuple(
+    f for f in MATH_SCALES if f in ('TEACHSUP', 'DISCLIM')
+)
+
+
+def _find_duplicate_features(*groups):
+    """Gibt Feature-Codes zurück, die in mehreren Gruppen (oder doppelt) vorkommen"""
+    seen = set()
+    duplicates = []
+    for group in groups:
+        for feature in group:
+            if feature in seen and feature not in duplicates:
+                duplicates.append(feature)
+            seen.add(feature)
+    return duplicates
+
+
+_duplicates = _find_duplicate_features(
+    MATH_SCALES, PSYCHOLOGICAL_SCALES, FAMILY_HOME_SCALES, ICT_SCALES,
+    CREATIVITY_SCALES, LEARNING_SCALES, DEMOGRAPHIC_ITEMS, SCHOOL_CONTEXT_ITEMS
+)
+if _duplicates:
+    warnings.warn(
+        f"Feature-Gruppen enthalten doppelte Codes: {', '.join(_duplicates)}",
+        stacklevel=2
+    )
+
+MATH_SCALES_SET = frozenset(MATH_SCALES)
+PSYCHOLOGICAL_SCALES_SET = frozenset(PSYCHOLOGICAL_SCALES)
+FAMILY_HOME_SCALES_SET = frozenset(FAMILY_HOME_SCALES)
+ICT_SCALES_SET = frozenset(ICT_SCALES)
+CREATIVITY_SCALES_SET = frozenset(CREATIVITY_SCALES)
+LEARNING_SCALES_SET = frozenset(LEARNING_SCALES)
+DEMOGRAPHIC_ITEMS_SET = frozenset(DEMOGRAPHIC_ITEMS)
+SCHOOL_CONTEXT_ITEMS_SET = frozenset(SCHOOL_CONTEXT_ITEMS)
+TEACHER_SCHOOL_SCALES_SET = frozenset(TEACHER_SCHOOL_SCALES)
+
 # Kategorisiert für spätere Analyse und fachspezifische Modelle
-FEATURE_CATEGORIES = {
-    'math_specific': [
-        'ANXMAT', 'COGACMCO', 'COGACRCO', 'DISCLIM',
-        'EXPO21ST', 'EXPOFA', 'FAMCON', 'MATHEF21',
-        'MATHEFF', 'MATHPERS', 'PQMIMP', 'TEACHSUP'
-    ],
-    'ict_digital': [
-        'ICTEFFIC', 'ICTENQ', 'ICTFEED', 'ICTHOME',
-        'ICTINFO', 'ICTOUT', 'ICTQUAL', 'ICTREG',
-        'ICTRES', 'ICTSCH', 'ICTSUBJ', 'ICTWKDY', 'ICTWKEND'
-    ],
-    'psychological_social': [
-        'ASSERAGR', 'BELONG', 'BULLIED', 'COOPAGR',
-        'CURIOAGR', 'EMOCOAGR', 'EMPATAGR', 'GROSAGR',
-        'PERSEVAGR', 'RELATST', 'STRESAGR'
-    ],
-    'family_home': [
-        'ATTIMMP', 'FAMSUP', 'FAMSUPSL', 'HOMEPOS',
-        'PARINVOL', 'PASCHPOL', 'PQSCHOOL', 'FEELLAH'
-    ],
-    'creativity': [
-        'CREATACT', 'CREATAS', 'CREATEFF', 'CREATFAM',
-        'CREATHME', 'CREATOOS', 'CREATOP', 'CREATOPN',
-        'CREATOR', 'CREATSCH', 'OPENART'
-    ],
-    'self_directed_learning': ['PROBSELF', 'SCHSUST', 'SDLEFF']
-}
+# FEATURE_CATEGORIES: schreibgeschützt, Kategorie → frozenset (O(1)-Lookup)
+# FEATURE_CATEGORIES_ORDERED: gleiche Kategorien als Tupel mit fester
+# Reihenfolge, z.B. für die Anzeige
+FEATURE_CATEGORIES_ORDERED = (
+    ('math_specific', MATH_SCALES),
+    ('ict_digital', ICT_SCALES),
+    ('psychological_social', PSYCHOLOGICAL_SCALES),
+    ('family_home', FAMILY_HOME_SCALES),
+    ('creativity', CREATIVITY_SCALES),
+    ('self_directed_learning', LEARNING_SCALES),
+)
+
+FEATURE_CATEGORIES = MappingProxyType({
+    'math_specific': MATH_SCALES_SET,
+    'ict_digital': ICT_SCALES_SET,
+    'psychological_social': PSYCHOLOGICAL_SCALES_SET,
+    'family_home': FAMILY_HOME_SCALES_SET,
+    'creativity': CREATIVITY_SCALES_SET,
+    'self_directed_learning': LEARNING_SCALES_SET,
+})
+
+def _optimize_dtypes(X):
+    """
+    Verkleinert die Datentypen eines Feature-DataFrames
+
+    - float64 → float32, soweit der Wertebereich es erlaubt
+    - Text-Spalten mit < 50% eindeutigen Werten → 'category'
+
+    X selbst bleibt unverändert; zurückgegeben wird ein neuer DataFrame.
+    """
+    converted = {}
+
+    for col in X.select_dtypes(include=['float64']).columns:
+        converted[col] = pd.to_numeric(X[col], downcast='float')
+
+    for col in X.select_dtypes(include=['object']).columns:
+        if len(X) > 0 and X[col].nunique(dropna=True) / len(X) < 0.5:
+            converted[col] = X[col].astype('category')
+
+    return X.assign(**converted) if converted else X
 
 
 class PISAFeatureSelector:
@@ -91,6 +244,37 @@ class PISAFeatureSelector:
     - Unsere Basis: 58 verfügbare → 40-50 Features (nach ML-Selektion)
     """
 
+    # Feste Attributliste statt __dict__ pro Instanz
+    __slots__ = (
+        'math_scales', 'psychological_scales', 'family_home_scales',
+        'ict_scales', 'creativity_scales', 'learning_scales',
+        'demographic_items', 'school_context_items',
+        'exclude_patterns', '_exclude_re', 'exclude_pv_patterns', '_exclude_pv_set',
+        'socioeconomic_scales', 'teacher_school_scales',
+        '_math_set', '_psychological_set', '_family_home_set', '_ict_set',
+        '_creativity_set', '_learning_set', '_demographic_set',
+        '_school_context_set', '_teacher_school_set', '_non_scale_items',
+        '_features_generic', '_features_math', '_display_cache',
+    )
+
+    # Schlüssel-Skalen für validate_against_research:
+    # (Feature, Check-Name, Status wenn fehlend, Notiz vorhanden, Notiz fehlend)
+    _FEATURE_CHECKS = (
+        ('MATHEFF', 'MATHEFF (Top Faktor)', '⚠️',
+         'Wichtigster Faktor laut Forschung (16.17%)',
+         'Nur für Mathematik relevant'),
+        ('ANXMAT', 'ANXMAT (Angst)', '⚠️',
+         'Zweitwichtigster Faktor für Mathematik',
+         'Nur für Mathematik relevant'),
+        # HOMEPOS als Ersatz für ESCS
+        ('HOMEPOS', 'HOMEPOS (SES Proxy)', '❌',
+         'Proxy für sozioökonomischen Status (ESCS nicht verfügbar)',
+         'FEHLT! Essentielle Kontrollvariable.'),
+    )
+
+    # Alle Spalten, die ein Selector je anfordern kann (Skalen + Plausible Values)
+    _FEATURE_UNIVERSE = frozenset(ALLE_VERFUEGBAREN_SKALEN) | frozenset(PV_COLUMNS)
+
     def __init__(self):
         """Definiere Feature-Gruppen basierend auf verfügbaren PISA-Skalen"""
 
@@ -100,86 +284,22 @@ class PISAFeatureSelector:
         # ============================================================
 
         # Mathematik-spezifische Skalen (12)
-        self.math_scales = [
-            'MATHEFF',      # Mathematics Self-Efficacy ⭐ TOP FAKTOR!
-            'ANXMAT',       # Mathematics Anxiety ⭐ #2 FAKTOR
-            'TEACHSUP',     # Mathematics Teacher Support
-            'COGACMCO',     # Cognitive activation: math thinking
-            'COGACRCO',     # Cognitive activation: math reasoning
-            'DISCLIM',      # Disciplinary climate in mathematics
-            'MATHPERS',     # Math effort and persistence
-            'MATHEF21',     # Math self-efficacy: 21st century
-            'EXPO21ST',     # Exposure to math reasoning
-            'EXPOFA',       # Exposure to formal/applied math
-            'FAMCON',       # Familiarity with math concepts
-            'PQMIMP',       # Parent attitudes toward math
-        ]
+        self.math_scales = MATH_SCALES
 
         # Psychologische & soziale Skalen (11) - GENERISCH für alle Fächer
-        self.psychological_scales = [
-            'BELONG',       # Sense of Belonging ⭐ WICHTIG
-            'PERSEVAGR',    # Perseverance ⭐ WICHTIG
-            'GROSAGR',      # Growth Mindset ⭐ WICHTIG
-            'CURIOAGR',     # Curiosity
-            'STRESAGR',     # Stress resistance
-            'EMOCOAGR',     # Emotional control
-            'EMPATAGR',     # Empathy
-            'ASSERAGR',     # Assertiveness
-            'COOPAGR',      # Cooperation
-            'BULLIED',      # Being bullied (negativ)
-            'RELATST',      # Student-teacher relationships
-        ]
+        self.psychological_scales = PSYCHOLOGICAL_SCALES
 
         # Familie & häusliches Umfeld (8) - GENERISCH
-        self.family_home_scales = [
-            'HOMEPOS',      # Home possessions (SES Proxy) ⭐ WICHTIG
-            'FAMSUP',       # Family support
-            'FAMSUPSL',     # Family support self-directed learning
-            'PARINVOL',     # Parental Involvement
-            'PASCHPOL',     # School policies for parental involvement
-            'PQSCHOOL',     # School quality
-            'ATTIMMP',      # Parents' attitudes toward immigrants
-            'FEELLAH',      # Feelings about learning at home
-        ]
+        self.family_home_scales = FAMILY_HOME_SCALES
 
         # ICT & Digital (13) - GENERISCH, wichtig für alle Fächer
-        self.ict_scales = [
-            'ICTEFFIC',     # Self-efficacy in digital competencies
-            'ICTRES',       # ICT Resources
-            'ICTHOME',      # ICT availability outside school
-            'ICTSCH',       # ICT availability at school
-            'ICTSUBJ',      # Subject-related ICT during lessons
-            'ICTWKDY',      # ICT frequency weekday
-            'ICTWKEND',     # ICT frequency weekend
-            'ICTENQ',       # ICT in enquiry-based learning
-            'ICTFEED',      # Support/feedback via ICT
-            'ICTINFO',      # Online information practices
-            'ICTOUT',       # ICT for school outside classroom
-            'ICTQUAL',      # Quality of ICT access
-            'ICTREG',       # Views on regulated ICT use
-        ]
+        self.ict_scales = ICT_SCALES
 
         # Kreativität (11) - GENERISCH, besonders relevant für Science & Reading
-        self.creativity_scales = [
-            'CREATEFF',     # Creative self-efficacy ⭐
-            'CREATOP',      # Creativity and Openness ⭐
-            'CREATAS',      # Creative Activities at school
-            'CREATSCH',     # Creative school/class environment
-            'CREATFAM',     # Creative peers/family environment
-            'CREATOOS',     # Creative Activities outside school
-            'CREATOPN',     # Creativity and Openness (alt)
-            'OPENART',      # Openness to Art and Reflection
-            'CREATOR',      # Openness to creativity: Other's report
-            'CREATHME',     # Creative Home Environment
-            'CREATACT',     # Creative activities outside school
-        ]
+        self.creativity_scales = CREATIVITY_SCALES
 
         # Selbstgesteuertes Lernen & Schule (3) - GENERISCH
-        self.learning_scales = [
-            'SDLEFF',       # Self-directed learning efficacy
-            'PROBSELF',     # Problems with self-directed learning
-            'SCHSUST',      # School activities to sustain learning
-        ]
+        self.learning_scales = LEARNING_SCALES
 
         # ============================================================
         # EINZELITEMS: ENTFERNT FÜR WISSENSCHAFTLICHE PUBLIKATION
@@ -189,10 +309,10 @@ class PISAFeatureSelector:
         # Grund: Nicht validierte PISA-Skalen, können Ergebnisse verfälschen
         # Grade-Level (ST001D01T) war Top Feature - aber kein echtes Konstrukt
 
-        self.demographic_items = []
+        self.demographic_items = DEMOGRAPHIC_ITEMS
 
         # SC001Q01TA und SC013Q01TA sind nicht in DB verfügbar
-        self.school_context_items = []
+        self.school_context_items = SCHOOL_CONTEXT_ITEMS
 
         # ============================================================
         # AUSSCHLUSS: Administrative & ID-Variablen
@@ -211,16 +331,13 @@ class PISAFeatureSelector:
             'BOOKID',       # Booklet ID
             'CLCUSE',       # Calculator Use
         ]
+        # Ein Regex für alle Teilstring-Muster (ein Durchlauf pro Spaltenname)
+        self._exclude_re = re.compile('|'.join(map(re.escape, self.exclude_patterns)))
 
-        # Auch Plausible Values ausschließen (außer Ziel-Variable)
-        self.exclude_pv_patterns = [
-            'PV1MATH', 'PV2MATH', 'PV3MATH', 'PV4MATH', 'PV5MATH',
-            'PV6MATH', 'PV7MATH', 'PV8MATH', 'PV9MATH', 'PV10MATH',
-            'PV1READ', 'PV2READ', 'PV3READ', 'PV4READ', 'PV5READ',
-            'PV6READ', 'PV7READ', 'PV8READ', 'PV9READ', 'PV10READ',
-            'PV1SCIE', 'PV2SCIE', 'PV3SCIE', 'PV4SCIE', 'PV5SCIE',
-            'PV6SCIE', 'PV7SCIE', 'PV8SCIE', 'PV9SCIE', 'PV10SCIE',
-        ]
+        # Auch Plausible Values ausschließen (außer Ziel-Variable):
+        # PV1MATH ... PV10SCIE, generiert statt von Hand gepflegt
+        self.exclude_pv_patterns = list(PV_COLUMNS)
+        self._exclude_pv_set = frozenset(PV_COLUMNS)
 
         # ============================================================
         # BACKWARD COMPATIBILITY: Aliase für alte Streamlit-App
@@ -230,10 +347,85 @@ class PISAFeatureSelector:
         self.socioeconomic_scales = self.family_home_scales
 
         # teacher_school_scales: Kombination aus TEACHSUP und DISCLIM
-        self.teacher_school_scales = [
-            'TEACHSUP',  # Mathematics Teacher Support
-            'DISCLIM',   # Disciplinary climate in mathematics
-        ]
+        self.teacher_school_scales = TEACHER_SCHOOL_SCALES
+
+        # Frozensets der Gruppen für O(1)-Zählung im Selection Report
+        self._math_set = MATH_SCALES_SET
+        self._psychological_set = PSYCHOLOGICAL_SCALES_SET
+        self._family_home_set = FAMILY_HOME_SCALES_SET
+        self._ict_set = ICT_SCALES_SET
+        self._creativity_set = CREATIVITY_SCALES_SET
+        self._learning_set = LEARNING_SCALES_SET
+        self._demographic_set = DEMOGRAPHIC_ITEMS_SET
+        self._school_context_set = SCHOOL_CONTEXT_ITEMS_SET
+        self._teacher_school_set = TEACHER_SCHOOL_SCALES_SET
+        self._non_scale_items = self._demographic_set | self._school_context_set
+
+        # ============================================================
+        # FEATURE-LISTEN JE ZIELVARIABLE (einmalig vorberechnet)
+        # Nur zwei Varianten: mit Mathe-Skalen (PV*MATH) oder generisch
+        # ============================================================
+
+        generic_features = (
+            # Generische Skalen für ALLE Fächer
+            *self.psychological_scales,
+            *self.family_home_scales,
+            *self.ict_scales,
+            *self.creativity_scales,
+            *self.learning_scales,
+            # Einzelitems
+            *self.demographic_items,
+            *self.school_context_items,
+        )
+
+        # Doppelte Codes entfernen (Reihenfolge bleibt erhalten)
+        self._features_generic = tuple(dict.fromkeys(generic_features))
+        self._features_math = tuple(dict.fromkeys((*self.math_scales, *generic_features)))
+
+        # Wird beim ersten Aufruf von get_feature_groups_display befüllt
+        self._display_cache = None
+
+    @classmethod
+    def feature_universe(cls):
+        """
+        Gibt alle Spalten zurück, die für Feature Selection benötigt werden
+        können: alle verfügbaren Skalen plus alle Plausible Values
+
+        Damit kann die Datenschicht schon beim Einlesen nur diese Spalten
+        laden, z.B.:
+            pd.read_parquet(path, columns=sorted(PISAFeatureSelector.feature_universe()))
+
+        Returns:
+            frozenset: Spaltennamen
+        """
+        return cls._FEATURE_UNIVERSE
+
+    def is_excluded(self, col):
+        """
+        Prüft, ob eine Spalte als ID-/Admin-Variable oder Plausible Value
+        von der Feature-Auswahl ausgeschlossen ist
+
+        Args:
+            col: Spaltenname
+
+        Returns:
+            bool: True, wenn die Spalte ausgeschlossen wird
+        """
+        return col in self._exclude_pv_set or self._exclude_re.search(col) is not None
+
+    def filter_columns(self, columns):
+        """
+        Entfernt ID-/Admin-Variablen und Plausible Values aus einer Spaltenliste
+
+        Args:
+            columns: Spaltennamen (z.B. df.columns)
+
+        Returns:
+            list: Nicht ausgeschlossene Spalten in ursprünglicher Reihenfolge
+        """
+        excluded_pattern = self._exclude_re.search
+        excluded_pv = self._exclude_pv_set
+        return [col for col in columns if col not in excluded_pv and not excluded_pattern(col)]
 
     def get_all_features(self, target_var='PV1MATH', include_reading=None):
         """
@@ -254,48 +446,47 @@ class PISAFeatureSelector:
             else:
                 target_var = 'PV1MATH'
 
-        features = []
-
         # Mathematik-spezifische Skalen NUR für PV1MATH
         if 'MATH' in target_var:
-            features.extend(self.math_scales)
-
-        # Generische Skalen für ALLE Fächer
-        features.extend(self.psychological_scales)
-        features.extend(self.family_home_scales)
-        features.extend(self.ict_scales)
-        features.extend(self.creativity_scales)
-        features.extend(self.learning_scales)
-
-        # Einzelitems
-        features.extend(self.demographic_items)
-        features.extend(self.school_context_items)
+            return list(self._features_math)
+        return list(self._features_generic)
 
-        return features
-
-    def select_features(self, df, target_var='PV1MATH'):
+    def select_features(self, df, target_var='PV1MATH', optimize_dtypes=True, copy=True,
+                        backend='numpy'):
         """
         Wählt Features aus DataFrame aus
 
         Args:
             df: DataFrame mit allen PISA-Variablen
             target_var: Ziel-Variable (PV1MATH, PV1READ, PV1SCIE)
+            optimize_dtypes: Wenn True, werden float64-Spalten in X auf float32
+                           verkleinert und Text-Spalten mit wenigen Ausprägungen
+                           als 'category' gespeichert. y wird als float32
+                           (bzw. 'category' bei Text-Zielen) zurückgegeben;
+                           der Datentyp steht in selection_report['y_dtype']
+            copy: Wenn False, werden X und y ohne defensive Kopie aus df
+                 entnommen - Änderungen an X/y können dann df verändern.
+                 Sinnvoll, wenn X direkt an scikit-learn weitergegeben wird.
+            backend: 'numpy' (Standard) oder 'pyarrow'. Bei 'pyarrow' werden
+                    numerische Spalten als 'float32[pyarrow]' zurückgegeben
+                    (Missing Values als Bitmaske, ohne Kopie an Streamlit/Arrow
+                    übergebbar; scikit-learn materialisiert einmal nach NumPy)
 
         Returns:
             tuple: (X, y, selected_feature_names, selection_report)
         """
+        if backend not in ('numpy', 'pyarrow'):
+            raise ValueError(f"Unknown backend: {backend}")
+
         # Alle gewünschten Features
         desired_features = self.get_all_features(target_var=target_var)
 
         # Prüfe welche Features tatsächlich vorhanden sind
-        available_features = []
-        missing_features = []
-
-        for feature in desired_features:
-            if feature in df.columns:
-                available_features.append(feature)
-            else:
-                missing_features.append(feature)
+        # (Index-Operationen auf der Hashtabelle, Reihenfolge bleibt erhalten)
+        desired_index = pd.Index(desired_features)
+        available_features = desired_index.intersection(df.columns, sort=False).tolist()
+        missing_features = desired_index.difference(df.columns, sort=False).tolist()
+        available_set = frozenset(available_features)
 
         # Erstelle Selection Report
         selection_report = {
@@ -305,34 +496,90 @@ class PISAFeatureSelector:
             'available_features': available_features,
             'missing_features': missing_features,
             'breakdown': {
-                'math_scales': sum(1 for f in self.math_scales if f in available_features) if 'MATH' in target_var else 0,
-                'psychological_scales': sum(1 for f in self.psychological_scales if f in available_features),
-                'family_home_scales': sum(1 for f in self.family_home_scales if f in available_features),
-                'ict_scales': sum(1 for f in self.ict_scales if f in available_features),
-                'creativity_scales': sum(1 for f in self.creativity_scales if f in available_features),
-                'learning_scales': sum(1 for f in self.learning_scales if f in available_features),
-                'demographic_items': sum(1 for f in self.demographic_items if f in available_features),
-                'school_context_items': sum(1 for f in self.school_context_items if f in available_features),
-                # Backward-Compatibility: Alte Keys für Streamlit-App
-                'socioeconomic_scales': sum(1 for f in self.socioeconomic_scales if f in available_features),
-                'teacher_school_scales': sum(1 for f in self.teacher_school_scales if f in available_features),
+                name: len(group_set & available_set)
+                for name, group_set in (
+                    ('math_scales', self._math_set if 'MATH' in target_var else frozenset()),
+                    ('psychological_scales', self._psychological_set),
+                    ('family_home_scales', self._family_home_set),
+                    ('ict_scales', self._ict_set),
+                    ('creativity_scales', self._creativity_set),
+                    ('learning_scales', self._learning_set),
+                    ('demographic_items', self._demographic_set),
+                    ('school_context_items', self._school_context_set),
+                )
             }
         }
 
+        # Backward-Compatibility: Alte Keys für Streamlit-App
+        # (socioeconomic_scales ist ein Alias von family_home_scales)
+        breakdown = selection_report['breakdown']
+        breakdown['socioeconomic_scales'] = breakdown['family_home_scales']
+        breakdown['teacher_school_scales'] = len(self._teacher_school_set & available_set)
+
         # Extrahiere X und y
-        X = df[available_features].copy()
-        y = df[target_var].copy()
+        X = df[available_features]
+        y = df[target_var]
+        if copy:
+            X = X.copy()
+
+        if optimize_dtypes:
+            selection_report['memory_bytes_before'] = int(X.memory_usage(deep=True).sum())
+            X = _optimize_dtypes(X)
+            selection_report['memory_bytes_after'] = int(X.memory_usage(deep=True).sum())
+
+        # Zielvariable: Plausible Values (float64) → float32,
+        # Text-Ziele (Klassifikation) → 'category'; astype kopiert ohnehin
+        if optimize_dtypes and pd.api.types.is_float_dtype(y):
+            y = y.astype(np.float32)
+        elif optimize_dtypes and (pd.api.types.is_object_dtype(y)
+                                  or pd.api.types.is_string_dtype(y)):
+            y = y.astype('category')
+        elif copy:
+            y = y.copy()
+
+        if backend == 'pyarrow':
+            numeric_cols = X.select_dtypes(include=['number']).columns
+            X = X.astype({col: 'float32[pyarrow]' for col in numeric_cols})
+            if pd.api.types.is_numeric_dtype(y):
+                y = y.astype('float32[pyarrow]')
+
+        selection_report['y_dtype'] = str(y.dtype)
 
         return X, y, available_features, selection_report
 
+    def select_features_as_arrays(self, df, target_var='PV1MATH'):
+        """
+        Wie select_features, aber X und y als float32-NumPy-Arrays
+        (direkt für scikit-learn/XGBoost, ohne float64-Zwischenkopie)
+
+        Args:
+            df: DataFrame mit allen PISA-Variablen
+            target_var: Ziel-Variable (PV1MATH, PV1READ, PV1SCIE)
+
+        Returns:
+            tuple: (X_array, y_array, selected_feature_names, selection_report)
+        """
+        X, y, available_features, selection_report = self.select_features(
+            df, target_var=target_var, optimize_dtypes=False, copy=False
+        )
+        X_array = X.to_numpy(dtype=np.float32, na_value=np.nan)
+        y_array = y.to_numpy(dtype=np.float32, na_value=np.nan)
+        return X_array, y_array, available_features, selection_report
+
     def get_feature_groups_display(self):
         """
         Gibt Feature-Gruppen für UI-Anzeige zurück
 
+        Das Dict wird beim ersten Aufruf aufgebaut und danach wiederverwendet;
+        Aufrufer dürfen es nur lesen.
+
         Returns:
             dict: Feature-Gruppen mit Emojis und Beschreibungen
         """
-        return {
+        if self._display_cache is not None:
+            return self._display_cache
+
+        self._display_cache = {
             "📐 Mathematik-Skalen (12)": {
                 'features': self.math_scales,
                 'description': 'Math-Selbstwirksamkeit, Angst, Unterricht, Exposition',
@@ -374,6 +621,7 @@ class PISAFeatureSelector:
                 'research_note': 'Strukturelle Faktoren'
             },
         }
+        return self._display_cache
 
     def validate_against_research(self, selected_features):
         """
@@ -390,51 +638,17 @@ class PISAFeatureSelector:
             'score': 0,
             'max_score': 5,
         }
+        selected_set = frozenset(selected_features)
 
-        # Check 1: MATHEFF vorhanden?
-        if 'MATHEFF' in selected_features:
-            validation['checks'].append({
-                'name': 'MATHEFF (Top Faktor)',
-                'status': '✅',
-                'note': 'Wichtigster Faktor laut Forschung (16.17%)'
-            })
-            validation['score'] += 1
-        else:
-            validation['checks'].append({
-                'name': 'MATHEFF (Top Faktor)',
-                'status': '⚠️',
-                'note': 'Nur für Mathematik relevant'
-            })
-
-        # Check 2: ANXMAT vorhanden?
-        if 'ANXMAT' in selected_features:
-            validation['checks'].append({
-                'name': 'ANXMAT (Angst)',
-                'status': '✅',
-                'note': 'Zweitwichtigster Faktor für Mathematik'
-            })
-            validation['score'] += 1
-        else:
-            validation['checks'].append({
-                'name': 'ANXMAT (Angst)',
-                'status': '⚠️',
-                'note': 'Nur für Mathematik relevant'
-            })
-
-        # Check 3: HOMEPOS vorhanden? (Ersatz für ESCS)
-        if 'HOMEPOS' in selected_features:
-            validation['checks'].append({
-                'name': 'HOMEPOS (SES Proxy)',
-                'status': '✅',
-                'note': 'Proxy für sozioökonomischen Status (ESCS nicht verfügbar)'
-            })
-            validation['score'] += 1
-        else:
+        # Check 1-3: Einzelne Schlüssel-Skalen vorhanden?
+        for feature, name, status_missing, note_ok, note_missing in self._FEATURE_CHECKS:
+            present = feature in selected_set
             validation['checks'].append({
-                'name': 'HOMEPOS (SES Proxy)',
-                'status': '❌',
-                'note': 'FEHLT! Essentielle Kontrollvariable.'
+                'name': name,
+                'status': '✅' if present else status_missing,
+                'note': note_ok if present else note_missing
             })
+            validation['score'] += present
 
         # Check 4: Mindestens 40 Features?
         if len(selected_features) >= 40:
@@ -459,8 +673,8 @@ class PISAFeatureSelector:
             })
 
         # Check 5: Überwiegend Skalen (nicht Einzelitems)?
-        scales = [f for f in selected_features if f not in self.demographic_items + self.school_context_items]
-        scale_ratio = len(scales) / len(selected_features) if selected_features else 0
+        n_scales = len(selected_set - self._non_scale_items)
+        scale_ratio = n_scales / len(selected_set) if selected_set else 0
 
         if scale_ratio >= 0.90:
             validation['checks'].append({
@@ -486,6 +700,25 @@ class PISAFeatureSelector:
         return validation
 
 
+# Gemeinsame Instanz für die Convenience Functions
+# Der Selector hält nur unveränderliche Konfiguration und kann daher von
+# allen Aufrufen (auch über Streamlit-Reruns hinweg) geteilt werden.
+# Wird beim Import angelegt - der Import-Lock macht das threadsicher.
+_DEFAULT_SELECTOR = PISAFeatureSelector()
+
+
+def reset_default_selector():
+    """
+    Ersetzt die gemeinsame Selector-Instanz durch eine neue (z.B. für Tests)
+
+    Returns:
+        PISAFeatureSelector: Die neue gemeinsame Instanz
+    """
+    global _DEFAULT_SELECTOR
+    _DEFAULT_SELECTOR = PISAFeatureSelector()
+    return _DEFAULT_SELECTOR
+
+
 # Convenience Functions
 def get_recommended_features(target_var='PV1MATH'):
     """
@@ -497,23 +730,22 @@ def get_recommended_features(target_var='PV1MATH'):
     Returns:
         list: Feature-Namen
     """
-    selector = PISAFeatureSelector()
-    return selector.get_all_features(target_var=target_var)
+    return _DEFAULT_SELECTOR.get_all_features(target_var=target_var)
 
 
-def select_features_from_df(df, target_var='PV1MATH'):
+def select_features_from_df(df, target_var='PV1MATH', copy=True):
     """
     Quick Access: Feature Selection aus DataFrame
 
     Args:
         df: DataFrame mit PISA-Daten
         target_var: Ziel-Variable
+        copy: Siehe PISAFeatureSelector.select_features
 
     Returns:
         tuple: (X, y, feature_names, report)
     """
-    selector = PISAFeatureSelector()
-    return selector.select_features(df, target_var=target_var)
+    return _DEFAULT_SELECTOR.select_features(df, target_var=target_var, copy=copy)
 
 
 # Export für direkten Import
@@ -521,6 +753,8 @@ __all__ = [
     'PISAFeatureSelector',
     'get_recommended_features',
     'select_features_from_df',
+    'reset_default_selector',
     'ALLE_VERFUEGBAREN_SKALEN',
-    'FEATURE_CATEGORIES'
+    'FEATURE_CATEGORIES',
+    'FEATURE_CATEGORIES_ORDERED',
 ]
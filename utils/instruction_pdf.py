@@ -4,23 +4,132 @@ PDF-Anleitung Generator für Lehrkräfte
 Erstellt Schritt-für-Schritt Anleitung für die Nutzung der PISA-Befragung.
 """
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
 from io import BytesIO
+from PIL import Image as PILImage
+from reportlab import rl_config
+
+# Attribut-Validierung von reportlab.graphics abschalten (teuer bei vielen
+# Objekten); mit PDF_DEBUG=1 bleibt sie zur Fehlersuche aktiv.
+# Muss vor dem ersten Import von reportlab.graphics gesetzt werden.
+if not os.environ.get('PDF_DEBUG'):
+    rl_config.shapeChecking = 0
+
+from reportlab.graphics.barcode.qr import QrCodeWidget
+from reportlab.graphics.shapes import Drawing
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
+from reportlab.lib.utils import ImageReader
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Image
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from typing import List, Dict
 
 
+# Styles einmalig beim Import anlegen (getSampleStyleSheet ist teuer);
+# die Styles werden pro PDF nur gelesen, nie verändert
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Title'],
+    fontSize=24,
+    textColor=colors.HexColor('#4472C4'),
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading1'],
+    fontSize=16,
+    textColor=colors.HexColor('#4472C4'),
+    spaceAfter=12,
+    spaceBefore=12
+)
+
+_NORMAL_STYLE = ParagraphStyle(
+    'CustomNormal',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    leading=16,
+    alignment=TA_JUSTIFY
+)
+
+_BULLET_STYLE = ParagraphStyle(
+    'CustomBullet',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    leading=16,
+    leftIndent=20,
+    bulletIndent=10
+)
+
+_QUICK_START_TITLE_STYLE = ParagraphStyle('CustomTitle', parent=_STYLES['Title'], fontSize=20)
+
+# Fertige Anleitungen (PDF-Bytes), LRU nach Eingaben inkl. QR-Code-Hash
+_PDF_CACHE_SIZE = 64
+_PDF_CACHE = OrderedDict()
+_PDF_CACHE_LOCK = threading.Lock()
+
+
+class _PILImage(Image):
+    """platypus Image für ein bereits dekodiertes PIL Image (ohne PNG-Umweg)."""
+
+    def __init__(self, pil_image, width=None, height=None):
+        # reportlab bettet nur 'L' als Graustufen ein, alles andere
+        # (auch 1-Bit-QR-Codes) als RGB mit dreifacher Datenmenge
+        if pil_image.mode in ('1', 'P') and not pil_image.info.get('transparency'):
+            pil_image = pil_image.convert('L')
+        # Reader vorab setzen, damit Image ihn nicht aus einer Datei lädt
+        self._img = ImageReader(pil_image)
+        super().__init__(BytesIO(), width=width, height=height)
+
+
+def _qr_drawing(url: str, size: float) -> Drawing:
+    """QR-Code als reportlab-Vektorgrafik (size x size Punkte, zentriert)."""
+    # Gleiche Fehlerkorrektur wie qr_generator (ERROR_CORRECT_H)
+    widget = QrCodeWidget(url, barLevel='H')
+    x1, y1, x2, y2 = widget.getBounds()
+    drawing = Drawing(size, size, transform=[size / (x2 - x1), 0, 0, size / (y2 - y1), 0, 0])
+    drawing.add(widget)
+    drawing.hAlign = 'CENTER'
+    return drawing
+
+
+def _bullets(items: List[str], style: ParagraphStyle) -> Paragraph:
+    """Fasst eine Aufzählung zu einem Absatz zusammen (eine Zeile je Punkt)."""
+    return Paragraph("<br/>".join("• " + item for item in items), style)
+
+
+def _build_pdf(story: List, **doc_kwargs) -> BytesIO:
+    """
+    Setzt eine Story als A4-PDF in einen neuen Puffer.
+
+    reportlab erzeugt das Dokument komplett im Speicher und schreibt es mit
+    einem einzigen write() - der Puffer wächst also nicht schrittweise.
+    Seitenströme werden immer komprimiert (unabhängig von rl_config).
+    """
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, pageCompression=1, **doc_kwargs)
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
+
+
 def create_teacher_instructions(
     scale_name: str,
     scale_title: str,
     scale_description: str,
     num_items: int,
     estimated_minutes: int,
-    qr_code_buffer: BytesIO = None
+    qr_code_buffer: BytesIO = None,
+    qr_code_pil=None,
+    qr_url: str = None
 ) -> BytesIO:
     """
     Erstellt PDF-Anleitung für Lehrkräfte.
@@ -32,58 +141,66 @@ def create_teacher_instructions(
         num_items: Anzahl Fragen
         estimated_minutes: Geschätzte Bearbeitungszeit
         qr_code_buffer: Optional QR-Code Image
+        qr_code_pil: Optional QR-Code als PIL Image (wird ohne PNG-Umweg
+                     eingebettet und hat Vorrang vor qr_code_buffer)
+        qr_url: Optional URL; der QR-Code wird dann direkt als Vektorgrafik
+                gezeichnet (ohne PIL/PNG, hat Vorrang vor den Bild-Parametern)
 
     Returns:
-        BytesIO object mit PDF
+        BytesIO object mit PDF (gleiche Eingaben liefern das PDF aus dem Cache)
     """
-
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=2*cm,
-        leftMargin=2*cm,
-        topMargin=2*cm,
-        bottomMargin=2*cm
-    )
-
-    # Styles
-    styles = getSampleStyleSheet()
-
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Title'],
-        fontSize=24,
-        textColor=colors.HexColor('#4472C4'),
-        spaceAfter=30,
-        alignment=TA_CENTER
+    key = (
+        scale_name, scale_title, scale_description, num_items, estimated_minutes,
+        qr_url if qr_url else _qr_digest(qr_code_buffer, qr_code_pil)
     )
+    with _PDF_CACHE_LOCK:
+        pdf = _PDF_CACHE.get(key)
+        if pdf is not None:
+            _PDF_CACHE.move_to_end(key)
+
+    if pdf is None:
+        pdf = _build_teacher_instructions(
+            scale_name, scale_title, scale_description, num_items, estimated_minutes,
+            qr_code_buffer, qr_code_pil, qr_url
+        ).getvalue()
+        with _PDF_CACHE_LOCK:
+            _PDF_CACHE[key] = pdf
+            if len(_PDF_CACHE) > _PDF_CACHE_SIZE:
+                _PDF_CACHE.popitem(last=False)
+
+    # Eigener Puffer pro Aufruf, damit Aufrufer sich keine Leseposition teilen
+    return BytesIO(pdf)
+
+
+def _qr_digest(qr_code_buffer: BytesIO = None, qr_code_pil=None):
+    """Inhalts-Hash des QR-Codes als Teil des PDF-Cache-Keys."""
+    if qr_code_pil is not None:
+        digest = hashlib.blake2b(qr_code_pil.tobytes(), digest_size=16)
+        digest.update(f"{qr_code_pil.mode}{qr_code_pil.size}".encode())
+        return digest.digest()
+    if qr_code_buffer:
+        return hashlib.blake2b(qr_code_buffer.getvalue(), digest_size=16).digest()
+    return None
 
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading1'],
-        fontSize=16,
-        textColor=colors.HexColor('#4472C4'),
-        spaceAfter=12,
-        spaceBefore=12
-    )
 
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=11,
-        leading=16,
-        alignment=TA_JUSTIFY
-    )
+def _build_teacher_instructions(
+    scale_name: str,
+    scale_title: str,
+    scale_description: str,
+    num_items: int,
+    estimated_minutes: int,
+    qr_code_buffer: BytesIO = None,
+    qr_code_pil=None,
+    qr_url: str = None
+) -> BytesIO:
+    """Setzt die PDF-Anleitung (ungecacht, siehe create_teacher_instructions)."""
 
-    bullet_style = ParagraphStyle(
-        'CustomBullet',
-        parent=styles['Normal'],
-        fontSize=11,
-        leading=16,
-        leftIndent=20,
-        bulletIndent=10
-    )
+    # Styles (modulweit vorberechnet)
+    styles = _STYLES
+    title_style = _TITLE_STYLE
+    heading_style = _HEADING_STYLE
+    normal_style = _NORMAL_STYLE
+    bullet_style = _BULLET_STYLE
 
     # Story (content)
     story = []
@@ -158,8 +275,7 @@ def create_teacher_instructions(
         "Alternativ: Laden Sie die HTML-Datei auf einen Webserver hoch (z.B. Netlify, GitHub Pages)"
     ]
 
-    for item in step1_items:
-        story.append(Paragraph(f"• {item}", bullet_style))
+    story.append(_bullets(step1_items, bullet_style))
 
     story.append(Spacer(1, 0.5*cm))
 
@@ -180,8 +296,7 @@ def create_teacher_instructions(
         "Speichern Sie die Datei"
     ]
 
-    for item in step2_items:
-        story.append(Paragraph(f"• {item}", bullet_style))
+    story.append(_bullets(step2_items, bullet_style))
 
     story.append(Spacer(1, 0.5*cm))
 
@@ -210,18 +325,22 @@ def create_teacher_instructions(
         "Oder: Schüler laden JSON-Datei herunter und senden sie Ihnen per E-Mail"
     ]
 
-    for item in step3_items:
-        story.append(Paragraph(f"• {item}", bullet_style))
+    story.append(_bullets(step3_items, bullet_style))
 
     story.append(Spacer(1, 1*cm))
 
     # QR Code if provided
-    if qr_code_buffer:
+    if qr_url or qr_code_pil is not None or qr_code_buffer:
         story.append(Paragraph("📱 QR-Code für Schüler:", heading_style))
         story.append(Spacer(1, 0.3*cm))
 
-        qr_code_buffer.seek(0)
-        img = Image(qr_code_buffer, width=8*cm, height=8*cm)
+        if qr_url:
+            img = _qr_drawing(qr_url, 8*cm)
+        else:
+            if qr_code_pil is None:
+                qr_code_buffer.seek(0)
+                qr_code_pil = PILImage.open(qr_code_buffer)
+            img = _PILImage(qr_code_pil, width=8*cm, height=8*cm)
         story.append(img)
         story.append(Spacer(1, 0.5*cm))
 
@@ -246,8 +365,7 @@ def create_teacher_instructions(
         "Gelbe Zellen: Nahe PISA Durchschnitt",
         "Rote Zellen: Unter PISA Durchschnitt"
     ]
-    for item in auswert_items:
-        story.append(Paragraph(f"• {item}", bullet_style))
+    story.append(_bullets(auswert_items, bullet_style))
 
     story.append(Spacer(1, 0.3*cm))
 
@@ -258,8 +376,7 @@ def create_teacher_instructions(
         "Anzahl Risikoschüler",
         "Visualisierungen und Charts"
     ]
-    for item in dash_items:
-        story.append(Paragraph(f"• {item}", bullet_style))
+    story.append(_bullets(dash_items, bullet_style))
 
     story.append(Spacer(1, 1*cm))
 
@@ -276,8 +393,7 @@ def create_teacher_instructions(
         "Erwägen Sie Peer-Tutoring Programme",
         "Kontaktieren Sie ggf. Schulpsychologie"
     ]
-    for item in risk_items:
-        story.append(Paragraph(f"• {item}", bullet_style))
+    story.append(_bullets(risk_items, bullet_style))
 
     story.append(Spacer(1, 0.5*cm))
 
@@ -288,8 +404,7 @@ def create_teacher_instructions(
         "Nutzen Sie PISA-basierte Unterrichtsmaterialien",
         "Führen Sie Follow-up Befragung durch (z.B. nach 3 Monaten)"
     ]
-    for item in class_items:
-        story.append(Paragraph(f"• {item}", bullet_style))
+    story.append(_bullets(class_items, bullet_style))
 
     story.append(Spacer(1, 1*cm))
 
@@ -312,10 +427,48 @@ def create_teacher_instructions(
     story.append(Paragraph(contact_text, normal_style))
 
     # Build PDF
-    doc.build(story)
-    buffer.seek(0)
+    return _build_pdf(
+        story,
+        rightMargin=2*cm,
+        leftMargin=2*cm,
+        topMargin=2*cm,
+        bottomMargin=2*cm
+    )
 
-    return buffer
+
+def _render_teacher_instructions(spec: Dict) -> bytes:
+    """Worker für create_teacher_instructions_batch (läuft im Unterprozess)."""
+    kwargs = dict(spec)
+    qr_code = kwargs.get('qr_code_buffer')
+    if isinstance(qr_code, (bytes, bytearray)):
+        kwargs['qr_code_buffer'] = BytesIO(qr_code)
+    return create_teacher_instructions(**kwargs).getvalue()
+
+
+def create_teacher_instructions_batch(specs: List[Dict], max_workers: int = None) -> List[BytesIO]:
+    """
+    Erstellt PDF-Anleitungen für mehrere Skalen parallel in einem Prozess-Pool.
+
+    Args:
+        specs: Liste von Dicts mit den Argumenten von create_teacher_instructions.
+               'qr_code_buffer' muss als bytes übergeben werden
+               (z.B. qr_buffer.getvalue()), da BytesIO nicht zwischen
+               Prozessen übertragen wird.
+        max_workers: Anzahl Prozesse (Standard: Anzahl CPUs)
+
+    Returns:
+        Liste von BytesIO objects mit PDF, in der Reihenfolge von specs
+    """
+    if len(specs) <= 1:
+        pdfs = [_render_teacher_instructions(spec) for spec in specs]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(max_workers or os.cpu_count() or 1, len(specs))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pdfs = list(executor.map(_render_teacher_instructions, specs))
+
+    return [BytesIO(pdf) for pdf in pdfs]
 
 
 def create_quick_start_guide(scale_name: str, scale_title: str) -> BytesIO:
@@ -330,14 +483,10 @@ def create_quick_start_guide(scale_name: str, scale_title: str) -> BytesIO:
         BytesIO object mit PDF
     """
 
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4)
-
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     story = []
 
-    title_style = ParagraphStyle('CustomTitle', parent=styles['Title'], fontSize=20)
-    story.append(Paragraph(f"⚡ Quick Start: {scale_title}", title_style))
+    story.append(Paragraph(f"⚡ Quick Start: {scale_title}", _QUICK_START_TITLE_STYLE))
     story.append(Spacer(1, 0.5*cm))
 
     steps = [
@@ -352,7 +501,4 @@ def create_quick_start_guide(scale_name: str, scale_title: str) -> BytesIO:
         story.append(Paragraph(f"<b>{num}.</b> {text}", styles['Normal']))
         story.append(Spacer(1, 0.3*cm))
 
-    doc.build(story)
-    buffer.seek(0)
-
-    return buffer
+    return _build_pdf(story)
@@ -4,21 +4,48 @@ QR-Code Generator für PISA-Befragungen
 Erstellt QR-Codes für HTML-Formulare.
 """
 
+import os
+from functools import lru_cache
 from io import BytesIO
 import qrcode
 from PIL import Image, ImageDraw, ImageFont
 
 
-def generate_qr_code(url: str, with_logo: bool = False) -> BytesIO:
+# Erste vorhandene Schrift (macOS, dann Linux/DejaVu), einmal beim Import geprüft
+_FONT_CANDIDATES = (
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+)
+_FONT_PATH = next((path for path in _FONT_CANDIDATES if os.path.exists(path)), None)
+
+
+@lru_cache(maxsize=32)
+def _font(path: str, size: int):
+    """
+    Lädt eine TrueType-Schrift einmal je (Pfad, Größe).
+
+    Ohne Pfad (keine Schrift gefunden) oder bei defekter Datei wird die
+    PIL-Standardschrift verwendet.
+    """
+    if path is None:
+        return ImageFont.load_default()
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def generate_qr_code(url: str, with_logo: bool = False, as_pil: bool = False):
     """
     Erstellt QR-Code für Formular-URL.
 
     Args:
         url: URL zum HTML-Formular
         with_logo: Ob ein Logo in der Mitte eingefügt werden soll
+        as_pil: Ob das PIL-Image direkt (ohne PNG-Kodierung) zurückgegeben werden soll
 
     Returns:
-        BytesIO object mit PNG-Bild
+        BytesIO object mit PNG-Bild (bzw. PIL Image bei as_pil=True)
     """
 
     # QR Code erstellen
@@ -32,27 +59,24 @@ def generate_qr_code(url: str, with_logo: bool = False) -> BytesIO:
     qr.add_data(url)
     qr.make(fit=True)
 
-    # Image erstellen
-    img = qr.make_image(fill_color="black", back_color="white")
-    img = img.convert('RGB')
+    # Image erstellen: reines Schwarz/Weiß (Modus '1', 1 Bit pro Pixel)
+    img = qr.make_image(fill_color="black", back_color="white").get_image()
 
     # Optional: Logo in der Mitte (funktioniert durch error correction)
     if with_logo:
+        # Graustufen statt RGB: das Logo-Text-Antialiasing bleibt erhalten
+        img = img.convert('L')
+
         # Erstelle einfaches Text-Logo
         logo_size = img.size[0] // 5
-        logo = Image.new('RGB', (logo_size, logo_size), 'white')
+        logo = Image.new('L', (logo_size, logo_size), 'white')
         draw = ImageDraw.Draw(logo)
 
         # Zeichne Rahmen
         draw.rectangle([(0, 0), (logo_size-1, logo_size-1)], outline='black', width=3)
 
-        # Text "PISA"
-        try:
-            # Versuche größere Schrift
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", logo_size // 4)
-        except:
-            # Fallback zu default font
-            font = ImageFont.load_default()
+        # Text "PISA" (größere Schrift, sonst default font)
+        font = _font(_FONT_PATH, logo_size // 4)
 
         text = "PISA"
         bbox = draw.textbbox((0, 0), text, font=font)
@@ -66,34 +90,38 @@ def generate_qr_code(url: str, with_logo: bool = False) -> BytesIO:
         logo_pos = ((img.size[0] - logo_size) // 2, (img.size[1] - logo_size) // 2)
         img.paste(logo, logo_pos)
 
-    # Save to BytesIO
+    if as_pil:
+        return img
+
+    # Save to BytesIO (1-Bit- bzw. Graustufen-PNG)
     buffer = BytesIO()
-    img.save(buffer, format='PNG')
+    img.save(buffer, format='PNG', optimize=True)
     buffer.seek(0)
 
     return buffer
 
 
-def generate_qr_code_with_instructions(url: str, scale_title: str) -> BytesIO:
+def generate_qr_code_with_instructions(url: str, scale_title: str, as_pil: bool = False):
     """
     Erstellt QR-Code mit Text-Anleitung drumherum.
 
     Args:
         url: URL zum Formular
         scale_title: Titel der Skala
+        as_pil: Ob das PIL-Image direkt (ohne PNG-Kodierung) zurückgegeben werden soll
 
     Returns:
-        BytesIO object mit PNG-Bild
+        BytesIO object mit PNG-Bild (bzw. PIL Image bei as_pil=True)
     """
 
-    # QR Code erstellen
-    qr_buffer = generate_qr_code(url, with_logo=True)
-    qr_img = Image.open(qr_buffer)
+    # QR Code erstellen (direkt als Image, ohne PNG-Umweg)
+    qr_img = generate_qr_code(url, with_logo=True, as_pil=True)
 
     # Größeres Bild mit Platz für Text
     width = 800
     height = 1000
-    canvas = Image.new('RGB', (width, height), 'white')
+    # Nur Graustufen (Schwarz/Grau/Weiß) → 'L' statt 'RGB'
+    canvas = Image.new('L', (width, height), 'white')
     draw = ImageDraw.Draw(canvas)
 
     # QR Code in Mitte
@@ -103,14 +131,9 @@ def generate_qr_code_with_instructions(url: str, scale_title: str) -> BytesIO:
     canvas.paste(qr_img, qr_pos)
 
     # Fonts
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 40)
-        text_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 24)
-        small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 18)
-    except:
-        title_font = ImageFont.load_default()
-        text_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
+    title_font = _font(_FONT_PATH, 40)
+    text_font = _font(_FONT_PATH, 24)
+    small_font = _font(_FONT_PATH, 18)
 
     # Title
     title = f"📊 {scale_title}"
@@ -136,9 +159,12 @@ def generate_qr_code_with_instructions(url: str, scale_title: str) -> BytesIO:
     wm_width = bbox[2] - bbox[0]
     draw.text(((width - wm_width) // 2, 950), watermark, fill='lightgray', font=small_font)
 
+    if as_pil:
+        return canvas
+
     # Save
     buffer = BytesIO()
-    canvas.save(buffer, format='PNG')
+    canvas.save(buffer, format='PNG', optimize=True)
     buffer.seek(0)
 
     return buffer
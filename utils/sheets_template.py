@@ -5,20 +5,90 @@ Erstellt Excel-Templates die in Google Sheets geöffnet werden können
 mit automatischen Formeln zur Auswertung.
 """
 
+from functools import lru_cache
 from typing import List, Dict
 from io import BytesIO
-import pandas as pd
 from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.chart import BarChart, Reference
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl.utils import get_column_letter
 
+# Stil-Objekte sind unveränderlich und werden von allen Templates geteilt
+_HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+_HEADER_FONT = Font(color="FFFFFF", bold=True, size=11)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+_TITLE_FONT = Font(size=16, bold=True, color="4472C4")
+_TITLE_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+_LABEL_FONT = Font(bold=True)
+
+_RED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+_YELLOW_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+_GREEN_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+
+_INSTRUCTION_TITLE_FONT = Font(size=14, bold=True, color="4472C4")
+_SECTION_FONT = Font(bold=True, size=12)
+_TIP_FONT = Font(italic=True)
+
+_METRIC_FONT = Font(size=14)
+_METRIC_BOLD_FONT = Font(size=14, bold=True)
+_RISK_FONT = Font(size=14, bold=True, color="DC3545")
+
+_AVERAGE_FORMAT = '0.00'
+_DIFFERENCE_FORMAT = '+0.00;-0.00;0.00'
+
+# Gleiche Styles als xlsxwriter-Format-Eigenschaften (Formate selbst gehören
+# zu einem Workbook und werden pro Datei aus diesen Dicts erzeugt)
+_XLSX_FORMATS = {
+    'header': {'bg_color': '#4472C4', 'font_color': '#FFFFFF', 'bold': True, 'font_size': 11,
+               'align': 'center', 'valign': 'vcenter', 'text_wrap': True},
+    'title': {'font_size': 16, 'bold': True, 'font_color': '#4472C4',
+              'align': 'center', 'valign': 'vcenter'},
+    'label': {'bold': True},
+    'plain': {},  # eigenes Format, damit das Spaltenformat nicht greift
+    'average': {'num_format': _AVERAGE_FORMAT},
+    'difference': {'num_format': _DIFFERENCE_FORMAT},
+    'metric_average': {'num_format': _AVERAGE_FORMAT, 'font_size': 14, 'bold': True},
+    'metric_pisa': {'num_format': _AVERAGE_FORMAT, 'font_size': 14},
+    'metric_difference': {'num_format': _DIFFERENCE_FORMAT, 'font_size': 14, 'bold': True},
+    'metric_risk': {'font_size': 14, 'bold': True, 'font_color': '#DC3545'},
+}
+
+
+def _instruction_rows(pisa_average: float) -> List[tuple]:
+    """Zeilen des Anleitung-Blatts als (Zelle, Text, Font oder None)."""
+    return [
+        ("A1", "📋 ANLEITUNG - So verwendest du dieses Template", _INSTRUCTION_TITLE_FONT),
+        ("A3", "1️⃣ Google Sheets Setup", _SECTION_FONT),
+        ("A4", "   • Lade diese Datei in Google Drive hoch", None),
+        ("A5", "   • Öffne mit Google Sheets", None),
+        ("A6", "   • Kopiere die Web-App URL aus dem HTML-Formular", None),
+        ("A8", "2️⃣ Datensammlung", _SECTION_FONT),
+        ("A9", "   • Teile den QR-Code oder Link mit deinen Schülern", None),
+        ("A10", "   • Schüler füllen das Formular auf ihren Handys aus", None),
+        ("A11", "   • Daten erscheinen automatisch im Tab 'Rohdaten'", None),
+        ("A13", "3️⃣ Auswertung", _SECTION_FONT),
+        ("A14", "   • Tab 'Auswertung': Siehe individuelle Schüler-Ergebnisse", None),
+        ("A15", "   • Tab 'Dashboard': Siehe Klassen-Überblick", None),
+        ("A16", "   • Rote Markierungen: Schüler unter Durchschnitt", None),
+        ("A18", "4️⃣ Interpretation", _SECTION_FONT),
+        ("A19", f"   • Werte > {pisa_average}: Überdurchschnittlich (im Vergleich zu PISA)", None),
+        ("A20", f"   • Werte < {pisa_average}: Unterdurchschnittlich", None),
+        ("A21", "   • Werte < 2.0: Risikogruppe (dringender Handlungsbedarf)", None),
+        ("A23", "5️⃣ Handlungsempfehlungen", _SECTION_FONT),
+        ("A24", "   • Identifiziere Schüler mit niedrigen Werten", None),
+        ("A25", "   • Entwickle gezielte Interventionen", None),
+        ("A26", "   • Führe Follow-up Befragungen durch", None),
+        ("A28", "💡 Tipp: Diese Skalen basieren auf PISA 2022 - wissenschaftlich validiert!", _TIP_FONT),
+    ]
+
 
 def create_excel_template(
     scale_name: str,
     scale_title: str,
     items: List[Dict],
-    pisa_average: float = 2.5
+    pisa_average: float = 2.5,
+    use_xlsxwriter: bool = False
 ) -> BytesIO:
     """
     Erstellt Excel-Template mit automatischer Auswertung.
@@ -28,24 +98,40 @@ def create_excel_template(
         scale_title: Deutscher Titel
         items: Liste von Items
         pisa_average: PISA Deutschland Durchschnitt für diese Skala
+        use_xlsxwriter: Datei mit xlsxwriter im constant_memory-Modus schreiben
+                        (schneller bei vielen Items; benötigt xlsxwriter)
 
     Returns:
-        BytesIO object mit Excel-Datei
+        BytesIO object mit Excel-Datei (gleiche Eingaben liefern die Datei aus dem Cache)
     """
+    # Aus items wird nur variable_name gelesen - das ist der Cache-Key
+    variable_names = tuple(
+        item.get('variable_name', f'Item_{idx}') for idx, item in enumerate(items, 1)
+    )
+    excel_bytes = _excel_template_bytes(
+        scale_name, scale_title, variable_names, pisa_average, use_xlsxwriter
+    )
+    # Eigener Puffer pro Aufruf, damit Aufrufer sich keine Leseposition teilen
+    return BytesIO(excel_bytes)
+
+
+@lru_cache(maxsize=64)
+def _excel_template_bytes(
+    scale_name: str,
+    scale_title: str,
+    variable_names: tuple,
+    pisa_average: float,
+    use_xlsxwriter: bool
+) -> bytes:
+    """Erzeugt das Excel-Template einmal je Eingabe-Kombination (als bytes)."""
+    items = [{'variable_name': name} for name in variable_names]
+    if use_xlsxwriter:
+        return _create_excel_template_xlsxwriter(scale_name, scale_title, items, pisa_average).getvalue()
+    return _create_excel_template_openpyxl(scale_name, scale_title, items, pisa_average).getvalue()
 
-    wb = Workbook()
-
-    # ===================================
-    # BLATT 1: ROHDATEN
-    # ===================================
-
-    ws_data = wb.active
-    ws_data.title = "Rohdaten"
 
-    # Header styles
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_font = Font(color="FFFFFF", bold=True, size=11)
-    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+def _build_data_sheet(ws_data, items: List[Dict]) -> None:
+    """BLATT 1: ROHDATEN - Kopfzeile mit Item-Spalten und Beispielzeile."""
 
     # Column headers
     headers = ["Zeitstempel", "Schüler Name"]
@@ -53,11 +139,15 @@ def create_excel_template(
         variable = item.get('variable_name', f'Item_{idx}')
         headers.append(f"{variable}")
 
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws_data.cell(row=1, column=col_idx, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
+    # Zeilenweise anhängen statt Zelle für Zelle adressieren
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws_data, value=header)
+        cell.fill = _HEADER_FILL
+        cell.font = _HEADER_FONT
+        cell.alignment = _HEADER_ALIGNMENT
+        header_cells.append(cell)
+    ws_data.append(header_cells)
 
     # Column widths
     ws_data.column_dimensions['A'].width = 20  # Zeitstempel
@@ -66,26 +156,27 @@ def create_excel_template(
         ws_data.column_dimensions[get_column_letter(col_idx)].width = 15
 
     # Add example rows with formulas
-    ws_data.cell(row=2, column=1, value="2024-01-15 10:30")
-    ws_data.cell(row=2, column=2, value="Beispiel Schüler 1")
-    for col_idx in range(3, len(headers) + 1):
-        ws_data.cell(row=2, column=col_idx, value="")
+    ws_data.append(["2024-01-15 10:30", "Beispiel Schüler 1"] + [""] * (len(headers) - 2))
 
     # Freeze panes
     ws_data.freeze_panes = "C2"
 
-    # ===================================
-    # BLATT 2: AUSWERTUNG
-    # ===================================
 
-    ws_eval = wb.create_sheet("Auswertung")
+def _build_eval_sheet(
+    ws_eval,
+    scale_name: str,
+    scale_title: str,
+    items: List[Dict],
+    pisa_average: float
+) -> None:
+    """BLATT 2: AUSWERTUNG - Info-Block und Formelzeile je Schüler."""
 
     # Title
     ws_eval.merge_cells('A1:F1')
     title_cell = ws_eval['A1']
     title_cell.value = f"📊 Auswertung: {scale_title}"
-    title_cell.font = Font(size=16, bold=True, color="4472C4")
-    title_cell.alignment = Alignment(horizontal="center", vertical="center")
+    title_cell.font = _TITLE_FONT
+    title_cell.alignment = _TITLE_ALIGNMENT
 
     # Info
     ws_eval['A3'] = "Skala:"
@@ -97,7 +188,7 @@ def create_excel_template(
 
     # Style info section
     for row in range(3, 6):
-        ws_eval.cell(row=row, column=1).font = Font(bold=True)
+        ws_eval.cell(row=row, column=1).font = _LABEL_FONT
 
     ws_eval['A7'] = ""  # Spacer
 
@@ -105,9 +196,9 @@ def create_excel_template(
     eval_headers = ["Schüler", "Durchschnitt", "Vergleich zu PISA", "Status", "Risiko?"]
     for col_idx, header in enumerate(eval_headers, 1):
         cell = ws_eval.cell(row=8, column=col_idx, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
+        cell.fill = _HEADER_FILL
+        cell.font = _HEADER_FONT
+        cell.alignment = _HEADER_ALIGNMENT
 
     # Column widths
     ws_eval.column_dimensions['A'].width = 25
@@ -137,93 +228,86 @@ def create_excel_template(
     # Risiko flag
     ws_eval['E9'] = '=IF(B9<2.0,"⚠️ JA","")'
 
-    # Add conditional formatting colors
-    red_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-    yellow_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-    green_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-
-    # Number formats
-    for row in range(9, 50):  # Prepare 50 rows
-        ws_eval.cell(row=row, column=2).number_format = '0.00'
-        ws_eval.cell(row=row, column=3).number_format = '+0.00;-0.00;0.00'
+    # Number formats: Beispielzeile direkt, weitere Zeilen über das
+    # Spaltenformat (gilt für neu angelegte Zellen, ohne 82 leere Zellen)
+    ws_eval['B9'].number_format = _AVERAGE_FORMAT
+    ws_eval['C9'].number_format = _DIFFERENCE_FORMAT
+    ws_eval.column_dimensions['B'].number_format = _AVERAGE_FORMAT
+    ws_eval.column_dimensions['C'].number_format = _DIFFERENCE_FORMAT
 
-    # ===================================
-    # BLATT 3: DASHBOARD
-    # ===================================
 
-    ws_dash = wb.create_sheet("Dashboard")
+def _build_dashboard_sheet(ws_dash, scale_title: str, pisa_average: float) -> None:
+    """BLATT 3: DASHBOARD - Klassen-Kennzahlen."""
 
     # Title
     ws_dash.merge_cells('A1:F1')
     title_cell = ws_dash['A1']
     title_cell.value = f"📈 Dashboard: {scale_title}"
-    title_cell.font = Font(size=16, bold=True, color="4472C4")
-    title_cell.alignment = Alignment(horizontal="center", vertical="center")
+    title_cell.font = _TITLE_FONT
+    title_cell.alignment = _TITLE_ALIGNMENT
 
     # Metrics
     ws_dash['A3'] = "📊 Klassendurchschnitt:"
     ws_dash['B3'] = '=AVERAGE(Auswertung!B9:B50)'
-    ws_dash['B3'].number_format = '0.00'
-    ws_dash['B3'].font = Font(size=14, bold=True)
+    ws_dash['B3'].number_format = _AVERAGE_FORMAT
+    ws_dash['B3'].font = _METRIC_BOLD_FONT
 
     ws_dash['A4'] = "🎯 PISA Deutschland:"
     ws_dash['B4'] = pisa_average
-    ws_dash['B4'].number_format = '0.00'
-    ws_dash['B4'].font = Font(size=14)
+    ws_dash['B4'].number_format = _AVERAGE_FORMAT
+    ws_dash['B4'].font = _METRIC_FONT
 
     ws_dash['A5'] = "📈 Differenz:"
     ws_dash['B5'] = '=B3-B4'
-    ws_dash['B5'].number_format = '+0.00;-0.00;0.00'
-    ws_dash['B5'].font = Font(size=14, bold=True)
+    ws_dash['B5'].number_format = _DIFFERENCE_FORMAT
+    ws_dash['B5'].font = _METRIC_BOLD_FONT
 
     ws_dash['A7'] = "⚠️ Risikoschüler (Durchschnitt < 2.0):"
     ws_dash['B7'] = '=COUNTIF(Auswertung!B9:B50,"<2.0")'
-    ws_dash['B7'].font = Font(size=14, bold=True, color="DC3545")
+    ws_dash['B7'].font = _RISK_FONT
 
     # Styling
     for row in range(3, 8):
-        ws_dash.cell(row=row, column=1).font = Font(bold=True)
+        ws_dash.cell(row=row, column=1).font = _LABEL_FONT
 
     # Column widths
     ws_dash.column_dimensions['A'].width = 35
     ws_dash.column_dimensions['B'].width = 15
 
+
+def _create_excel_template_openpyxl(
+    scale_name: str,
+    scale_title: str,
+    items: List[Dict],
+    pisa_average: float
+) -> BytesIO:
+    """openpyxl-Variante von create_excel_template."""
+
+    wb = Workbook()
+
+    # Alle Blätter in fester Reihenfolge anlegen, dann einzeln befüllen
+    ws_data = wb.active
+    ws_data.title = "Rohdaten"
+    ws_eval = wb.create_sheet("Auswertung")
+    ws_dash = wb.create_sheet("Dashboard")
+
+    _build_data_sheet(ws_data, items)
+    _build_eval_sheet(ws_eval, scale_name, scale_title, items, pisa_average)
+    _build_dashboard_sheet(ws_dash, scale_title, pisa_average)
+
     # ===================================
     # BLATT 4: ANLEITUNG
     # ===================================
 
     ws_help = wb.create_sheet("Anleitung")
 
-    instructions = [
-        ("A1", "📋 ANLEITUNG - So verwendest du dieses Template", Font(size=14, bold=True, color="4472C4")),
-        ("A3", "1️⃣ Google Sheets Setup", Font(bold=True, size=12)),
-        ("A4", "   • Lade diese Datei in Google Drive hoch", None),
-        ("A5", "   • Öffne mit Google Sheets", None),
-        ("A6", "   • Kopiere die Web-App URL aus dem HTML-Formular", None),
-        ("A8", "2️⃣ Datensammlung", Font(bold=True, size=12)),
-        ("A9", "   • Teile den QR-Code oder Link mit deinen Schülern", None),
-        ("A10", "   • Schüler füllen das Formular auf ihren Handys aus", None),
-        ("A11", "   • Daten erscheinen automatisch im Tab 'Rohdaten'", None),
-        ("A13", "3️⃣ Auswertung", Font(bold=True, size=12)),
-        ("A14", "   • Tab 'Auswertung': Siehe individuelle Schüler-Ergebnisse", None),
-        ("A15", "   • Tab 'Dashboard': Siehe Klassen-Überblick", None),
-        ("A16", "   • Rote Markierungen: Schüler unter Durchschnitt", None),
-        ("A18", "4️⃣ Interpretation", Font(bold=True, size=12)),
-        ("A19", f"   • Werte > {pisa_average}: Überdurchschnittlich (im Vergleich zu PISA)", None),
-        ("A20", f"   • Werte < {pisa_average}: Unterdurchschnittlich", None),
-        ("A21", "   • Werte < 2.0: Risikogruppe (dringender Handlungsbedarf)", None),
-        ("A23", "5️⃣ Handlungsempfehlungen", Font(bold=True, size=12)),
-        ("A24", "   • Identifiziere Schüler mit niedrigen Werten", None),
-        ("A25", "   • Entwickle gezielte Interventionen", None),
-        ("A26", "   • Führe Follow-up Befragungen durch", None),
-        ("A28", "💡 Tipp: Diese Skalen basieren auf PISA 2022 - wissenschaftlich validiert!", Font(italic=True)),
-    ]
+    instructions = _instruction_rows(pisa_average)
 
     for cell_ref, text, font_style in instructions:
-        cell = ws_dash[cell_ref] if 'ws_dash' in locals() else ws_help[cell_ref]
-        ws_help[cell_ref] = text
+        cell = ws_help[cell_ref]
+        cell.value = text
         if font_style:
-            ws_help[cell_ref].font = font_style
+            cell.font = font_style
 
     ws_help.column_dimensions['A'].width = 70
 
@@ -238,21 +322,128 @@ def create_excel_template(
     return excel_file
 
 
-def create_google_apps_script_template(scale_name: str, items: List[Dict]) -> str:
-    """
-    Generiert Google Apps Script Code zum Einfügen in Google Sheets.
+def _xlsx_font_properties(font: Font) -> Dict:
+    """Übersetzt einen openpyxl-Font in xlsxwriter-Format-Eigenschaften."""
+    properties = {}
+    if font.b:
+        properties['bold'] = True
+    if font.i:
+        properties['italic'] = True
+    if font.sz:
+        properties['font_size'] = font.sz
+    if font.color is not None and font.color.rgb:
+        properties['font_color'] = '#' + font.color.rgb[-6:]
+    return properties
 
-    Args:
-        scale_name: Skalen-Code
-        items: Liste von Items
 
-    Returns:
-        JavaScript code als String
+def _create_excel_template_xlsxwriter(
+    scale_name: str,
+    scale_title: str,
+    items: List[Dict],
+    pisa_average: float
+) -> BytesIO:
     """
+    xlsxwriter-Variante von create_excel_template (gleiche Blätter und Formeln).
 
-    item_columns = [item.get('variable_name', f'Item_{idx}') for idx, item in enumerate(items, 1)]
+    Im constant_memory-Modus hält xlsxwriter nur die aktuelle Zeile im
+    Speicher; jedes Blatt wird deshalb strikt zeilenweise geschrieben.
+    """
+    # Erst hier importieren: optional und nur für diesen Pfad gebraucht
+    try:
+        import xlsxwriter
+    except ImportError as e:
+        raise ImportError("xlsxwriter is required for use_xlsxwriter=True") from e
+
+    excel_file = BytesIO()
+    wb = xlsxwriter.Workbook(excel_file, {'constant_memory': True, 'in_memory': True})
+    fmt = {name: wb.add_format(properties) for name, properties in _XLSX_FORMATS.items()}
+
+    # BLATT 1: ROHDATEN
+    ws_data = wb.add_worksheet("Rohdaten")
+
+    headers = ["Zeitstempel", "Schüler Name"]
+    headers.extend(item.get('variable_name', f'Item_{idx}') for idx, item in enumerate(items, 1))
+
+    ws_data.set_column(0, 0, 20)  # Zeitstempel
+    ws_data.set_column(1, 1, 25)  # Name
+    if len(headers) > 2:
+        ws_data.set_column(2, len(headers) - 1, 15)
+
+    ws_data.write_row(0, 0, headers, fmt['header'])
+    ws_data.write_row(1, 0, ["2024-01-15 10:30", "Beispiel Schüler 1"])
+    ws_data.freeze_panes(1, 2)
+
+    # BLATT 2: AUSWERTUNG
+    ws_eval = wb.add_worksheet("Auswertung")
+
+    ws_eval.set_column('A:A', 25)
+    ws_eval.set_column('B:B', 15, fmt['average'])
+    ws_eval.set_column('C:C', 18, fmt['difference'])
+    ws_eval.set_column('D:D', 15)
+    ws_eval.set_column('E:E', 12)
+
+    ws_eval.merge_range('A1:F1', f"📊 Auswertung: {scale_title}", fmt['title'])
 
-    script = f"""
+    ws_eval.write('A3', "Skala:", fmt['label'])
+    ws_eval.write('B3', scale_name, fmt['plain'])
+    ws_eval.write('A4', "Anzahl Items:", fmt['label'])
+    ws_eval.write('B4', len(items), fmt['plain'])
+    ws_eval.write('A5', "PISA DE Durchschnitt:", fmt['label'])
+    ws_eval.write('B5', pisa_average, fmt['plain'])
+
+    ws_eval.write_row('A8', ["Schüler", "Durchschnitt", "Vergleich zu PISA", "Status", "Risiko?"],
+                      fmt['header'])
+
+    items_start_col = 3  # Column C in Rohdaten
+    items_end_col = items_start_col + len(items) - 1
+    ws_eval.write_formula('A9', '=Rohdaten!B2')
+    ws_eval.write_formula(
+        'B9',
+        f'=AVERAGE(Rohdaten!{get_column_letter(items_start_col)}2:{get_column_letter(items_end_col)}2)',
+        fmt['average']
+    )
+    ws_eval.write_formula('C9', '=B9-$B$5', fmt['difference'])
+    ws_eval.write_formula('D9', '=IF(C9>0,"Über PISA","Unter PISA")')
+    ws_eval.write_formula('E9', '=IF(B9<2.0,"⚠️ JA","")')
+
+    # BLATT 3: DASHBOARD
+    ws_dash = wb.add_worksheet("Dashboard")
+
+    ws_dash.set_column('A:A', 35)
+    ws_dash.set_column('B:B', 15)
+
+    ws_dash.merge_range('A1:F1', f"📈 Dashboard: {scale_title}", fmt['title'])
+
+    ws_dash.write('A3', "📊 Klassendurchschnitt:", fmt['label'])
+    ws_dash.write_formula('B3', '=AVERAGE(Auswertung!B9:B50)', fmt['metric_average'])
+    ws_dash.write('A4', "🎯 PISA Deutschland:", fmt['label'])
+    ws_dash.write('B4', pisa_average, fmt['metric_pisa'])
+    ws_dash.write('A5', "📈 Differenz:", fmt['label'])
+    ws_dash.write_formula('B5', '=B3-B4', fmt['metric_difference'])
+    ws_dash.write('A7', "⚠️ Risikoschüler (Durchschnitt < 2.0):", fmt['label'])
+    ws_dash.write_formula('B7', '=COUNTIF(Auswertung!B9:B50,"<2.0")', fmt['metric_risk'])
+
+    # BLATT 4: ANLEITUNG
+    ws_help = wb.add_worksheet("Anleitung")
+    ws_help.set_column('A:A', 70)
+
+    font_formats = {}
+    for cell_ref, text, font_style in _instruction_rows(pisa_average):
+        if font_style:
+            if id(font_style) not in font_formats:
+                font_formats[id(font_style)] = wb.add_format(_xlsx_font_properties(font_style))
+            ws_help.write(cell_ref, text, font_formats[id(font_style)])
+        else:
+            ws_help.write(cell_ref, text)
+
+    wb.close()
+    excel_file.seek(0)
+
+    return excel_file
+
+
+# Apps-Script-Vorlage (JS-Klammern verdoppelt für str.format)
+_APPS_SCRIPT_TEMPLATE = """
 // Google Apps Script für {scale_name}
 // Dieses Script empfängt Daten vom HTML-Formular und speichert sie in Google Sheets
 
@@ -301,7 +492,7 @@ function testScript() {{
       contents: JSON.stringify({{
         timestamp: new Date().toISOString(),
         student_name: 'Test Schüler',
-        {', '.join([f'{col}: "3"' for col in item_columns[:3]])}
+        {test_fields}
       }})
     }}
   }};
@@ -311,4 +502,25 @@ function testScript() {{
 }}
 """
 
-    return script
+
+def create_google_apps_script_template(scale_name: str, items: List[Dict]) -> str:
+    """
+    Generiert Google Apps Script Code zum Einfügen in Google Sheets.
+
+    Args:
+        scale_name: Skalen-Code
+        items: Liste von Items
+
+    Returns:
+        JavaScript code als String
+    """
+
+    item_columns = [item.get('variable_name', f'Item_{idx}') for idx, item in enumerate(items, 1)]
+    # Beispielwerte für die ersten drei Items in testScript()
+    test_fields = ', '.join(f'{col}: "3"' for col in item_columns[:3])
+
+    return _APPS_SCRIPT_TEMPLATE.format(
+        scale_name=scale_name,
+        item_columns=item_columns,
+        test_fields=test_fields
+    )
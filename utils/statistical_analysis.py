@@ -13,11 +13,27 @@ import pandas as pd
 from scipy import stats
 from typing import Tuple, Dict, List, Optional
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy fallback below
+    njit = None
+
+
+def _clean(data) -> np.ndarray:
+    """Float64 array of the non-missing values of a Series or array"""
+    if isinstance(data, pd.Series):
+        arr = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        arr = np.asarray(data, dtype=np.float64)
+    missing = np.isnan(arr)
+    return arr[~missing] if missing.any() else arr
+
 
 def compute_correlation_matrix(
     df: pd.DataFrame,
     method: str = 'pearson',
-    min_periods: int = 30
+    min_periods: int = 30,
+    dtype: np.dtype = np.float64
 ) -> pd.DataFrame:
     """
     Compute correlation matrix
@@ -26,17 +42,59 @@ def compute_correlation_matrix(
         df: Input dataframe with numeric columns
         method: 'pearson', 'spearman', or 'kendall'
         min_periods: Minimum observations required
+        dtype: np.float32 halves memory traffic for large matrices (about 6
+            significant digits); only applied to data without missing values
 
     Returns:
         Correlation matrix as DataFrame
     """
+    reduced_precision = np.dtype(dtype) != np.float64
+
+    if method == 'spearman' or (method == 'pearson' and reduced_precision):
+        # Ranks are computed in float64, Pearson input is converted once
+        arr = df.to_numpy(dtype=np.float64 if method == 'spearman' else dtype)
+
+        # Without missing values: one corrcoef call (on ranks for Spearman)
+        if len(arr) >= max(min_periods, 1) and not np.isnan(arr).any():
+            if method == 'spearman':
+                arr = stats.rankdata(arr, axis=0).astype(dtype, copy=False)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr = np.corrcoef(arr, rowvar=False, dtype=dtype)
+            corr = np.atleast_2d(np.clip(corr, -1.0, 1.0))
+            return pd.DataFrame(corr, index=df.columns, columns=df.columns)
+
     return df.corr(method=method, min_periods=min_periods)
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _spearman_fast_unique(x, y):
+        # Spearman's rho via the closed form; NaN signals ties (-> SciPy path)
+        n = x.size
+        order_x = np.argsort(x)
+        order_y = np.argsort(y)
+        for i in range(1, n):
+            if x[order_x[i]] == x[order_x[i - 1]] or y[order_y[i]] == y[order_y[i - 1]]:
+                return np.nan
+
+        rank_x = np.empty(n)
+        rank_y = np.empty(n)
+        for i in range(n):
+            rank_x[order_x[i]] = i
+            rank_y[order_y[i]] = i
+
+        d2 = 0.0
+        for i in range(n):
+            d = rank_x[i] - rank_y[i]
+            d2 += d * d
+        return 1.0 - 6.0 * d2 / (n * (n * n - 1.0))
+
+
 def correlation_with_pvalue(
     x: pd.Series,
     y: pd.Series,
-    method: str = 'pearson'
+    method: str = 'pearson',
+    want_pvalue: bool = True
 ) -> Tuple[float, float]:
     """
     Compute correlation coefficient and p-value
@@ -45,6 +103,8 @@ def correlation_with_pvalue(
         x: First variable
         y: Second variable
         method: 'pearson', 'spearman', or 'kendall'
+        want_pvalue: If False, a tie-free Spearman correlation skips SciPy and
+            the p-value (returned as NaN)
 
     Returns:
         (correlation_coefficient, p_value)
@@ -60,6 +120,13 @@ def correlation_with_pvalue(
     if method == 'pearson':
         return stats.pearsonr(x_clean, y_clean)
     elif method == 'spearman':
+        if not want_pvalue and njit is not None:
+            rho = _spearman_fast_unique(
+                x_clean.to_numpy(dtype=np.float64),
+                y_clean.to_numpy(dtype=np.float64)
+            )
+            if not np.isnan(rho):
+                return (rho, np.nan)
         return stats.spearmanr(x_clean, y_clean)
     elif method == 'kendall':
         return stats.kendalltau(x_clean, y_clean)
@@ -67,6 +134,107 @@ def correlation_with_pvalue(
         raise ValueError(f"Unknown method: {method}")
 
 
+def pairwise_correlation_with_pvalue(
+    X: np.ndarray,
+    y: np.ndarray,
+    method: str = 'pearson'
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Correlate every column of X with y in one vectorized pass
+
+    Missing values are dropped pairwise, i.e. each column uses only the rows
+    where both the column and y are present (same as correlation_with_pvalue).
+
+    Args:
+        X: 2D array (n_samples, n_variables) or DataFrame
+        y: 1D array (n_samples,) or Series
+        method: 'pearson', 'spearman', or 'kendall'
+
+    Returns:
+        (correlation_coefficients, p_values) as arrays of length n_variables
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if X.ndim == 1:
+        X = X[:, None]
+
+    if method not in ('pearson', 'spearman', 'kendall'):
+        raise ValueError(f"Unknown method: {method}")
+
+    valid = ~np.isnan(X) & ~np.isnan(y)[:, None]
+
+    # Kendall and Spearman with missing values need per-column ranking
+    if method == 'kendall' or (method == 'spearman' and not valid.all()):
+        r = np.full(X.shape[1], np.nan)
+        p = np.full(X.shape[1], np.nan)
+        for j in range(X.shape[1]):
+            mask = valid[:, j]
+            if mask.sum() >= 3:
+                r[j], p[j] = correlation_with_pvalue(
+                    pd.Series(X[mask, j]), pd.Series(y[mask]), method=method
+                )
+        return r, p
+
+    if method == 'spearman':
+        X = stats.rankdata(X, axis=0)
+        y = stats.rankdata(y)
+
+    # Masked sums so that each column only sees its own complete rows
+    n = valid.sum(axis=0)
+    Xm = np.where(valid, X, 0.0)
+    Ym = np.where(valid, y[:, None], 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_x = Xm.sum(axis=0) / n
+        mean_y = Ym.sum(axis=0) / n
+        dx = np.where(valid, Xm - mean_x, 0.0)
+        dy = np.where(valid, Ym - mean_y, 0.0)
+
+        r = (dx * dy).sum(axis=0) / np.sqrt((dx * dx).sum(axis=0) * (dy * dy).sum(axis=0))
+        r = np.clip(r, -1.0, 1.0)
+
+        # Two-sided p-value from the t distribution with n-2 degrees of freedom
+        df = n - 2
+        t = r * np.sqrt(df / ((1.0 - r) * (1.0 + r)))
+        p = 2 * stats.t.sf(np.abs(t), df)
+
+    r[n < 3] = np.nan
+    p[n < 3] = np.nan
+
+    return r, p
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _cohens_d_numba(group1, group2):
+        n1 = group1.size
+        n2 = group2.size
+
+        mean1 = 0.0
+        for i in range(n1):
+            mean1 += group1[i]
+        mean1 /= n1
+        mean2 = 0.0
+        for i in range(n2):
+            mean2 += group2[i]
+        mean2 /= n2
+
+        ss1 = 0.0
+        for i in range(n1):
+            ss1 += (group1[i] - mean1) ** 2
+        ss2 = 0.0
+        for i in range(n2):
+            ss2 += (group2[i] - mean2) ** 2
+
+        # Pooled standard deviation
+        pooled_std = np.sqrt((ss1 + ss2) / (n1 + n2 - 2))
+
+        if pooled_std == 0:
+            return np.nan
+
+        return (mean1 - mean2) / pooled_std
+
+
 def cohens_d(group1: np.ndarray, group2: np.ndarray) -> float:
     """
     Calculate Cohen's d effect size for two groups
@@ -88,16 +256,66 @@ def cohens_d(group1: np.ndarray, group2: np.ndarray) -> float:
     if n1 < 2 or n2 < 2:
         return np.nan
 
-    var1 = np.var(group1, ddof=1)
-    var2 = np.var(group2, ddof=1)
+    if njit is not None:
+        return float(_cohens_d_numba(
+            np.ascontiguousarray(group1, dtype=np.float64),
+            np.ascontiguousarray(group2, dtype=np.float64)
+        ))
 
-    # Pooled standard deviation
-    pooled_std = np.sqrt(((n1-1)*var1 + (n2-1)*var2) / (n1+n2-2))
+    group1 = np.asarray(group1, dtype=np.float64)
+    group2 = np.asarray(group2, dtype=np.float64)
+    mean1 = np.add.reduce(group1) / n1
+    mean2 = np.add.reduce(group2) / n2
+
+    # Pooled standard deviation (means reused for the sums of squares)
+    ss1 = np.add.reduce((group1 - mean1) ** 2)
+    ss2 = np.add.reduce((group2 - mean2) ** 2)
+    pooled_std = np.sqrt((ss1 + ss2) / (n1+n2-2))
 
     if pooled_std == 0:
         return np.nan
 
-    return (np.mean(group1) - np.mean(group2)) / pooled_std
+    return (mean1 - mean2) / pooled_std
+
+
+def pairwise_cohens_d(groups: Dict[str, pd.Series]) -> pd.DataFrame:
+    """
+    Calculate Cohen's d for every pair of groups at once
+
+    Means and sums of squares are computed once per group; the (k, k) matrix
+    is then formed by broadcasting instead of k² cohens_d calls.
+
+    Args:
+        groups: Dictionary mapping group names to Series
+
+    Returns:
+        DataFrame where entry (i, j) is cohens_d(group_i, group_j);
+        NaN for groups with fewer than 2 values
+    """
+    group_arrays = [_clean(g) for g in groups.values()]
+    k = len(group_arrays)
+
+    sizes = np.fromiter(map(len, group_arrays), dtype=np.float64, count=k)
+    means = np.fromiter(
+        (arr.mean() if len(arr) else np.nan for arr in group_arrays), dtype=np.float64, count=k
+    )
+    sum_sq = np.fromiter(
+        (np.einsum('i,i->', arr - m, arr - m) for arr, m in zip(group_arrays, means)),
+        dtype=np.float64, count=k
+    )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Pooled standard deviation for every pair
+        pooled_std = np.sqrt((sum_sq[:, None] + sum_sq[None, :]) / (sizes[:, None] + sizes[None, :] - 2))
+        d = (means[:, None] - means[None, :]) / pooled_std
+
+    too_small = sizes < 2
+    d[too_small, :] = np.nan
+    d[:, too_small] = np.nan
+    d[pooled_std == 0] = np.nan
+
+    names = list(groups.keys())
+    return pd.DataFrame(d, index=names, columns=names)
 
 
 def eta_squared(groups: List[np.ndarray]) -> float:
@@ -115,65 +333,121 @@ def eta_squared(groups: List[np.ndarray]) -> float:
     Returns:
         Eta-squared value
     """
-    # Flatten all groups
-    all_data = np.concatenate(groups)
-    grand_mean = np.mean(all_data)
+    # Group sizes and means; the grand mean follows from them
+    sizes = np.fromiter(map(len, groups), dtype=np.intp, count=len(groups))
+    means = np.fromiter(map(np.mean, groups), dtype=np.float64, count=len(groups))
+    grand_mean = np.dot(sizes, means) / sizes.sum()
 
     # Sum of squares between groups
-    ss_between = sum([
-        len(g) * (np.mean(g) - grand_mean)**2
-        for g in groups
-    ])
+    ss_between = np.dot(sizes, (means - grand_mean)**2)
 
-    # Total sum of squares
-    ss_total = sum([(x - grand_mean)**2 for x in all_data])
+    # Total sum of squares = within-group + between-group, group by group
+    # (no concatenated copy of all observations)
+    ss_within = sum(np.dot(g - m, g - m) for g, m in zip(groups, means))
+    ss_total = ss_within + ss_between
 
-    if ss_total == 0:
+    # Constant data: treat rounding noise in the group means as zero variance
+    noise = sizes.sum() * (16 * np.finfo(np.float64).eps * np.abs(means).max())**2
+    if ss_total <= noise:
         return np.nan
 
     return ss_between / ss_total
 
 
+def _eta_squared_soa(values: np.ndarray, codes: np.ndarray, sizes: np.ndarray) -> Tuple[float, np.ndarray]:
+    """
+    Eta-squared for data laid out as one value buffer plus group codes
+
+    Args:
+        values: All observations, concatenated group by group
+        codes: Group index (0..k-1) of each observation
+        sizes: Number of observations per group
+
+    Returns:
+        (eta_squared, group_means)
+    """
+    means = np.bincount(codes, weights=values, minlength=len(sizes)) / sizes
+    grand_mean = values.mean()
+
+    ss_between = np.dot(sizes, (means - grand_mean)**2)
+    ss_total = np.sum((values - grand_mean)**2)
+
+    if ss_total == 0:
+        return np.nan, means
+
+    return ss_between / ss_total, means
+
+
+# Shapiro-Wilk is only reliable (and cheap) up to this sample size
+SHAPIRO_MAX_N = 5000
+
+
 def check_normality(data: pd.Series) -> Dict[str, any]:
     """
     Check normality assumptions using multiple tests
 
+    Shapiro-Wilk is skipped for n > SHAPIRO_MAX_N (its p-values are not
+    reliable there); Anderson-Darling is used alongside KS instead and the
+    shapiro_* entries are NaN.
+
     Args:
         data: Series to test for normality
 
     Returns:
         Dictionary with test results
     """
-    clean_data = data.dropna()
+    arr = _clean(data)
+    n = len(arr)
 
-    if len(clean_data) < 3:
+    if n < 3:
         return {
             'shapiro_statistic': np.nan,
             'shapiro_pvalue': np.nan,
             'ks_statistic': np.nan,
             'ks_pvalue': np.nan,
+            'anderson_statistic': np.nan,
             'is_normal': False,
-            'n': len(clean_data)
+            'n': n
         }
 
-    # Shapiro-Wilk test (best for n < 5000)
-    shapiro_stat, shapiro_p = stats.shapiro(clean_data)
-
-    # Kolmogorov-Smirnov test
-    # Standardize data for KS test
-    standardized = (clean_data - clean_data.mean()) / clean_data.std()
-    ks_stat, ks_p = stats.kstest(standardized, 'norm')
+    # Kolmogorov-Smirnov test against N(mean, SD) of the data; passing loc/scale
+    # to the CDF avoids allocating a standardized copy
+    mu = arr.mean()
+    sigma = arr.std(ddof=1)
+    ks_stat, ks_p = stats.kstest(arr, 'norm', args=(mu, sigma))
+
+    if n <= SHAPIRO_MAX_N:
+        # Shapiro-Wilk test (best for n < 5000)
+        shapiro_stat, shapiro_p = stats.shapiro(arr)
+        anderson_stat = np.nan
+        is_normal = shapiro_p > 0.05 and ks_p > 0.05
+    else:
+        shapiro_stat, shapiro_p = np.nan, np.nan
+        anderson_stat, anderson_normal = _anderson_normal(arr)
+        is_normal = anderson_normal and ks_p > 0.05
 
     return {
         'shapiro_statistic': shapiro_stat,
         'shapiro_pvalue': shapiro_p,
         'ks_statistic': ks_stat,
         'ks_pvalue': ks_p,
-        'is_normal': shapiro_p > 0.05 and ks_p > 0.05,
-        'n': len(clean_data)
+        'anderson_statistic': anderson_stat,
+        'is_normal': is_normal,
+        'n': n
     }
 
 
+def _anderson_normal(arr: np.ndarray) -> Tuple[float, bool]:
+    """Anderson-Darling statistic and whether normality holds at the 5% level"""
+    try:
+        result = stats.anderson(arr, 'norm', method='interpolate')
+        return result.statistic, result.pvalue > 0.05
+    except TypeError:  # SciPy < 1.17 has no method argument
+        result = stats.anderson(arr, 'norm')
+        critical_5pct = result.critical_values[list(result.significance_level).index(5.0)]
+        return result.statistic, result.statistic < critical_5pct
+
+
 def independent_ttest(
     group1: pd.Series,
     group2: pd.Series,
@@ -190,8 +464,8 @@ def independent_ttest(
     Returns:
         Dictionary with test results
     """
-    g1 = group1.dropna().values
-    g2 = group2.dropna().values
+    g1 = _clean(group1)
+    g2 = _clean(group2)
 
     if len(g1) < 2 or len(g2) < 2:
         return {
@@ -207,19 +481,31 @@ def independent_ttest(
             'significant': False
         }
 
-    t_stat, p_val = stats.ttest_ind(g1, g2, equal_var=equal_var)
-    d = cohens_d(g1, g2)
+    # Reduce each group once; test statistic and effect size reuse the results
+    n1, n2 = len(g1), len(g2)
+    mean1, mean2 = g1.mean(), g2.mean()
+    var1, var2 = g1.var(ddof=1), g2.var(ddof=1)
+    std1, std2 = np.sqrt(var1), np.sqrt(var2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat, p_val = stats.ttest_ind_from_stats(
+            mean1, std1, n1, mean2, std2, n2, equal_var=equal_var
+        )
+
+    # Cohen's d with pooled standard deviation
+    pooled_std = np.sqrt(((n1-1)*var1 + (n2-1)*var2) / (n1+n2-2))
+    d = (mean1 - mean2) / pooled_std if pooled_std > 0 else np.nan
 
     return {
         't_statistic': t_stat,
         'p_value': p_val,
         'cohens_d': d,
-        'mean_g1': np.mean(g1),
-        'mean_g2': np.mean(g2),
-        'std_g1': np.std(g1, ddof=1),
-        'std_g2': np.std(g2, ddof=1),
-        'n_g1': len(g1),
-        'n_g2': len(g2),
+        'mean_g1': mean1,
+        'mean_g2': mean2,
+        'std_g1': std1,
+        'std_g2': std2,
+        'n_g1': n1,
+        'n_g2': n2,
         'significant': p_val < 0.05
     }
 
@@ -235,7 +521,7 @@ def one_way_anova(groups: Dict[str, pd.Series]) -> Dict[str, any]:
         Dictionary with test results
     """
     # Convert to arrays and remove NaN
-    group_arrays = [g.dropna().values for g in groups.values()]
+    group_arrays = [_clean(g) for g in groups.values()]
     group_names = list(groups.keys())
 
     # Check minimum requirements
@@ -258,22 +544,21 @@ def one_way_anova(groups: Dict[str, pd.Series]) -> Dict[str, any]:
             'significant': False
         }
 
-    # Perform ANOVA
-    f_stat, p_val = stats.f_oneway(*group_arrays)
-    eta2 = eta_squared(group_arrays)
+    # One contiguous value buffer plus integer group codes
+    sizes = np.fromiter((len(arr) for arr in group_arrays), dtype=np.intp, count=len(group_arrays))
+    values = np.concatenate(group_arrays)
+    codes = np.repeat(np.arange(len(group_arrays), dtype=np.int32), sizes)
 
-    # Calculate group means
-    group_means = {
-        name: np.mean(arr)
-        for name, arr in zip(group_names, group_arrays)
-    }
+    # Perform ANOVA (per-group views into the shared buffer)
+    f_stat, p_val = stats.f_oneway(*np.split(values, np.cumsum(sizes)[:-1]))
+    eta2, means = _eta_squared_soa(values, codes, sizes)
 
     return {
         'f_statistic': f_stat,
         'p_value': p_val,
         'eta_squared': eta2,
-        'group_means': group_means,
-        'group_sizes': {name: len(arr) for name, arr in zip(group_names, group_arrays)},
+        'group_means': dict(zip(group_names, means)),
+        'group_sizes': dict(zip(group_names, sizes.tolist())),
         'significant': p_val < 0.05
     }
 
@@ -290,7 +575,7 @@ def levene_test(groups: Dict[str, pd.Series]) -> Dict[str, any]:
     Returns:
         Dictionary with test results
     """
-    group_arrays = [g.dropna().values for g in groups.values()]
+    group_arrays = [_clean(g) for g in groups.values()]
 
     if len(group_arrays) < 2 or any(len(g) < 2 for g in group_arrays):
         return {
@@ -325,30 +610,33 @@ def tukey_hsd(groups: Dict[str, pd.Series]) -> Optional[pd.DataFrame]:
     except ImportError:
         return None
 
-    # Prepare data for Tukey HSD
-    all_data = []
-    all_groups = []
-
-    for group_name, data in groups.items():
-        clean_data = data.dropna()
-        all_data.extend(clean_data.values)
-        all_groups.extend([group_name] * len(clean_data))
+    # Prepare data for Tukey HSD: one float buffer plus integer group codes
+    group_names = np.asarray(list(groups.keys()), dtype=object)
+    group_arrays = [_clean(data) for data in groups.values()]
+    sizes = np.fromiter((len(arr) for arr in group_arrays), dtype=np.intp, count=len(group_arrays))
 
-    if len(set(all_groups)) < 2:
+    if np.count_nonzero(sizes) < 2:
         return None
 
+    all_data = np.concatenate(group_arrays)
+    all_codes = np.repeat(np.arange(len(group_arrays), dtype=np.int32), sizes)
+
     # Perform Tukey HSD
-    tukey_result = pairwise_tukeyhsd(all_data, all_groups, alpha=0.05)
+    tukey_result = pairwise_tukeyhsd(all_data, all_codes, alpha=0.05)
+
+    # Pairs are ordered like np.triu_indices over the (sorted) unique codes
+    idx1, idx2 = np.triu_indices(len(tukey_result.groupsunique), 1)
+    labels = group_names[tukey_result.groupsunique.astype(np.intp)]
 
     # Convert to DataFrame
     result_df = pd.DataFrame({
-        'Group 1': tukey_result.groupsunique[tukey_result._results_table.data[1:, 0].astype(int)],
-        'Group 2': tukey_result.groupsunique[tukey_result._results_table.data[1:, 1].astype(int)],
-        'Mean Diff': tukey_result._results_table.data[1:, 2],
-        'Lower CI': tukey_result._results_table.data[1:, 3],
-        'Upper CI': tukey_result._results_table.data[1:, 4],
-        'p-value': tukey_result._results_table.data[1:, 5],
-        'Reject': tukey_result._results_table.data[1:, 6]
+        'Group 1': labels[idx1],
+        'Group 2': labels[idx2],
+        'Mean Diff': tukey_result.meandiffs,
+        'Lower CI': tukey_result.confint[:, 0],
+        'Upper CI': tukey_result.confint[:, 1],
+        'p-value': tukey_result.pvalues,
+        'Reject': tukey_result.reject
     })
 
     return result_df
@@ -3,11 +3,77 @@ Storytelling Helper Functions
 Generiert kinderleichte Erklärungen für PISA-Daten
 """
 
+from bisect import bisect_left
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 import streamlit as st
 
 
+# Bereichsgrenzen für interpret_oecd_score (bisect_left): 0 = deutlich unter,
+# 1 = etwas unter, 2 = beim Durchschnitt, 3 = etwas über, 4 = deutlich über dem
+# OECD-Durchschnitt. Die obere Grenze von "beim Durchschnitt" ist exklusiv
+# (|value| < 0.2), daher der nächstkleinere Float-Wert unter 0.2.
+_OECD_BINS = (-0.5, -0.2, float(np.nextafter(0.2, -np.inf)), 0.5)
+
+_OECD_NEAR = (
+    '🟢',
+    '**Fast genau beim OECD-Durchschnitt!**',
+    'Deutsche Schüler liegen genau im internationalen Durchschnitt.'
+)
+
+# (color, text, detail), indiziert über [is_anxiety][Bereich]
+_OECD_TABLE = (
+    (
+        (
+            '🔴',
+            '**Deutlich unter dem OECD-Durchschnitt!**',
+            'Deutsche Schüler liegen deutlich unter dem internationalen Durchschnitt. Hier können Interventionen helfen!'
+        ),
+        (
+            '🟡',
+            '**Etwas unter dem OECD-Durchschnitt**',
+            'Deutsche Schüler liegen etwas unter dem internationalen Durchschnitt.'
+        ),
+        _OECD_NEAR,
+        (
+            '🟢',
+            '**Etwas über dem OECD-Durchschnitt**',
+            'Deutsche Schüler liegen etwas über dem internationalen Durchschnitt.'
+        ),
+        (
+            '🟢',
+            '**Deutlich über dem OECD-Durchschnitt!**',
+            'Deutsche Schüler liegen deutlich über dem internationalen Durchschnitt. Super!'
+        ),
+    ),
+    (
+        (
+            '🟢',
+            '**Deutlich unter dem OECD-Durchschnitt!**',
+            'Deutsche Schüler haben viel weniger Angst als der internationale Durchschnitt. Super!'
+        ),
+        (
+            '🟢',
+            '**Etwas unter dem OECD-Durchschnitt**',
+            'Deutsche Schüler haben etwas weniger Angst als der internationale Durchschnitt - das ist gut!'
+        ),
+        _OECD_NEAR,
+        (
+            '🟡',
+            '**Etwas über dem OECD-Durchschnitt**',
+            'Deutsche Schüler haben etwas mehr Angst als der internationale Durchschnitt.'
+        ),
+        (
+            '🔴',
+            '**Deutlich über dem OECD-Durchschnitt!**',
+            'Deutsche Schüler haben mehr Angst als der internationale Durchschnitt. Hier besteht Handlungsbedarf!'
+        ),
+    ),
+)
+
+
 def interpret_oecd_score(value: float, scale_name: str = "Variable") -> dict:
     """
     Interpretiert einen OECD-standardisierten Score
@@ -21,64 +87,27 @@ def interpret_oecd_score(value: float, scale_name: str = "Variable") -> dict:
     """
     is_anxiety = "ANX" in scale_name.upper() or "ANGST" in scale_name.upper()
 
-    if abs(value) < 0.2:
-        return {
-            'color': '🟢',
-            'text': '**Fast genau beim OECD-Durchschnitt!**',
-            'detail': f'Deutsche Schüler liegen genau im internationalen Durchschnitt.'
-        }
-    elif value > 0.5:
-        if is_anxiety:
-            return {
-                'color': '🔴',
-                'text': '**Deutlich über dem OECD-Durchschnitt!**',
-                'detail': 'Deutsche Schüler haben mehr Angst als der internationale Durchschnitt. Hier besteht Handlungsbedarf!'
-            }
-        else:
-            return {
-                'color': '🟢',
-                'text': '**Deutlich über dem OECD-Durchschnitt!**',
-                'detail': 'Deutsche Schüler liegen deutlich über dem internationalen Durchschnitt. Super!'
-            }
-    elif value > 0:
-        if is_anxiety:
-            return {
-                'color': '🟡',
-                'text': '**Etwas über dem OECD-Durchschnitt**',
-                'detail': 'Deutsche Schüler haben etwas mehr Angst als der internationale Durchschnitt.'
-            }
-        else:
-            return {
-                'color': '🟢',
-                'text': '**Etwas über dem OECD-Durchschnitt**',
-                'detail': 'Deutsche Schüler liegen etwas über dem internationalen Durchschnitt.'
-            }
-    elif value > -0.5:
-        if is_anxiety:
-            return {
-                'color': '🟢',
-                'text': '**Etwas unter dem OECD-Durchschnitt**',
-                'detail': 'Deutsche Schüler haben etwas weniger Angst als der internationale Durchschnitt - das ist gut!'
-            }
-        else:
-            return {
-                'color': '🟡',
-                'text': '**Etwas unter dem OECD-Durchschnitt**',
-                'detail': 'Deutsche Schüler liegen etwas unter dem internationalen Durchschnitt.'
-            }
-    else:
-        if is_anxiety:
-            return {
-                'color': '🟢',
-                'text': '**Deutlich unter dem OECD-Durchschnitt!**',
-                'detail': 'Deutsche Schüler haben viel weniger Angst als der internationale Durchschnitt. Super!'
-            }
-        else:
-            return {
-                'color': '🔴',
-                'text': '**Deutlich unter dem OECD-Durchschnitt!**',
-                'detail': 'Deutsche Schüler liegen deutlich unter dem internationalen Durchschnitt. Hier können Interventionen helfen!'
-            }
+    color, text, detail = _OECD_TABLE[is_anxiety][bisect_left(_OECD_BINS, value)]
+    return {'color': color, 'text': text, 'detail': detail}
+
+
+# Emoji-Skalen für die Positionen -2 ... +2
+_EMOJI_SCALES = {
+    'anxiety': ("😊😊", "🙂", "😐", "😟", "😰😰"),
+    'confidence': ("😔😔", "😕", "😐", "🙂", "😊😊"),
+}
+
+
+def _build_emoji_templates(emojis: tuple) -> tuple:
+    """Vorformatierte Skalen: eine pro hervorgehobener Position plus eine ohne Markierung"""
+    highlighted = tuple(
+        "".join(f"**[{e}]** " if i == j else f"{e} " for i, e in enumerate(emojis))
+        for j in range(len(emojis))
+    )
+    return highlighted + ("".join(f"{e} " for e in emojis),)
+
+
+_EMOJI_TEMPLATES = {name: _build_emoji_templates(emojis) for name, emojis in _EMOJI_SCALES.items()}
 
 
 def create_emoji_scale(value: float, scale_type: str = 'anxiety') -> str:
@@ -92,53 +121,37 @@ def create_emoji_scale(value: float, scale_type: str = 'anxiety') -> str:
     Returns:
         Formatierter String mit Emojis
     """
+    templates = _EMOJI_TEMPLATES['anxiety' if scale_type == 'anxiety' else 'confidence']
     value_pos = max(-2, min(2, value))
-    scale_positions = [-2, -1, 0, 1, 2]
-
-    if scale_type == 'anxiety':
-        emojis = ["😊😊", "🙂", "😐", "😟", "😰😰"]
-    else:  # confidence
-        emojis = ["😔😔", "😕", "😐", "🙂", "😊😊"]
-
-    scale_str = ""
-    for i, pos in enumerate(scale_positions):
-        if abs(value_pos - pos) < 0.3:
-            scale_str += f"**[{emojis[i]}]** "
-        else:
-            scale_str += f"{emojis[i]} "
-
-    return scale_str
 
+    # Nächstgelegene Position; markiert wird nur, wenn der Wert nah genug dran liegt
+    nearest = round(value_pos)
+    if abs(value_pos - nearest) < 0.3:
+        return templates[nearest + 2]
+    return templates[-1]
 
-def interpret_std(std_value: float) -> dict:
-    """
-    Interpretiert Standardabweichung
 
-    Args:
-        std_value: Standardabweichung
+# (text, detail, visual) für interpret_std: moderate, große, sehr große Unterschiede
+_STD_BINS = (1.0, 1.3)
 
-    Returns:
-        Dictionary mit text und detail
-    """
-    if std_value > 1.3:
-        return {
-            'text': '**Sehr große Unterschiede!**',
-            'detail': 'Manche Schüler sind total entspannt, andere sehr ängstlich. Die Gruppe ist sehr heterogen.',
-            'visual': """
+_STD_INTERPRETATIONS = (
+    (
+        '**Moderate Unterschiede**',
+        'Die Schüler sind sich relativ ähnlich.',
+        """
         ```
         Entspannt                           Ängstlich
         |                                         |
-        👤              👤👤👤              👤👤
-        ← Wenige hier   Viele hier   Viele hier →
+               👤👤👤👤👤👤👤
+               ← Die meisten hier →
         ```
-        → Das Schulsystem erzeugt **sehr unterschiedliche** Ergebnisse!
+        → Die meisten Schüler sind sich ähnlich.
+        """
+    ),
+    (
+        '**Große Unterschiede**',
+        'Es gibt deutliche Unterschiede zwischen den Schülern - manche ängstlich, manche entspannt.',
         """
-        }
-    elif std_value > 1.0:
-        return {
-            'text': '**Große Unterschiede**',
-            'detail': 'Es gibt deutliche Unterschiede zwischen den Schülern - manche ängstlich, manche entspannt.',
-            'visual': """
         ```
         Entspannt                           Ängstlich
         |                                         |
@@ -147,21 +160,67 @@ def interpret_std(std_value: float) -> dict:
         ```
         → Es gibt verschiedene Gruppen von Schülern.
         """
-        }
-    else:
-        return {
-            'text': '**Moderate Unterschiede**',
-            'detail': 'Die Schüler sind sich relativ ähnlich.',
-            'visual': """
+    ),
+    (
+        '**Sehr große Unterschiede!**',
+        'Manche Schüler sind total entspannt, andere sehr ängstlich. Die Gruppe ist sehr heterogen.',
+        """
         ```
         Entspannt                           Ängstlich
         |                                         |
-               👤👤👤👤👤👤👤
-               ← Die meisten hier →
+        👤              👤👤👤              👤👤
+        ← Wenige hier   Viele hier   Viele hier →
         ```
-        → Die meisten Schüler sind sich ähnlich.
+        → Das Schulsystem erzeugt **sehr unterschiedliche** Ergebnisse!
         """
-        }
+    ),
+)
+
+
+def interpret_std(std_value: float) -> dict:
+    """
+    Interpretiert Standardabweichung
+
+    Args:
+        std_value: Standardabweichung
+
+    Returns:
+        Dictionary mit text und detail
+    """
+    text, detail, visual = _STD_INTERPRETATIONS[bisect_left(_STD_BINS, std_value)]
+
+    return {'text': text, 'detail': detail, 'visual': visual}
+
+
+# (emoji, text, detail, status) für interpret_confidence_score, von negativ nach positiv
+_CONFIDENCE_BINS = (-0.5, 0.0, 0.5)
+
+_CONFIDENCE_INTERPRETATIONS = (
+    (
+        '🔴',
+        '**Achtung! Angst überwiegt deutlich!**',
+        'Deutsche Schüler haben mehr Angst als Selbstvertrauen. Hier sollten Interventionen ansetzen!',
+        'error'
+    ),
+    (
+        '🟡',
+        '**Ausgeglichen mit leichtem Angst-Überhang**',
+        'Selbstvertrauen und Angst halten sich fast die Waage, mit leichter Tendenz zur Angst.',
+        'warning'
+    ),
+    (
+        '🟢',
+        '**Gut! Selbstvertrauen überwiegt leicht**',
+        'Deutsche Schüler haben etwas mehr Selbstvertrauen als Angst.',
+        'success'
+    ),
+    (
+        '🟢',
+        '**Super! Selbstvertrauen überwiegt deutlich!**',
+        'Deutsche Schüler haben mehr Selbstvertrauen als Angst. Das ist eine gute Grundlage für Lernerfolg!',
+        'success'
+    ),
+)
 
 
 def interpret_confidence_score(confidence_score: float) -> dict:
@@ -174,36 +233,21 @@ def interpret_confidence_score(confidence_score: float) -> dict:
     Returns:
         Dictionary mit emoji, text, detail
     """
-    if confidence_score > 0.5:
-        return {
-            'emoji': '🟢',
-            'text': '**Super! Selbstvertrauen überwiegt deutlich!**',
-            'detail': 'Deutsche Schüler haben mehr Selbstvertrauen als Angst. Das ist eine gute Grundlage für Lernerfolg!',
-            'status': 'success'
-        }
-    elif confidence_score > 0:
-        return {
-            'emoji': '🟢',
-            'text': '**Gut! Selbstvertrauen überwiegt leicht**',
-            'detail': 'Deutsche Schüler haben etwas mehr Selbstvertrauen als Angst.',
-            'status': 'success'
-        }
-    elif confidence_score > -0.5:
-        return {
-            'emoji': '🟡',
-            'text': '**Ausgeglichen mit leichtem Angst-Überhang**',
-            'detail': 'Selbstvertrauen und Angst halten sich fast die Waage, mit leichter Tendenz zur Angst.',
-            'status': 'warning'
-        }
-    else:
-        return {
-            'emoji': '🔴',
-            'text': '**Achtung! Angst überwiegt deutlich!**',
-            'detail': 'Deutsche Schüler haben mehr Angst als Selbstvertrauen. Hier sollten Interventionen ansetzen!',
-            'status': 'error'
-        }
+    emoji, text, detail, status = _CONFIDENCE_INTERPRETATIONS[bisect_left(_CONFIDENCE_BINS, confidence_score)]
+    return {'emoji': emoji, 'text': text, 'detail': detail, 'status': status}
+
 
+# Balken für create_balance_visualization (Länge 0-20)
+_BALANCE_BARS = tuple("█" * n for n in range(21))
 
+
+def _balance_bar(value: float) -> str:
+    """Balken mit Länge |value| * 10 (mindestens 1)"""
+    length = max(1, int(abs(value) * 10))
+    return _BALANCE_BARS[length] if length < len(_BALANCE_BARS) else "█" * length
+
+
+@lru_cache(maxsize=256)
 def create_balance_visualization(matheff: float, anxmat: float) -> str:
     """
     Erstellt eine Balance-Waage Visualisierung
@@ -215,8 +259,8 @@ def create_balance_visualization(matheff: float, anxmat: float) -> str:
     Returns:
         Formatierter String mit Balance-Darstellung
     """
-    matheff_bar = "█" * max(1, int(abs(matheff) * 10))
-    anxmat_bar = "█" * max(1, int(abs(anxmat) * 10))
+    matheff_bar = _balance_bar(matheff)
+    anxmat_bar = _balance_bar(anxmat)
 
     return f"""
     ```
@@ -267,6 +311,13 @@ def create_recommendations(mean_anxmat: float, mean_matheff: float,
     Returns:
         Liste mit Empfehlungen
     """
+    return list(_recommendations(mean_anxmat, mean_matheff, std_anxmat, corr))
+
+
+@lru_cache(maxsize=256)
+def _recommendations(mean_anxmat: float, mean_matheff: float,
+                     std_anxmat: float, corr: float) -> tuple:
+    """Gecachte Empfehlungen als Tupel (create_recommendations gibt eine Kopie als Liste zurück)"""
     recommendations = []
 
     if mean_anxmat > 0.3:
@@ -284,7 +335,11 @@ def create_recommendations(mean_anxmat: float, mean_matheff: float,
     if not recommendations:
         recommendations.append("🎯 **Allgemein**: Ausgeglichene Förderung von Selbstvertrauen und Angstbewältigung")
 
-    return recommendations
+    return tuple(recommendations)
+
+
+# Skalen, deren Standardabweichung in display_simple_explanation angezeigt wird
+_STD_COLUMNS = ('ANXMAT', 'MATHEFF')
 
 
 def display_simple_explanation(df: pd.DataFrame,
@@ -306,9 +361,15 @@ def display_simple_explanation(df: pd.DataFrame,
         # Berechne Werte
         n_students = len(df)
         mean_confidence = mean_matheff - mean_anxmat
-        mean_math = df['math_score'].mean() if 'math_score' in df.columns else df['PV1MATH'].mean()
-        std_anxmat = df['ANXMAT'].std() if 'ANXMAT' in df.columns else 1.0
-        std_matheff = df['MATHEFF'].std() if 'MATHEFF' in df.columns else 1.0
+        # Alle Kennzahlen in einem agg-Aufruf; fehlende Skalen bekommen std = 1.0
+        columns = frozenset(df.columns)
+        math_col = 'math_score' if 'math_score' in columns else 'PV1MATH'
+        aggregations = {math_col: 'mean'}
+        aggregations.update({col: 'std' for col in _STD_COLUMNS if col in columns})
+        summary = df.agg(aggregations)
+        mean_math = summary[math_col]
+        std_anxmat = summary.get('ANXMAT', 1.0)
+        std_matheff = summary.get('MATHEFF', 1.0)
 
         # Section 1: Was siehst du?
         st.markdown(f"""
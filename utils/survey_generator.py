@@ -5,6 +5,13 @@ Generiert mobil-optimierte HTML-Formulare basierend auf PISA-Items
 mit Integration für Google Sheets.
 """
 
+import json
+import re
+import sys
+from functools import lru_cache
+from html import escape
+from io import StringIO
+from string import Formatter
 from typing import List, Dict, Optional
 import pandas as pd
 import numpy as np
@@ -56,26 +63,55 @@ ANSWER_LABEL_MAPPING = {
     "More than 6 hours": "Mehr als 6 Stunden",
 }
 
+# Schlüssel internieren, damit internierte Labels per Identität statt per Stringvergleich treffen
+ANSWER_LABEL_MAPPING = {sys.intern(k): v for k, v in ANSWER_LABEL_MAPPING.items()}
 
+
+@lru_cache(maxsize=256)
 def translate_label(english_label: str) -> str:
     """
     Übersetzt englische PISA Labels ins Deutsche.
 
     Args:
-        english_label: Englisches Label
+        english_label: Englisches Label (hashbar; None/NaN/pd.NA ergeben "")
 
     Returns:
         Deutsches Label oder Original falls keine Übersetzung
     """
-    if not english_label or pd.isna(english_label):
+    # Normalfall zuerst: Strings ohne pd.isna-Dispatch
+    if isinstance(english_label, str):
+        return ANSWER_LABEL_MAPPING.get(english_label, english_label) if english_label else ""
+
+    # Fehlende/leere Werte (NaN erkennt man an der Ungleichheit mit sich selbst)
+    if (english_label is None or english_label is pd.NA
+            or (isinstance(english_label, float) and english_label != english_label)
+            or not english_label):
         return ""
 
-    # Direct mapping
-    if english_label in ANSWER_LABEL_MAPPING:
-        return ANSWER_LABEL_MAPPING[english_label]
+    # Direct mapping, sonst Original zurückgeben
+    return ANSWER_LABEL_MAPPING.get(english_label, english_label)
+
+
+@lru_cache(maxsize=1024)
+def _escape_html(text) -> str:
+    """
+    Maskiert Fragen- und Antworttexte für die Ausgabe im HTML (gecacht,
+    da sich Antwortlabels über alle Items einer Skala wiederholen).
+
+    Args:
+        text: Beliebiger (hashbarer) Text
 
-    # Return original if no translation
-    return english_label
+    Returns:
+        HTML-sicherer String
+    """
+    return escape(str(text), quote=True)
+
+
+# Missing-Muster als ein kompilierter Ausdruck (Teilstring-Suche; führender Punkt = SPSS-Code)
+_MISSING_RE = re.compile(
+    r"^\.|SYSTEM MISSING|MISSING|NOT APPLICABLE|VALID SKIP|INVALID|NO RESPONSE"
+    r"|\.[VNIM]|9[5-9]"
+)
 
 
 def is_missing_value(value: any) -> bool:
@@ -88,67 +124,60 @@ def is_missing_value(value: any) -> bool:
     Returns:
         True wenn Missing Code
     """
+    # Schneller Weg für numerische Likert-Codes: ganze Zahlen mit |Wert| < 95
+    # enthalten keines der Muster (kein Punkt, keine Ziffernfolge 95-99)
+    if isinstance(value, (int, np.integer)) and -95 < value < 95:
+        return False
+
     if pd.isna(value):
         return True
 
     value_str = str(value).strip().upper()
 
-    # Common missing patterns
-    missing_patterns = [
-        'SYSTEM MISSING',
-        'MISSING',
-        'NOT APPLICABLE',
-        'VALID SKIP',
-        'INVALID',
-        'NO RESPONSE',
-        '.V',
-        '.N',
-        '.I',
-        '.M',
-        '95',
-        '96',
-        '97',
-        '98',
-        '99'
-    ]
-
-    # Check if value starts with dot (SPSS missing codes)
-    if value_str.startswith('.'):
-        return True
+    # SPSS Missing Codes (Punkt am Anfang) und übliche Missing-Muster
+    return _MISSING_RE.search(value_str) is not None
 
-    # Check patterns
-    for pattern in missing_patterns:
-        if pattern in value_str:
-            return True
 
-    return False
+# Statische Teile von CSS, JavaScript und HTML-Bausteinen werden einmalig
+# beim Import vorbereitet; beim Rendern werden nur noch die Werte eingesetzt
 
-
-def generate_html_form(
-    scale_name: str,
-    scale_title: str,
-    items: List[Dict],
-    value_labels: Dict[str, pd.DataFrame],
-    fragestamm: Optional[str] = None,
-    google_script_url: str = ""
-) -> str:
+def _js_literal(value) -> str:
     """
-    Generiert ein mobil-optimiertes HTML-Formular.
+    Wandelt einen Wert in ein JavaScript-Literal um (für das Script im Formular).
 
     Args:
-        scale_name: Skalen-Code (z.B. "ANXMAT")
-        scale_title: Deutscher Titel der Skala
-        items: Liste von Items mit 'variable_name' und 'question_text_de'
-        value_labels: Dictionary mit DataFrames für Antwortoptionen pro Item
-        fragestamm: Gemeinsamer Einleitungstext (optional)
-        google_script_url: URL zum Google Apps Script (optional)
+        value: String oder anderer JSON-fähiger Wert
 
     Returns:
-        HTML string des kompletten Formulars
+        JSON-Literal, in dem '</' maskiert ist, damit es den <script>-Block nicht beendet
     """
+    return json.dumps(value).replace('</', '<\\/')
 
-    # CSS für mobile-first responsive design
-    css_styles = """
+
+def _split_template(template: str) -> tuple:
+    """
+    Zerlegt ein Format-Template einmalig in seine statischen Teile.
+
+    Doppelte Klammern ({{ }}) werden dabei wie bei str.format aufgelöst.
+
+    Args:
+        template: Template mit Platzhaltern ({name})
+
+    Returns:
+        Tuple der statischen Teile (ein Element mehr als Platzhalter)
+    """
+    statics, chunk = [], []
+    for literal, field, _, _ in Formatter().parse(template):
+        chunk.append(literal)
+        if field is not None:
+            statics.append(''.join(chunk))
+            chunk = []
+    statics.append(''.join(chunk))
+    return tuple(statics)
+
+
+# CSS für mobile-first responsive design
+_CSS_STYLES = """
     <style>
         * {
             margin: 0;
@@ -362,11 +391,13 @@ def generate_html_form(
     </style>
     """
 
-    # JavaScript für Formular-Handling und Google Sheets Integration
-    javascript = f"""
+
+# JavaScript für Formular-Handling und Google Sheets Integration
+_JS_STATICS = _split_template("""
     <script>
         let currentProgress = 0;
-        const totalQuestions = {len(items)};
+        const totalQuestions = {total_questions};
+        const GOOGLE_SCRIPT_URL = {google_script_url};
 
         // Update progress bar
         function updateProgress() {{
@@ -412,12 +443,12 @@ def generate_html_form(
 
             // Add metadata
             data.timestamp = new Date().toISOString();
-            data.scale_name = '{scale_name}';
+            data.scale_name = {scale_name};
 
             try {{
                 // Option A: Google Apps Script
-                if ('{google_script_url}' !== '') {{
-                    const response = await fetch('{google_script_url}', {{
+                if (GOOGLE_SCRIPT_URL !== '') {{
+                    const response = await fetch(GOOGLE_SCRIPT_URL, {{
                         method: 'POST',
                         mode: 'no-cors',
                         headers: {{
@@ -454,20 +485,135 @@ def generate_html_form(
             document.getElementById('thankYou').style.display = 'block';
         }}
     </script>
+    """)
+
+# HTML-Bausteine pro Frage/Antwortoption
+_ITEM_STATICS = _split_template("""
+                    <div class="form-group">
+                        <span class="question-number">Frage {idx} von {num_items}</span>
+                        <div class="question-text">{question_text}</div>
+                        <div class="radio-group">
+        """)
+
+_RADIO_STATICS = _split_template("""
+                            <div class="radio-option">
+                                <input type="radio" id="{variable}_{value}" name="{variable}"
+                                       value="{value}" required>
+                                <label for="{variable}_{value}">{value}. {label}</label>
+                            </div>
+                """)
+
+# Platzhalter für den Variablennamen in gerenderten Antwortblöcken
+_VARIABLE_SLOT = '\x00'
+
+_ITEM_END = """
+                        </div>
+                    </div>
+        """
+
+
+def _interleave(statics: tuple, values: tuple) -> List[str]:
     """
+    Verschränkt statische Template-Teile mit den Werten (s0, v0, s1, v1, ..., sn).
+
+    Args:
+        statics: Statische Teile (ein Element mehr als values)
+        values: Einzusetzende Werte
+
+    Returns:
+        Liste der Fragmente für ''.join
+    """
+    parts = [None] * (2 * len(statics) - 1)
+    parts[::2] = statics
+    parts[1::2] = map(str, values)
+    return parts
+
+
+def _render_options(vl_df: pd.DataFrame) -> List[str]:
+    """
+    Rendert die Antwortoptionen eines Items ohne Variablennamen.
+
+    Args:
+        vl_df: Value Labels des Items
+
+    Returns:
+        HTML-Teile zwischen den Stellen, an denen der Variablenname steht
+        (zusammensetzen mit variable.join(...))
+    """
+    slot = _VARIABLE_SLOT
+    parts = []
+
+    # Missing Codes vektorisiert ausfiltern (gleiche Regeln wie is_missing_value)
+    values = vl_df['value']
+    value_strs = values.astype(str).str.strip().str.upper()
+    keep = values.notna() & ~value_strs.str.contains(_MISSING_RE, na=False)
+
+    options = vl_df.loc[keep]
+    values = options['value']
+
+    # Determine final labels (vektorisiert): deutsches Label, sonst
+    # übersetztes englisches Label, sonst "Option <Wert>"
+    labels = ('Option ' + values.astype(str)).astype(object)
+    if 'label' in options.columns:
+        label_en = options['label']
+        has_en = label_en.notna() & (label_en.astype(str).str.strip() != '')
+        translated = label_en.map(ANSWER_LABEL_MAPPING).fillna(label_en)
+        labels = translated.astype(object).where(has_en, labels)
+    if 'label_de' in options.columns:
+        label_de = options['label_de']
+        has_de = label_de.notna() & (label_de.astype(str).str.strip() != '')
+        labels = label_de.astype(object).where(has_de, labels)
+
+    for value, label in zip(values.tolist(), labels.tolist()):
+        parts.extend(_interleave(
+            _RADIO_STATICS,
+            (slot, value, slot, value, slot, value, value, _escape_html(label))
+        ))
+
+    return ''.join(parts).split(slot)
+
+
+def generate_html_form(
+    scale_name: str,
+    scale_title: str,
+    items: List[Dict],
+    value_labels: Dict[str, pd.DataFrame],
+    fragestamm: Optional[str] = None,
+    google_script_url: str = ""
+) -> str:
+    """
+    Generiert ein mobil-optimiertes HTML-Formular.
+
+    Args:
+        scale_name: Skalen-Code (z.B. "ANXMAT")
+        scale_title: Deutscher Titel der Skala
+        items: Liste von Items mit 'variable_name' und 'question_text_de'
+        value_labels: Dictionary mit DataFrames für Antwortoptionen pro Item
+        fragestamm: Gemeinsamer Einleitungstext (optional)
+        google_script_url: URL zum Google Apps Script (optional)
+
+    Returns:
+        HTML string des kompletten Formulars
+    """
+
+    # JavaScript mit den Werten dieses Formulars
+    javascript = ''.join(_interleave(
+        _JS_STATICS, (len(items), _js_literal(google_script_url), _js_literal(scale_name))
+    ))
 
     # HTML Structure
-    html_parts = []
+    buffer = StringIO()
+    write = buffer.write
 
     # Header
-    html_parts.append(f"""
+    write(f"""
     <!DOCTYPE html>
     <html lang="de">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>{scale_title} - PISA Befragung</title>
-        {css_styles}
+        {_CSS_STYLES}
     </head>
     <body>
         <div class="container">
@@ -484,15 +630,15 @@ def generate_html_form(
 
     # Fragestamm if available
     if fragestamm:
-        html_parts.append(f"""
+        write(f"""
                 <div class="fragestamm">
                     <strong>📝 Einleitungstext für alle folgenden Fragen:</strong><br>
-                    {fragestamm}
+                    {_escape_html(fragestamm)}
                 </div>
         """)
 
     # Progress bar
-    html_parts.append("""
+    write("""
                 <div class="progress-bar">
                     <div class="progress-fill"></div>
                 </div>
@@ -508,56 +654,45 @@ def generate_html_form(
     """)
 
     # Generate questions
+    # Template pro Formular spezialisieren: die Fragenanzahl ist konstant,
+    # übrig bleiben nur Nummer und Fragetext als Platzhalter
+    num_items = len(items)
+    head_start, head_mid, head_end = (
+        _ITEM_STATICS[0], _ITEM_STATICS[1] + str(num_items) + _ITEM_STATICS[2], _ITEM_STATICS[3]
+    )
+    # Antwortblock inkl. Abschluss des Items, geteilt am Variablennamen
+    item_tails = {}
+    empty_tail = (_ITEM_END,)
+
     for idx, item in enumerate(items, 1):
         variable = item.get('variable_name', 'N/A')
         question_text = item.get('question_text_de', item.get('question_text_en', 'N/A'))
 
-        html_parts.append(f"""
-                    <div class="form-group">
-                        <span class="question-number">Frage {idx} von {len(items)}</span>
-                        <div class="question-text">{question_text}</div>
-                        <div class="radio-group">
-        """)
+        tail = empty_tail
 
         # Get value labels for this item
         if variable in value_labels and len(value_labels[variable]) > 0:
             vl_df = value_labels[variable]
 
-            for _, row in vl_df.iterrows():
-                value = row['value']
-
-                # Skip missing values
-                if is_missing_value(value):
-                    continue
-
-                # Get labels
-                label_de = row.get('label_de')
-                label_en = row.get('label')
-
-                # Determine final label
-                if label_de and pd.notna(label_de) and str(label_de).strip() != '':
-                    label = label_de
-                elif label_en and pd.notna(label_en) and str(label_en).strip() != '':
-                    # Try to translate English label to German
-                    label = translate_label(label_en)
-                else:
-                    label = f"Option {value}"  # Fallback
-
-                html_parts.append(f"""
-                            <div class="radio-option">
-                                <input type="radio" id="{variable}_{value}" name="{variable}"
-                                       value="{value}" required>
-                                <label for="{variable}_{value}">{value}. {label}</label>
-                            </div>
-                """)
-
-        html_parts.append("""
-                        </div>
-                    </div>
-        """)
+            # Likert-Items einer Skala teilen meist dieselben Antwortoptionen:
+            # den Block nur einmal rendern und den Variablennamen einsetzen
+            key = tuple(
+                tuple(vl_df[col].tolist()) if col in vl_df.columns else None
+                for col in ('value', 'label_de', 'label')
+            )
+            tail = item_tails.get(key)
+            if tail is None:
+                option_parts = _render_options(vl_df)
+                option_parts[-1] += _ITEM_END
+                tail = item_tails[key] = option_parts
+
+        buffer.writelines((
+            head_start, str(idx), head_mid, _escape_html(question_text), head_end,
+            str(variable).join(tail)
+        ))
 
     # Submit button
-    html_parts.append("""
+    write("""
                     <button type="submit" class="submit-btn" id="submitBtn" disabled>
                         ✅ Befragung abschicken
                     </button>
@@ -573,13 +708,13 @@ def generate_html_form(
     """)
 
     # Footer
-    html_parts.append(f"""
+    write(f"""
         {javascript}
     </body>
     </html>
     """)
 
-    return ''.join(html_parts)
+    return buffer.getvalue()
 
 
 def estimate_survey_duration(num_items: int) -> int:
@@ -592,8 +727,6 @@ def estimate_survey_duration(num_items: int) -> int:
     Returns:
         Geschätzte Minuten (aufgerundet auf 5er)
     """
-    # Durchschnittlich 20 Sekunden pro Frage
-    minutes = (num_items * 20) / 60
-
-    # Aufrunden auf nächste 5
-    return max(5, int((minutes + 4) // 5 * 5))
+    # Durchschnittlich 20 Sekunden pro Frage, auf 5er gerundet:
+    # ((n * 20 / 60) + 4) // 5 * 5 == (n + 12) // 15 * 5, ganz ohne Float-Division
+    return max(5, int((num_items + 12) // 15) * 5)
@@ -9,14 +9,25 @@ Provides reusable Plotly visualization functions for:
 - Statistical annotations
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
-from scipy import stats
+from scipy import special, stats
 from typing import Optional, List, Dict, Tuple
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; scipy.special.ndtri fallback below
+    njit = None
+
 
 # ============================================
 # COLOR SCHEMES
@@ -34,6 +45,36 @@ PISA_COLORS = {
     'categorical': px.colors.qualitative.Set2
 }
 
+# Marker styles shared by the diagnostic scatters (plotly copies them on assignment)
+_PRIMARY_MARKER = dict(color=PISA_COLORS['primary'], opacity=0.6)
+_PRIMARY_MARKER_QQ = dict(color=PISA_COLORS['primary'])
+
+
+# ============================================
+# STATISTICS HELPERS
+# ============================================
+
+def _pearson_from_moments(sxx: float, syy: float, sxy: float, n: int) -> Tuple[float, float]:
+    """
+    Pearson correlation and two-sided p-value from centered sums
+
+    Shared by plots that already hold the centered moments (e.g. for a
+    regression line), so the data is not scanned again as stats.pearsonr would.
+
+    Args:
+        sxx: Sum of squared deviations of x
+        syy: Sum of squared deviations of y
+        sxy: Sum of cross deviations
+        n: Number of observations (>= 3)
+
+    Returns:
+        Tuple of (r, p_value); NaN for constant input
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = np.clip(sxy / np.sqrt(sxx * syy), -1.0, 1.0)
+        t_stat = r * np.sqrt((n - 2) / (1.0 - r * r))
+    return float(r), float(2 * stats.t.sf(abs(t_stat), n - 2))
+
 
 # ============================================
 # CORRELATION VISUALIZATIONS
@@ -59,20 +100,21 @@ def create_correlation_heatmap(
     Returns:
         Plotly Figure object
     """
-    # Mask diagonal if requested
-    display_matrix = corr_matrix.copy()
+    # Mask diagonal if requested (only then copy the values)
+    values = corr_matrix.to_numpy(dtype=np.float64)
     if mask_diagonal:
-        np.fill_diagonal(display_matrix.values, np.nan)
+        values = values.copy()
+        np.fill_diagonal(values, np.nan)
 
     # Create text annotations
     text_values = None
     if annotations:
-        text_values = np.around(display_matrix.values, decimals=2)
+        text_values = np.where(np.isnan(values), '', np.char.mod('%.2f', values))
 
     fig = go.Figure(data=go.Heatmap(
-        z=display_matrix.values,
-        x=display_matrix.columns,
-        y=display_matrix.index,
+        z=values,
+        x=corr_matrix.columns,
+        y=corr_matrix.index,
         colorscale=color_scale,
         zmid=0,  # Center at 0
         zmin=-1,
@@ -162,13 +204,17 @@ def create_scatter_with_regression(
     if color_by and color_by in df.columns:
         plot_df[color_by] = df.loc[plot_df.index, color_by]
 
+    # Per-group OLS lines only make sense via Plotly Express; the single
+    # overall line is drawn from the moments below
+    grouped = bool(color_by and color_by in plot_df.columns)
+
     # Create scatter plot
     fig = px.scatter(
         plot_df,
         x=x_var,
         y=y_var,
         color=color_by,
-        trendline='ols' if add_trendline else None,
+        trendline='ols' if add_trendline and grouped else None,
         title=title,
         labels={
             x_var: x_label or x_var,
@@ -177,13 +223,34 @@ def create_scatter_with_regression(
         opacity=0.6
     )
 
+    # Centered moments shared by the regression line and the statistics
+    n = len(plot_df)
+    if n >= 2 and ((add_trendline and not grouped) or show_stats):
+        x = plot_df[x_var].to_numpy(dtype=np.float64)
+        y = plot_df[y_var].to_numpy(dtype=np.float64)
+        mx, my = x.mean(), y.mean()
+        dx, dy = x - mx, y - my
+        sxx, syy, sxy = np.dot(dx, dx), np.dot(dy, dy), np.dot(dx, dy)
+
+        if add_trendline and not grouped and sxx > 0:
+            slope = sxy / sxx
+            x_line = np.array([x.min(), x.max()])
+            fig.add_trace(go.Scatter(
+                x=x_line,
+                y=my + slope * (x_line - mx),
+                mode='lines',
+                name='OLS',
+                line=dict(color='red', width=2),
+                showlegend=False
+            ))
+
     # Calculate statistics
-    if show_stats and len(plot_df) >= 3:
-        corr, p_value = stats.pearsonr(plot_df[x_var], plot_df[y_var])
+    if show_stats and n >= 3:
+        corr, p_value = _pearson_from_moments(sxx, syy, sxy, n)
 
         # Add annotation with statistics
         fig.add_annotation(
-            text=f"r = {corr:.3f}<br>p = {p_value:.4f}<br>N = {len(plot_df)}",
+            text=f"r = {corr:.3f}<br>p = {p_value:.4f}<br>N = {n}",
             xref="paper", yref="paper",
             x=0.05, y=0.95,
             showarrow=False,
@@ -266,10 +333,12 @@ def create_distribution_plot(
 
     fig = go.Figure()
 
-    # Histogram
-    fig.add_trace(go.Histogram(
-        x=clean_data,
-        nbinsx=bins,
+    # Histogram (binned once; the counts also scale the normal curve)
+    hist_counts, edges = np.histogram(clean_data, bins=bins)
+    fig.add_trace(go.Bar(
+        x=0.5 * (edges[:-1] + edges[1:]),
+        y=hist_counts,
+        width=np.diff(edges),
         name='Histogram',
         opacity=0.7,
         marker_color=PISA_COLORS['primary']
@@ -284,7 +353,6 @@ def create_distribution_plot(
         normal_curve = stats.norm.pdf(x_range, mean, std)
 
         # Scale to histogram
-        hist_counts, _ = np.histogram(clean_data, bins=bins)
         scale_factor = hist_counts.max() / normal_curve.max()
         normal_curve_scaled = normal_curve * scale_factor
 
@@ -322,6 +390,7 @@ def create_distribution_plot(
         xaxis_title=variable,
         yaxis_title="Häufigkeit",
         showlegend=True,
+        bargap=0,
         height=400
     )
 
@@ -344,9 +413,8 @@ def create_combined_distribution_plot(
     Returns:
         Plotly Figure object with subplots
     """
-    from plotly.subplots import make_subplots
-
-    clean_data = df[variable].dropna()
+    values = df[variable].to_numpy(dtype=np.float64, na_value=np.nan)
+    clean_data = values[~np.isnan(values)]
 
     fig = make_subplots(
         rows=2, cols=1,
@@ -504,6 +572,146 @@ def create_comparison_barplot(
 # ADVANCED VISUALIZATIONS
 # ============================================
 
+def _downsample_scatter(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_points: int = 4000
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a large scatter to the extremes per x-bin (M4-style)
+
+    Splits the x range into max_points / 2 equal bins and keeps the points
+    with the smallest and largest y in each bin, in their original order.
+    The outline of the point cloud stays intact while the payload sent to
+    the browser is bounded.
+
+    Args:
+        x: X values
+        y: Y values
+        max_points: Maximum number of points to keep
+
+    Returns:
+        Tuple of (x, y); unchanged if there are at most max_points points
+    """
+    # Keep float inputs as they are (e.g. float32 plot data)
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x.dtype.kind != 'f':
+        x = x.astype(np.float64)
+    if y.dtype.kind != 'f':
+        y = y.astype(np.float64)
+    if x.size <= max_points:
+        return x, y
+
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    if x.size <= max_points:
+        return x, y
+
+    n_bins = max(1, max_points // 2)
+    x_min, x_range = x.min(), np.ptp(x)
+    if x_range > 0:
+        bins = np.minimum(((x - x_min) / x_range * n_bins).astype(np.intp), n_bins - 1)
+    else:
+        bins = np.zeros(x.size, dtype=np.intp)
+
+    # Sort by bin, then y: first/last entry of each bin run are min/max y
+    order = np.lexsort((y, bins))
+    sorted_bins = bins[order]
+    starts = np.flatnonzero(np.r_[True, sorted_bins[1:] != sorted_bins[:-1]])
+    ends = np.r_[starts[1:], order.size] - 1
+    keep = np.unique(np.concatenate((order[starts], order[ends])))
+
+    return x[keep], y[keep]
+
+
+# Layout shared by the residual, Q-Q and feature importance plots
+_DIAGNOSTIC_LAYOUT = dict(height=400)
+
+# Dashed zero line across the full x range (what add_hline(y=0) creates)
+_ZERO_LINE = dict(
+    type='line', xref='x domain', x0=0, x1=1, yref='y', y0=0, y1=0,
+    line=dict(color='red', dash='dash')
+)
+
+
+def _diagnostic_layout(title: str, xaxis_title: str, yaxis_title: str, **overrides) -> Dict:
+    """
+    Full layout dict for a diagnostic plot
+
+    Passed to go.Figure(layout=...) so the layout is validated once at
+    construction instead of being merged again by update_layout.
+
+    Args:
+        title: Plot title
+        xaxis_title: X axis title
+        yaxis_title: Y axis title
+        **overrides: Further layout properties (e.g. height)
+
+    Returns:
+        Layout dict (a new dict on every call)
+    """
+    layout = dict(
+        _DIAGNOSTIC_LAYOUT,
+        title=dict(text=title),
+        xaxis=dict(title=dict(text=xaxis_title)),
+        yaxis=dict(title=dict(text=yaxis_title))
+    )
+    layout.update(overrides)
+    return layout
+
+
+def _as_plot_array(values: np.ndarray) -> np.ndarray:
+    """
+    Contiguous float32 copy of plot coordinates for the binary array encoding
+
+    Plotly >= 6 serializes such arrays as base64 typed arrays
+    ({'dtype': 'f4', 'bdata': ...}) instead of JSON number lists, which
+    Plotly.js decodes without parsing every element.
+
+    Args:
+        values: Coordinates to plot
+
+    Returns:
+        C-contiguous float32 array (the input itself if it already is one)
+    """
+    return np.ascontiguousarray(values, dtype=np.float32)
+
+
+def _build_residual_traces(y_true: np.ndarray, y_pred: np.ndarray) -> List[Dict]:
+    """
+    Residual scatter trace(s) shared by the residual plot and the diagnostic panel
+
+    Args:
+        y_true: True values
+        y_pred: Predicted values
+
+    Returns:
+        List of trace dicts (the zero line is added on the figure)
+    """
+    # Plot-only data: float32 halves the payload, NaN pairs are dropped once
+    y_true = np.asarray(y_true, dtype=np.float32)
+    y_pred = np.asarray(y_pred, dtype=np.float32)
+    finite = np.isfinite(y_true) & np.isfinite(y_pred)
+    if not finite.all():
+        y_true, y_pred = y_true[finite], y_pred[finite]
+    residuals = y_true - y_pred
+
+    # Large samples: keep the residual envelope per prediction bin
+    x_plot, y_plot = _downsample_scatter(y_pred, residuals)
+    x_plot, y_plot = _as_plot_array(x_plot), _as_plot_array(y_plot)
+
+    # Scatter plot of residuals (WebGL: one draw call instead of one SVG node per point)
+    return [{
+        'type': 'scattergl',
+        'x': x_plot,
+        'y': y_plot,
+        'mode': 'markers',
+        'marker': _PRIMARY_MARKER,
+        'name': 'Residuals'
+    }]
+
+
 def create_regression_residual_plot(
     y_true: np.ndarray,
     y_pred: np.ndarray,
@@ -520,30 +728,134 @@ def create_regression_residual_plot(
     Returns:
         Plotly Figure object
     """
-    residuals = y_true - y_pred
+    # Zero line as a layout shape (same as add_hline, without the per-call lookups)
+    layout = _diagnostic_layout(title, "Predicted Values", "Residuals", shapes=[_ZERO_LINE])
+
+    return go.Figure({'data': _build_residual_traces(y_true, y_pred), 'layout': layout})
+
+
+# Above this N the Q-Q quantiles are computed by the parallel numba kernel
+QQ_NUMBA_MIN_N = 50_000
+
+if njit is not None:
+    @njit(cache=True)
+    def _ndtri_acklam(p):
+        # Acklam's rational approximation of the normal quantile
+        # (relative error < 1.2e-9, far below plotting resolution)
+        if p < 0.02425:
+            q = np.sqrt(-2.0 * np.log(p))
+            x = ((((((-7.784894002430293e-03 * q - 3.223964580411365e-01) * q
+                     - 2.400758277161838e+00) * q - 2.549732539343734e+00) * q
+                   + 4.374664141464968e+00) * q + 2.938163982698783e+00)
+                 / ((((7.784695709041462e-03 * q + 3.224671290700398e-01) * q
+                      + 2.445134137142996e+00) * q + 3.754408661907416e+00) * q + 1.0))
+        elif p > 1.0 - 0.02425:
+            q = np.sqrt(-2.0 * np.log1p(-p))
+            x = -((((((-7.784894002430293e-03 * q - 3.223964580411365e-01) * q
+                      - 2.400758277161838e+00) * q - 2.549732539343734e+00) * q
+                    + 4.374664141464968e+00) * q + 2.938163982698783e+00)
+                  / ((((7.784695709041462e-03 * q + 3.224671290700398e-01) * q
+                       + 2.445134137142996e+00) * q + 3.754408661907416e+00) * q + 1.0))
+        else:
+            q = p - 0.5
+            r = q * q
+            x = ((((((-3.969683028665376e+01 * r + 2.209460984245205e+02) * r
+                     - 2.759285104469687e+02) * r + 1.383577518672690e+02) * r
+                   - 3.066479806614716e+01) * r + 2.506628277459239e+00) * q
+                 / (((((-5.447609879822406e+01 * r + 1.615858368580409e+02) * r
+                       - 1.556989798598866e+02) * r + 6.680131188771972e+01) * r
+                     - 1.328068155288572e+01) * r + 1.0))
+        return x
+
+    @njit(parallel=True, cache=True)
+    def _qq_quantiles_numba(n):
+        # Filliben's order statistic medians (as in stats.probplot)
+        out = np.empty(n)
+        last = 0.5 ** (1.0 / n)
+        for i in prange(n):
+            if i == 0:
+                p = 1.0 - last
+            elif i == n - 1:
+                p = last
+            else:
+                p = (i + 1 - 0.3175) / (n + 0.365)
+            out[i] = _ndtri_acklam(p)
+        return out
+
+
+@lru_cache(maxsize=32)
+def _norm_quantiles(n: int) -> np.ndarray:
+    """
+    Normal quantiles of the order statistic medians for a Q-Q plot
 
-    fig = go.Figure()
+    Same positions as stats.probplot (Filliben's estimate), mapped through the
+    ndtri ufunc (no rv_continuous dispatch) and cached by N because they do
+    not depend on the data itself. Above QQ_NUMBA_MIN_N points the parallel
+    numba kernel is used when numba is installed.
 
-    # Scatter plot of residuals
-    fig.add_trace(go.Scatter(
-        x=y_pred,
-        y=residuals,
-        mode='markers',
-        marker=dict(color=PISA_COLORS['primary'], opacity=0.6),
-        name='Residuals'
-    ))
+    Args:
+        n: Number of observations
 
-    # Zero line
-    fig.add_hline(y=0, line_dash="dash", line_color="red")
+    Returns:
+        Read-only array of n theoretical quantiles
+    """
+    if njit is not None and n > QQ_NUMBA_MIN_N:
+        quantiles = _qq_quantiles_numba(n)
+    else:
+        positions = np.empty(n)
+        if n > 0:
+            positions[-1] = 0.5 ** (1.0 / n)
+            positions[0] = 1 - positions[-1]
+            positions[1:-1] = (np.arange(2, n) - 0.3175) / (n + 0.365)
+        quantiles = special.ndtri(positions)
+    quantiles.flags.writeable = False
+    return quantiles
+
+
+def _build_qq_traces(data: pd.Series) -> List[Dict]:
+    """
+    Q-Q point and reference line traces shared by the Q-Q plot and the diagnostic panel
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Predicted Values",
-        yaxis_title="Residuals",
-        height=400
-    )
+    Args:
+        data: Data series
 
-    return fig
+    Returns:
+        List of trace dicts [points, reference line]
+    """
+    # dropna() always copies; only pay for it when there is something to drop
+    clean_data = data.dropna() if data.hasnans else data
+
+    # Sample quantiles are the sorted data; theoretical ones only depend on N
+    sample_quantiles = np.sort(clean_data.to_numpy(dtype=np.float64))
+    theoretical_quantiles = _norm_quantiles(sample_quantiles.size)
+
+    # Both axes are sorted, so the binned extremes trace the curve exactly
+    x_plot, y_plot = _downsample_scatter(theoretical_quantiles, sample_quantiles)
+    x_plot, y_plot = _as_plot_array(x_plot), _as_plot_array(y_plot)
+
+    # Q-Q scatter
+    points = {
+        'type': 'scattergl',
+        'x': x_plot,
+        'y': y_plot,
+        'mode': 'markers',
+        'marker': _PRIMARY_MARKER_QQ,
+        'name': 'Data'
+    }
+
+    # Reference line (both quantile vectors are sorted, the ends are the extremes)
+    min_val = min(theoretical_quantiles[0], sample_quantiles[0])
+    max_val = max(theoretical_quantiles[-1], sample_quantiles[-1])
+    line = {
+        'type': 'scatter',
+        'x': [min_val, max_val],
+        'y': [min_val, max_val],
+        'mode': 'lines',
+        'line': {'color': 'red', 'dash': 'dash'},
+        'name': 'Normal'
+    }
+
+    return [points, line]
 
 
 def create_qq_plot(
@@ -560,78 +872,262 @@ def create_qq_plot(
     Returns:
         Plotly Figure object
     """
-    clean_data = data.dropna()
+    layout = _diagnostic_layout(title, "Theoretical Quantiles", "Sample Quantiles")
 
-    # Calculate theoretical quantiles
-    theoretical_quantiles = stats.probplot(clean_data, dist="norm")[0][0]
-    sample_quantiles = stats.probplot(clean_data, dist="norm")[0][1]
+    return go.Figure({'data': _build_qq_traces(data), 'layout': layout})
 
-    fig = go.Figure()
 
-    # Q-Q scatter
-    fig.add_trace(go.Scatter(
-        x=theoretical_quantiles,
-        y=sample_quantiles,
-        mode='markers',
-        marker=dict(color=PISA_COLORS['primary']),
-        name='Data'
-    ))
+def create_feature_importance_plot(
+    importance_df: pd.DataFrame,
+    top_n: int = 15,
+    title: str = "Feature Importance"
+) -> go.Figure:
+    """
+    Create horizontal bar chart for feature importance
 
-    # Reference line
-    min_val = min(theoretical_quantiles.min(), sample_quantiles.min())
-    max_val = max(theoretical_quantiles.max(), sample_quantiles.max())
-    fig.add_trace(go.Scatter(
-        x=[min_val, max_val],
-        y=[min_val, max_val],
-        mode='lines',
-        line=dict(color='red', dash='dash'),
-        name='Normal'
-    ))
+    Args:
+        importance_df: DataFrame with 'Feature' and 'Importance_%' columns (any order)
+        top_n: Number of top features to show
+        title: Plot title
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Theoretical Quantiles",
-        yaxis_title="Sample Quantiles",
-        height=400
+    Returns:
+        Plotly Figure object (a fresh copy; identical inputs reuse the cached figure)
+    """
+    plot_df = importance_df.nlargest(top_n, 'Importance_%', keep='first')
+
+    fig = _feature_importance_figure(
+        tuple(plot_df['Feature'].tolist()),
+        tuple(plot_df['Importance_%'].tolist()),
+        top_n,
+        title
     )
 
-    return fig
+    # Callers may update the figure, so never hand out the cached instance
+    return go.Figure(fig)
 
 
-def create_feature_importance_plot(
+def _build_importance_traces(features, importances) -> List[Dict]:
+    """
+    Feature importance bar trace shared by the importance plot and the diagnostic panel
+
+    Args:
+        features: Feature names (bar order)
+        importances: Importance values in percent
+
+    Returns:
+        List with one horizontal bar trace dict bound to the figure's coloraxis
+    """
+    importances = np.asarray(importances, dtype=np.float64)
+
+    # Plain bar trace (no Plotly Express facade); the shared color axis gives
+    # the same continuous 'Blues' coloring and colorbar as px.bar(color=...).
+    # Labels are formatted here, so the browser needs no texttemplate pass.
+    return [{
+        'type': 'bar',
+        'x': importances,
+        'y': list(features),
+        'orientation': 'h',
+        'marker': {'color': importances, 'coloraxis': 'coloraxis'},
+        'text': [f'{value:.1f}%' for value in importances.tolist()],
+        'textposition': 'outside',
+        'hovertemplate': 'Importance_%=%{marker.color}<br>Feature=%{y}<extra></extra>',
+        'name': '',
+        'showlegend': False
+    }]
+
+
+@lru_cache(maxsize=64)
+def _feature_importance_figure(
+    features: Tuple,
+    importances: Tuple,
+    top_n: int,
+    title: str
+) -> go.Figure:
+    """Build the feature importance bar chart (cached by its plotted values)."""
+    layout = _diagnostic_layout(
+        title, 'Importance_%', 'Feature',
+        coloraxis=dict(colorscale='Blues', colorbar=dict(title=dict(text='Importance_%'))),
+        height=max(_DIAGNOSTIC_LAYOUT['height'], top_n * 25),
+        showlegend=False
+    )
+    layout['yaxis']['categoryorder'] = 'total ascending'
+
+    return go.Figure({'data': _build_importance_traces(features, importances), 'layout': layout})
+
+
+def create_diagnostic_panel(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
     importance_df: pd.DataFrame,
+    qq_data: Optional[pd.Series] = None,
     top_n: int = 15,
-    title: str = "Feature Importance"
+    title: str = "Modell-Diagnostik"
 ) -> go.Figure:
     """
-    Create horizontal bar chart for feature importance
+    Create residual plot, Q-Q plot and feature importance side by side
+
+    One figure with one layout instead of three separately built (and
+    serialized) figures when the diagnostics are shown together.
 
     Args:
-        importance_df: DataFrame with 'Feature' and 'Importance_%' columns
+        y_true: True values
+        y_pred: Predicted values
+        importance_df: DataFrame with 'Feature' and 'Importance_%' columns (any order)
+        qq_data: Data for the Q-Q plot (default: the residuals)
         top_n: Number of top features to show
         title: Plot title
 
     Returns:
-        Plotly Figure object
+        Plotly Figure object with 1x3 subplots
     """
-    plot_df = importance_df.head(top_n).copy()
+    if qq_data is None:
+        qq_data = pd.Series(np.asarray(y_true, dtype=np.float64) - np.asarray(y_pred, dtype=np.float64))
 
-    fig = px.bar(
-        plot_df,
-        x='Importance_%',
-        y='Feature',
-        orientation='h',
-        title=title,
-        color='Importance_%',
-        color_continuous_scale='Blues',
-        text='Importance_%'
+    plot_df = importance_df.nlargest(top_n, 'Importance_%', keep='first')
+
+    fig = make_subplots(
+        rows=1, cols=3,
+        subplot_titles=("Residual Plot", "Q-Q Plot", "Feature Importance"),
+        horizontal_spacing=0.08
     )
 
-    fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+    for trace in _build_residual_traces(y_true, y_pred):
+        fig.add_trace(trace, row=1, col=1)
+    fig.add_hline(y=0, line_dash="dash", line_color="red", row=1, col=1)
+
+    for trace in _build_qq_traces(qq_data):
+        fig.add_trace(trace, row=1, col=2)
+
+    for trace in _build_importance_traces(plot_df['Feature'].tolist(), plot_df['Importance_%'].to_numpy()):
+        fig.add_trace(trace, row=1, col=3)
+
+    fig.update_xaxes(title_text="Predicted Values", row=1, col=1)
+    fig.update_yaxes(title_text="Residuals", row=1, col=1)
+    fig.update_xaxes(title_text="Theoretical Quantiles", row=1, col=2)
+    fig.update_yaxes(title_text="Sample Quantiles", row=1, col=2)
+    fig.update_xaxes(title_text="Importance_%", row=1, col=3)
+    fig.update_yaxes(categoryorder='total ascending', row=1, col=3)
+
     fig.update_layout(
-        height=max(400, top_n * 25),
-        yaxis={'categoryorder': 'total ascending'},
-        showlegend=False
+        title=title,
+        coloraxis=dict(colorscale='Blues', showscale=False),
+        showlegend=False,
+        height=max(400, top_n * 25)
     )
 
     return fig
+
+
+# ============================================
+# PRE-SERIALIZED FIGURES
+# ============================================
+
+# Serialized figures (JSON strings), LRU by builder name + input fingerprint
+_FIGURE_JSON_CACHE_SIZE = 32
+_FIGURE_JSON_CACHE = OrderedDict()
+_FIGURE_JSON_CACHE_LOCK = threading.Lock()
+
+
+def _array_digest(*arrays) -> bytes:
+    """Content hash of numeric inputs as part of a figure cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        values = np.ascontiguousarray(np.asarray(array, dtype=np.float64))
+        digest.update(str(values.shape).encode())
+        digest.update(values.tobytes())
+    return digest.digest()
+
+
+def _cached_figure_json(key: Tuple, build) -> str:
+    """
+    Serialize the figure returned by build() once per key
+
+    Args:
+        key: Hashable cache key (builder name and input fingerprint)
+        build: Callable returning the go.Figure to serialize
+
+    Returns:
+        Figure JSON as produced by plotly.io.to_json (orjson engine if installed)
+    """
+    with _FIGURE_JSON_CACHE_LOCK:
+        fig_json = _FIGURE_JSON_CACHE.get(key)
+        if fig_json is not None:
+            _FIGURE_JSON_CACHE.move_to_end(key)
+            return fig_json
+
+    # Figures from these builders are valid by construction
+    fig_json = pio.to_json(build(), validate=False)
+    with _FIGURE_JSON_CACHE_LOCK:
+        _FIGURE_JSON_CACHE[key] = fig_json
+        if len(_FIGURE_JSON_CACHE) > _FIGURE_JSON_CACHE_SIZE:
+            _FIGURE_JSON_CACHE.popitem(last=False)
+    return fig_json
+
+
+def create_feature_importance_plot_json(
+    importance_df: pd.DataFrame,
+    top_n: int = 15,
+    title: str = "Feature Importance"
+) -> str:
+    """
+    Feature importance chart as pre-serialized JSON (see create_feature_importance_plot)
+
+    Args:
+        importance_df: DataFrame with 'Feature' and 'Importance_%' columns (any order)
+        top_n: Number of top features to show
+        title: Plot title
+
+    Returns:
+        Figure JSON string, cached for identical inputs
+    """
+    plot_df = importance_df.nlargest(top_n, 'Importance_%', keep='first')
+    key = (
+        'feature_importance',
+        tuple(plot_df['Feature'].tolist()),
+        tuple(plot_df['Importance_%'].tolist()),
+        top_n,
+        title
+    )
+    return _cached_figure_json(
+        key, lambda: create_feature_importance_plot(importance_df, top_n, title)
+    )
+
+
+def create_regression_residual_plot_json(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    title: str = "Residual Plot"
+) -> str:
+    """
+    Residual plot as pre-serialized JSON (see create_regression_residual_plot)
+
+    Args:
+        y_true: True values
+        y_pred: Predicted values
+        title: Plot title
+
+    Returns:
+        Figure JSON string, cached for identical inputs
+    """
+    key = ('residual', _array_digest(y_true, y_pred), title)
+    return _cached_figure_json(
+        key, lambda: create_regression_residual_plot(y_true, y_pred, title)
+    )
+
+
+def create_qq_plot_json(
+    data: pd.Series,
+    title: str = "Q-Q Plot"
+) -> str:
+    """
+    Q-Q plot as pre-serialized JSON (see create_qq_plot)
+
+    Args:
+        data: Data series
+        title: Plot title
+
+    Returns:
+        Figure JSON string, cached for identical inputs
+    """
+    key = ('qq', _array_digest(data), title)
+    return _cached_figure_json(key, lambda: create_qq_plot(data, title))